@@ -47,9 +47,13 @@ INSTALLED_APPS = [
     'apps.tasks.apps.TasksConfig',
     'apps.projects.apps.ProjectsConfig',
     'apps.users.apps.UsersConfig',
+    'apps.search.apps.SearchConfig',
+    'apps.jobs.apps.JobsConfig',
+    'apps.benchmarks.apps.BenchmarksConfig',
 ]
 
 MIDDLEWARE = [
+    'apps.utils.instrumentation.InstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -61,6 +65,10 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'agile_projects.urls'
 
+# Route the list and download endpoints to their async views; turn it on
+# when serving agile_projects.asgi, under WSGI every call needs a loop.
+ASYNC_VIEWS = env.bool('ASYNC_VIEWS', False)
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -83,10 +91,34 @@ WSGI_APPLICATION = 'agile_projects.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
+# DB_POOL_SIZE > 0 switches to the pooled backends in apps.utils.db_backends:
+# up to DB_POOL_SIZE idle connections are kept per process,
+# DB_POOL_MAX_OVERFLOW more may be opened under load and a request waits
+# DB_POOL_TIMEOUT seconds for a free one. Connections are reopened after
+# DB_POOL_RECYCLE seconds.
+DB_POOL = {
+    'SIZE': env.int('DB_POOL_SIZE', 0),
+    'MAX_OVERFLOW': env.int('DB_POOL_MAX_OVERFLOW', 10),
+    'TIMEOUT': env.float('DB_POOL_TIMEOUT', 30),
+    'RECYCLE': env.int('DB_POOL_RECYCLE', 3600),
+}
+# Seconds a thread keeps its connection between requests; with the pool it
+# defaults to 0, which hands the connection back after every request. ASGI
+# servers run views in short-lived threads, so use the pool there.
+DB_CONN_MAX_AGE = env.int('DB_CONN_MAX_AGE', 0 if DB_POOL['SIZE'] else 60)
+DB_CONN_HEALTH_CHECKS = env.bool('DB_CONN_HEALTH_CHECKS', True)
+
+
+def database_engine(vendor: str) -> str:
+    if DB_POOL['SIZE']:
+        return 'apps.utils.db_backends.{}'.format(vendor)
+    return 'django.db.backends.{}'.format(vendor)
+
+
 if env.bool('MYSQL'):
     DATABASES = {
         'default': {
-            'ENGINE': 'django.db.backends.mysql',
+            'ENGINE': database_engine('mysql'),
             'NAME': env.str('DB_NAME'),
             'USER': env.str('DB_USER'),
             'PASSWORD': env.str('DB_PASSWORD'),
@@ -97,13 +129,47 @@ if env.bool('MYSQL'):
 else:
     DATABASES = {
         'default': {
-            'ENGINE': 'django.db.backends.sqlite3',
+            'ENGINE': database_engine('sqlite3'),
             'NAME': BASE_DIR / 'db.sqlite3',
         }
     }
+DATABASES['default'].update(
+    CONN_MAX_AGE=DB_CONN_MAX_AGE,
+    CONN_HEALTH_CHECKS=DB_CONN_HEALTH_CHECKS,
+    POOL=DB_POOL,
+)
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+
+# Seconds a cached list response lives; model signals invalidate it earlier.
+RESPONSE_CACHE_TIMEOUT = env.int('RESPONSE_CACHE_TIMEOUT', 300)
 
 AUTH_USER_MODEL = 'users.User'
 
+# Users resolved from API tokens are cached per process for AUTH_CACHE_TTL
+# seconds, AUTH_CACHE_SIZE tokens at most.
+AUTH_CACHE_SIZE = env.int('AUTH_CACHE_SIZE', 1024)
+AUTH_CACHE_TTL = env.int('AUTH_CACHE_TTL', 60)
+
+REST_FRAMEWORK = {
+    # Session first: without credentials the API keeps answering 403.
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'rest_framework.authentication.SessionAuthentication',
+        'apps.users.authentication.CachedTokenAuthentication',
+        'rest_framework.authentication.BasicAuthentication',
+    ],
+    # Same JSON as DRF's renderer, encoded by orjson when it is installed.
+    'DEFAULT_RENDERER_CLASSES': [
+        'apps.utils.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -122,6 +188,18 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# The PBKDF2 hasher takes PASSWORD_HASH_ITERATIONS iterations when it is
+# set, e.g. fewer on staging. Bulk user imports hash passwords in
+# PASSWORD_HASH_PROCESSES processes, one per CPU by default.
+PASSWORD_HASHERS = [
+    'apps.users.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+PASSWORD_HASH_ITERATIONS = env.int('PASSWORD_HASH_ITERATIONS', None)
+PASSWORD_HASH_PROCESSES = env.int('PASSWORD_HASH_PROCESSES', None)
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.0/topics/i18n/
@@ -140,6 +218,51 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Project file downloads
+# '' streams files from Django, 'x-sendfile' (Apache, lighttpd) or
+# 'x-accel-redirect' (nginx) let the front proxy send the bytes.
+FILE_DOWNLOAD_OFFLOAD = env.str('FILE_DOWNLOAD_OFFLOAD', '')
+FILE_DOWNLOAD_ACCEL_PREFIX = env.str(
+    'FILE_DOWNLOAD_ACCEL_PREFIX', '/protected/'
+)
+
+# Request instrumentation
+# Share of requests profiled (0 disables it); a query repeated
+# INSTRUMENTATION_DUPLICATE_QUERIES times in one request is logged as an N+1.
+INSTRUMENTATION_SAMPLE_RATE = env.float('INSTRUMENTATION_SAMPLE_RATE', 0.01)
+INSTRUMENTATION_DUPLICATE_QUERIES = env.int(
+    'INSTRUMENTATION_DUPLICATE_QUERIES', 5
+)
+# Bearer token the /metrics/ scraper must send; without one only staff
+# users can read the metrics.
+METRICS_TOKEN = env.str('METRICS_TOKEN', '')
+
+# Background jobs (manage.py runworker)
+# Seconds before a running job counts as abandoned and is queued again, and
+# the delay before the first retry, doubled on every further attempt.
+JOB_TIMEOUT = env.int('JOB_TIMEOUT', 600)
+JOB_RETRY_DELAY = env.int('JOB_RETRY_DELAY', 30)
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'apps.utils.instrumentation': {
+            'handlers': ['console'],
+            'level': env.str('INSTRUMENTATION_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+        'apps.jobs': {
+            'handlers': ['console'],
+            'level': env.str('JOBS_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+import json
+from contextlib import nullcontext
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.benchmarks.utils.runner import (
+    BenchmarkRunner,
+    ClientTransport,
+    HTTPTransport,
+    build_report,
+    compare_reports,
+    wsgi_server,
+)
+from apps.benchmarks.utils.scenarios import (
+    SCENARIOS,
+    build_context,
+    get_runner_user,
+)
+from apps.benchmarks.utils.seed import PREFIX, dataset_counts
+from apps.projects.models import Project
+
+MODES = ("client", "wsgi", "url")
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures latency percentiles, queries per request and peak memory "
+        "of every API route and writes them to a JSON report."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--mode",
+            choices=MODES,
+            default="client",
+            help=(
+                "client: in-process test client; wsgi: a local WSGI server; "
+                "url: an already running server, e.g. an ASGI one."
+            ),
+        )
+        parser.add_argument("--url", help="Base URL for --mode url.")
+        parser.add_argument(
+            "--host",
+            default="localhost",
+            help="Host header to send, it must be in ALLOWED_HOSTS.",
+        )
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument(
+            "--cold",
+            action="store_true",
+            help="Clear the response cache before every request.",
+        )
+        parser.add_argument(
+            "--only", nargs="+", metavar="SCENARIO", default=()
+        )
+        parser.add_argument("--output", default="benchmark.json")
+        parser.add_argument(
+            "--compare",
+            metavar="BASELINE",
+            help="A previous report to check for regressions.",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=20.0,
+            help="Allowed p95 growth against the baseline, in percent.",
+        )
+
+    def handle(self, *args, **options):
+        if not Project.objects.filter(name__startswith=PREFIX).exists():
+            raise CommandError("Run seed_benchmark_data first.")
+        if options["mode"] == "url" and not options["url"]:
+            raise CommandError("--mode url needs --url.")
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be positive.")
+
+        scenarios = [
+            scenario
+            for scenario in SCENARIOS
+            if not options["only"] or scenario.name in options["only"]
+        ]
+        user = get_runner_user()
+        server = wsgi_server() if options["mode"] == "wsgi" else nullcontext()
+        with server as served:
+            if options["mode"] == "client":
+                transport = ClientTransport(user, options["host"])
+            elif options["mode"] == "wsgi":
+                base_url, counter = served
+                transport = HTTPTransport(
+                    base_url, user, counter, options["host"]
+                )
+            else:
+                transport = HTTPTransport(
+                    options["url"], user, host=options["host"]
+                )
+
+            runner = BenchmarkRunner(
+                transport,
+                build_context(),
+                iterations=options["iterations"],
+                warmup=options["warmup"],
+                cold=options["cold"],
+            )
+            results = {}
+            for scenario in scenarios:
+                results[scenario.name] = runner.run_scenario(scenario)
+                self.write_result(scenario.name, results[scenario.name])
+
+        report = build_report(
+            results,
+            dataset_counts(),
+            mode=options["mode"],
+            iterations=options["iterations"],
+            cold=options["cold"],
+        )
+        with open(options["output"], "w") as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+        self.stdout.write("Report written to {}".format(options["output"]))
+
+        if options["compare"]:
+            self.compare(options["compare"], report, options["threshold"])
+
+    def write_result(self, name: str, result: dict) -> None:
+        if "skipped" in result:
+            self.stdout.write("{:<24} skipped".format(name))
+            return
+        self.stdout.write(
+            "{:<24} {:>4} p50 {:>9.2f}ms p95 {:>9.2f}ms p99 {:>9.2f}ms "
+            "queries {:>4} memory {}kb".format(
+                name,
+                result["status"],
+                result["p50_ms"],
+                result["p95_ms"],
+                result["p99_ms"],
+                "-" if result["queries"] is None else result["queries"],
+                (
+                    "-"
+                    if result["peak_memory_kb"] is None
+                    else result["peak_memory_kb"]
+                ),
+            )
+        )
+
+    def compare(self, baseline_path: str, report: dict, threshold: float):
+        with open(baseline_path) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare_reports(baseline, report, threshold)
+        for name, metric, before, after in regressions:
+            self.stderr.write(
+                "{}: {} {} -> {}".format(name, metric, before, after)
+            )
+        if regressions:
+            raise CommandError(
+                "{} regressions against {}".format(
+                    len(regressions), baseline_path
+                )
+            )
+        self.stdout.write("No regressions against {}".format(baseline_path))
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.benchmarks.utils.connections import compare_connections
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the latency of a tag lookup per request with a new "
+        "connection, a persistent one and a pooled one, on a SQLite file."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=500)
+        parser.add_argument(
+            "--connect-delay",
+            type=float,
+            default=0.0,
+            help=(
+                "Milliseconds added to every new connection, e.g. the "
+                "round trips of a MySQL handshake."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be positive.")
+        results = compare_connections(
+            options["iterations"], options["connect_delay"] / 1000
+        )
+        self.stdout.write(json.dumps(results, indent=2))
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.benchmarks.utils.runner import build_report
+from apps.benchmarks.utils.scenarios import build_context
+from apps.benchmarks.utils.seed import PREFIX, dataset_counts
+from apps.benchmarks.utils.slow_clients import run_slow_clients
+from apps.projects.models import Project
+
+
+class Command(BaseCommand):
+    help = (
+        "Opens many concurrent slow downloads against a running server, "
+        "e.g. one ASGI worker, and reports how many of them completed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", required=True)
+        parser.add_argument("--host", default="localhost")
+        parser.add_argument("--clients", type=int, default=200)
+        parser.add_argument("--read-size", type=int, default=16 * 1024)
+        parser.add_argument(
+            "--delay",
+            type=float,
+            default=0.01,
+            help="Seconds every client waits between two reads.",
+        )
+        parser.add_argument("--timeout", type=float, default=120)
+        parser.add_argument("--output", default="benchmark_downloads.json")
+
+    def handle(self, *args, **options):
+        if not Project.objects.filter(name__startswith=PREFIX).exists():
+            raise CommandError("Run seed_benchmark_data first.")
+
+        path = "/api/v1/projects/files/download/{}".format(
+            build_context()["file_id"]
+        )
+        result = asyncio.run(
+            run_slow_clients(
+                options["url"],
+                path,
+                options["clients"],
+                host=options["host"],
+                read_size=options["read_size"],
+                delay=options["delay"],
+                timeout=options["timeout"],
+            )
+        )
+        report = build_report(
+            {"slow-downloads": result},
+            dataset_counts(),
+            mode="url",
+            url=options["url"],
+            read_size=options["read_size"],
+            delay=options["delay"],
+        )
+        with open(options["output"], "w") as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+        self.stdout.write(json.dumps(result, indent=2))
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.benchmarks.utils.seed import PREFIX
+from apps.benchmarks.utils.serialization import compare_serialization
+from apps.projects.models import Project
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares rendering list responses through DRF serializers with the "
+        "compiled values() path and checks that the bytes are identical."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Runs per path; the fastest one is reported.",
+        )
+
+    def handle(self, *args, **options):
+        if not Project.objects.filter(name__startswith=PREFIX).exists():
+            raise CommandError("Run seed_benchmark_data first.")
+
+        results = compare_serialization(options["rows"], options["repeat"])
+        self.stdout.write(json.dumps(results, indent=2))
+        if not all(result["identical"] for result in results.values()):
+            raise CommandError("The compiled path rendered different bytes.")
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.benchmarks.utils.validation import compare_validation
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares the per-row cost of the name and choice checks as they "
+        "were written before with the shared precompiled lookups."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Runs per check; the fastest one is reported.",
+        )
+
+    def handle(self, *args, **options):
+        results = compare_validation(options["rows"], options["repeat"])
+        self.stdout.write(json.dumps(results, indent=2))
+        if not all(result["identical"] for result in results.values()):
+            raise CommandError("The precompiled checks disagree.")
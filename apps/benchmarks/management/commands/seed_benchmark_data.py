@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.benchmarks.utils.seed import (
+    DEFAULT_SIZES,
+    PREFIX,
+    clear_dataset,
+    scaled_sizes,
+    seed_dataset,
+)
+from apps.projects.models import Project
+
+
+class Command(BaseCommand):
+    help = "Bulk-inserts the synthetic dataset the benchmarks run against."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            type=float,
+            default=1.0,
+            help="Multiplies the default sizes: {}.".format(
+                ", ".join(
+                    "{} {}".format(size, name)
+                    for name, size in DEFAULT_SIZES.items()
+                )
+            ),
+        )
+        for name in DEFAULT_SIZES:
+            parser.add_argument("--{}".format(name), type=int)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Delete a previously seeded dataset first.",
+        )
+
+    def handle(self, *args, **options):
+        if options["clear"]:
+            clear_dataset()
+        elif Project.objects.filter(name__startswith=PREFIX).exists():
+            raise CommandError(
+                "A benchmark dataset already exists, pass --clear to reseed."
+            )
+
+        sizes = scaled_sizes(
+            options["scale"],
+            **{name: options[name] for name in DEFAULT_SIZES},
+        )
+        start = time.perf_counter()
+        counts = seed_dataset(sizes, seed=options["seed"])
+        self.stdout.write(
+            "Seeded in {:.1f}s, the database now has {}.".format(
+                time.perf_counter() - start,
+                ", ".join(
+                    "{} {}".format(count, name)
+                    for name, count in counts.items()
+                ),
+            )
+        )
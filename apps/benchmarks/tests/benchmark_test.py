@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+
+from django.test import TestCase
+from django.urls import URLResolver, resolve
+
+from apps import router
+from apps.benchmarks.utils.runner import (
+    BenchmarkRunner,
+    ClientTransport,
+    compare_reports,
+    percentile,
+)
+from apps.benchmarks.utils.scenarios import (
+    SCENARIOS,
+    build_context,
+    get_runner_user,
+)
+from apps.benchmarks.utils.connections import compare_connections
+from apps.benchmarks.utils.seed import clear_dataset, seed_dataset
+from apps.benchmarks.utils.serialization import compare_serialization
+from apps.benchmarks.utils.validation import compare_validation
+from apps.projects.models import Project
+from apps.tasks.models import Task
+
+
+class TestBenchmarkSuite(TestCase):
+    sizes = {'projects': 3, 'users': 10, 'tasks': 40, 'files': 6}
+
+    def setUp(self) -> None:
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+        self.counts = seed_dataset(self.sizes)
+
+    def tearDown(self) -> None:
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def test_seed_dataset(self):
+        self.assertEqual(self.counts, self.sizes)
+        self.assertEqual(Task.objects.filter(assignee__isnull=True).count(), 8)
+
+        Task.objects.first().soft_delete()
+        Project.objects.first().soft_delete()
+        clear_dataset()
+        self.assertFalse(Task.all_objects.exists())
+        self.assertFalse(Project.all_objects.exists())
+
+    def test_every_route_has_a_scenario(self):
+        routes = {
+            'api/v1/{}{}'.format(include.pattern, pattern.pattern)
+            for include in router.urlpatterns
+            if isinstance(include, URLResolver)
+            for pattern in include.url_patterns
+        }
+        context = {
+            **build_context(),
+            'upload_id': '00000000-0000-0000-0000-000000000000',
+            'job_id': 0,
+        }
+        covered = {
+            resolve(scenario.get_path(context).split('?')[0]).route
+            for scenario in SCENARIOS
+        }
+        self.assertEqual(routes - covered, set())
+
+    def test_run_scenarios(self):
+        runner = BenchmarkRunner(
+            ClientTransport(get_runner_user(), host='testserver'),
+            build_context(),
+            iterations=3,
+            warmup=0,
+        )
+        scenarios = {scenario.name: scenario for scenario in SCENARIOS}
+        results = runner.run(
+            [
+                scenarios['tasks-list'],
+                scenarios['project-create'],
+                scenarios['task-status-update'],
+            ]
+        )
+
+        listed = results['tasks-list']
+        self.assertEqual(listed['status'], 200)
+        self.assertEqual(listed['iterations'], 3)
+        self.assertLessEqual(listed['p50_ms'], listed['p99_ms'])
+        self.assertIsNotNone(listed['queries'])
+        self.assertGreater(listed['peak_memory_kb'], 0)
+        # Writes are rolled back after every request.
+        self.assertEqual(results['project-create']['status'], 201)
+        self.assertEqual(Project.objects.count(), self.sizes['projects'])
+        self.assertEqual(results['task-status-update']['status'], 200)
+        self.assertFalse(Task.objects.exclude(version=1).exists())
+
+    def test_compare_reports(self):
+        baseline = {
+            'results': {
+                'tasks-list': {'p95_ms': 10.0, 'queries': 3},
+                'task-create': {'skipped': 'writes'},
+            }
+        }
+        current = {
+            'results': {
+                'tasks-list': {'p95_ms': 11.0, 'queries': 4},
+                'task-create': {'p95_ms': 50.0, 'queries': 9},
+            }
+        }
+        self.assertEqual(
+            compare_reports(baseline, current, threshold=20),
+            [('tasks-list', 'queries', 3, 4)],
+        )
+        self.assertEqual(percentile([4, 1, 3, 2], 50), 2)
+        self.assertEqual(percentile([4, 1, 3, 2], 99), 4)
+
+    def test_compare_serialization(self):
+        results = compare_serialization(rows=20, repeat=1)
+
+        self.assertEqual(set(results), {'tasks', 'projects', 'users', 'files'})
+        for name, result in results.items():
+            with self.subTest(name=name):
+                self.assertTrue(result['identical'])
+                self.assertGreater(result['rows'], 0)
+
+    def test_compare_validation(self):
+        results = compare_validation(rows=100, repeat=1)
+
+        self.assertEqual(set(results), {'names', 'choices'})
+        for name, result in results.items():
+            with self.subTest(name=name):
+                self.assertTrue(result['identical'])
+
+    def test_compare_connections(self):
+        results = compare_connections(iterations=5)
+
+        self.assertEqual(results['per-request']['connections_opened'], 5)
+        self.assertEqual(results['persistent']['connections_opened'], 0)
+        self.assertEqual(results['pooled']['connections_opened'], 0)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+import os
+import statistics
+import tempfile
+import time
+
+from django.db import connections
+from django.db.backends.sqlite3.base import DatabaseWrapper
+
+from apps.benchmarks.utils.runner import PERCENTILES, percentile
+from apps.tasks.models import Tag
+from apps.tasks.serializers.tag_serializers import TagSerializer
+from apps.utils.db_pool import PooledDatabaseWrapperMixin, pools
+
+# name: (pooled, CONN_MAX_AGE)
+MODES = {
+    'per-request': (False, 0),
+    'persistent': (False, 60),
+    'pooled': (True, 0),
+}
+
+
+def _wrapper_class(pooled: bool, connect_delay: float, opened: list):
+    class CountingDatabaseWrapper(DatabaseWrapper):
+        def get_new_connection(self, conn_params):
+            opened.append(self.alias)
+            # Stands in for the handshake with a database server.
+            time.sleep(connect_delay)
+            return super().get_new_connection(conn_params)
+
+    if pooled:
+        return type(
+            'PooledDatabaseWrapper',
+            (PooledDatabaseWrapperMixin, CountingDatabaseWrapper),
+            {},
+        )
+    return CountingDatabaseWrapper
+
+
+def _request(wrapper, tag_id: int) -> None:
+    # What Django does around a tag detail request: the request_started
+    # and request_finished handlers close obsolete connections.
+    wrapper.close_if_unusable_or_obsolete()
+    tag = Tag.objects.using(wrapper.alias).get(pk=tag_id)
+    TagSerializer(tag).data
+    wrapper.close_if_unusable_or_obsolete()
+
+
+def compare_connections(
+    iterations: int = 500, connect_delay: float = 0.0
+) -> dict:
+    """
+    Runs ``iterations`` tag lookups against a SQLite file per connection
+    mode and reports their latency and how many connections were opened.
+    """
+    opened = []
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for mode, (pooled, max_age) in MODES.items():
+            alias = 'benchmark-{}'.format(mode)
+            settings_dict = {
+                **connections['default'].settings_dict,
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': os.path.join(directory, 'connections.sqlite3'),
+                'CONN_MAX_AGE': max_age,
+                'CONN_HEALTH_CHECKS': True,
+                'POOL': {'SIZE': 1, 'MAX_OVERFLOW': 0},
+            }
+            wrapper_class = _wrapper_class(pooled, connect_delay, opened)
+            wrapper = wrapper_class(settings_dict, alias)
+            connections[alias] = wrapper
+            try:
+                results[mode] = _run_mode(wrapper, iterations, opened)
+            finally:
+                wrapper.close()
+                del connections[alias]
+                pool = pools.pop(alias, None)
+                if pool is not None:
+                    pool.close_idle()
+    return results
+
+
+def _run_mode(wrapper, iterations: int, opened: list) -> dict:
+    with wrapper.schema_editor() as editor:
+        editor.create_model(Tag)
+    tag = Tag.objects.using(wrapper.alias).create(name='Benchmark')
+    wrapper.close()
+    _request(wrapper, tag.pk)
+
+    opened.clear()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        _request(wrapper, tag.pk)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    connections_opened = len(opened)
+
+    with wrapper.schema_editor() as editor:
+        editor.delete_model(Tag)
+    return {
+        'iterations': iterations,
+        'connections_opened': connections_opened,
+        'mean_ms': round(statistics.fmean(samples), 3),
+        **{
+            'p{}_ms'.format(pct): round(percentile(samples, pct), 3)
+            for pct in PERCENTILES
+        },
+    }
@@ -0,0 +1,328 @@
+# -*- coding: utf-8 -*-
+import http.client
+import json
+import math
+import platform
+import statistics
+import subprocess
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from urllib.parse import urlsplit
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+import django
+from django.conf import settings
+from django.core.wsgi import get_wsgi_application
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.benchmarks.utils.scenarios import Scenario
+from apps.utils.response_cache import get_cache
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(samples: list, pct: int) -> float:
+    # Nearest-rank: always one of the measured values.
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class ClientTransport:
+    """
+    Sends requests through the in-process test client; writes run in a
+    transaction that is rolled back, so the dataset stays the same.
+    """
+
+    can_write = True
+    in_process = True
+
+    def __init__(self, user, host: str = 'localhost'):
+        self.client = Client(raise_request_exception=False, SERVER_NAME=host)
+        self.client.force_login(user)
+        self.queries = None
+
+    @contextmanager
+    def isolate(self, scenario: Scenario):
+        if not scenario.write:
+            yield
+            return
+        with transaction.atomic():
+            yield
+            transaction.set_rollback(True)
+
+    @contextmanager
+    def count_queries(self):
+        with CaptureQueriesContext(connection) as captured:
+            yield
+        self.queries = len(captured)
+
+    def request(self, scenario: Scenario, path: str, data) -> int:
+        headers = {
+            'HTTP_' + name.upper().replace('-', '_'): value
+            for name, value in scenario.headers.items()
+        }
+        if isinstance(data, (dict, list)):
+            data = json.dumps(data)
+        response = self.client.generic(
+            scenario.method,
+            path,
+            data=data or '',
+            content_type=scenario.content_type,
+            **headers,
+        )
+        # Streaming bodies are only produced while they are read; the
+        # client closes the response once they are exhausted.
+        if response.streaming:
+            for _ in response.streaming_content:
+                pass
+        return response.status_code
+
+
+class HTTPTransport:
+    """
+    Sends requests to a running server over HTTP. Only the local WSGI
+    server shares this process, so elsewhere queries aren't counted.
+    """
+
+    can_write = False
+
+    def __init__(
+        self,
+        base_url: str,
+        user,
+        counter: QueryCounter = None,
+        host: str = 'localhost',
+    ):
+        self.base_url = urlsplit(base_url)
+        self.host = host
+        self.counter = counter
+        self.in_process = counter is not None
+        self.queries = None
+        client = Client(SERVER_NAME=host)
+        client.force_login(user)
+        self.cookie = '{}={}'.format(
+            settings.SESSION_COOKIE_NAME,
+            client.cookies[settings.SESSION_COOKIE_NAME].value,
+        )
+
+    def isolate(self, scenario: Scenario):
+        return nullcontext()
+
+    @contextmanager
+    def count_queries(self):
+        if self.counter is None:
+            yield
+            return
+        self.counter.count = 0
+        yield
+        self.queries = self.counter.count
+
+    def request(self, scenario: Scenario, path: str, data) -> int:
+        headers = {
+            **scenario.headers,
+            'Host': self.host,
+            'Cookie': self.cookie,
+        }
+        if data is not None:
+            headers['Content-Type'] = scenario.content_type
+            if isinstance(data, (dict, list)):
+                data = json.dumps(data).encode('utf-8')
+        conn = http.client.HTTPConnection(
+            self.base_url.hostname, self.base_url.port
+        )
+        try:
+            conn.request(
+                scenario.method,
+                self.base_url.path.rstrip('/') + path,
+                body=data,
+                headers=headers,
+            )
+            response = conn.getresponse()
+            response.read()
+            return response.status
+        finally:
+            conn.close()
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def wsgi_server():
+    """
+    Serves the project's WSGI application on a free local port from a
+    background thread and yields its URL and query counter.
+    """
+    counter = QueryCounter()
+    server = make_server(
+        '127.0.0.1', 0, get_wsgi_application(), handler_class=QuietHandler
+    )
+
+    def serve():
+        # ``connection`` is per thread: this wraps the server's own one.
+        with connection.execute_wrapper(counter):
+            server.serve_forever()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    try:
+        yield 'http://127.0.0.1:{}'.format(server.server_port), counter
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+class BenchmarkRunner:
+    def __init__(
+        self,
+        transport,
+        context: dict,
+        iterations: int = 50,
+        warmup: int = 3,
+        cold: bool = False,
+    ):
+        self.transport = transport
+        self.context = context
+        self.iterations = iterations
+        self.warmup = warmup
+        self.cold = cold
+
+    def execute(self, scenario: Scenario) -> tuple[float, int, int | None]:
+        with self.transport.isolate(scenario):
+            context = dict(self.context)
+            if scenario.setup:
+                context.update(scenario.setup(context))
+            path = scenario.get_path(context)
+            data = scenario.get_data(context)
+            if self.cold:
+                get_cache().clear()
+            try:
+                with self.transport.count_queries():
+                    start = time.perf_counter()
+                    status_code = self.transport.request(scenario, path, data)
+                    elapsed = time.perf_counter() - start
+            finally:
+                if scenario.teardown:
+                    scenario.teardown(context)
+        return elapsed * 1000, status_code, self.transport.queries
+
+    def measure_memory(self, scenario: Scenario) -> int:
+        # A separate pass: tracing allocations slows every request down.
+        tracemalloc.start()
+        try:
+            self.execute(scenario)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak
+
+    def run_scenario(self, scenario: Scenario) -> dict:
+        if scenario.write and not self.transport.can_write:
+            return {
+                'method': scenario.method,
+                'skipped': 'writes are only measured in-process',
+            }
+        for _ in range(self.warmup):
+            self.execute(scenario)
+
+        timings, statuses, queries = [], Counter(), []
+        for _ in range(self.iterations):
+            elapsed, status_code, query_count = self.execute(scenario)
+            timings.append(elapsed)
+            statuses[status_code] += 1
+            if query_count is not None:
+                queries.append(query_count)
+
+        result = {
+            'method': scenario.method,
+            'path': scenario.path,
+            'status': statuses.most_common(1)[0][0],
+            'iterations': self.iterations,
+            'mean_ms': round(statistics.fmean(timings), 3),
+            'max_ms': round(max(timings), 3),
+            'queries': statistics.median_low(queries) if queries else None,
+            'peak_memory_kb': None,
+        }
+        for pct in PERCENTILES:
+            result['p{}_ms'.format(pct)] = round(percentile(timings, pct), 3)
+        if self.transport.in_process:
+            result['peak_memory_kb'] = round(
+                self.measure_memory(scenario) / 1024, 1
+            )
+        return result
+
+    def run(self, scenarios: list) -> dict:
+        return {
+            scenario.name: self.run_scenario(scenario)
+            for scenario in scenarios
+        }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(results: dict, dataset: dict, **options) -> dict:
+    return {
+        'meta': {
+            'created_at': timezone.now().isoformat(),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'dataset': dataset,
+            **options,
+        },
+        'results': results,
+    }
+
+
+def compare_reports(baseline: dict, current: dict, threshold: float) -> list:
+    """
+    Lists the scenarios whose p95 grew by more than ``threshold`` percent
+    or which run more queries than in the baseline.
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        before = baseline['results'].get(name)
+        if not before or 'skipped' in before or 'skipped' in result:
+            continue
+        if before['p95_ms'] and (
+            result['p95_ms'] > before['p95_ms'] * (1 + threshold / 100)
+        ):
+            regressions.append(
+                (name, 'p95_ms', before['p95_ms'], result['p95_ms'])
+            )
+        if None not in (before['queries'], result['queries']) and (
+            result['queries'] > before['queries']
+        ):
+            regressions.append(
+                (name, 'queries', before['queries'], result['queries'])
+            )
+    return regressions
@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+import os
+from datetime import timedelta
+from urllib.parse import quote
+
+from django.utils import timezone
+
+from apps.benchmarks.utils.seed import (
+    BLOB_CONTENT,
+    PASSWORD,
+    PREFIX,
+    TAG_NAMES,
+)
+from apps.jobs.models import Job
+from apps.jobs.utils.queue import enqueue
+from apps.projects.models import FileUpload, Project, ProjectFile
+from apps.projects.utils.upload_file_helper import (
+    UPLOAD_PATH,
+    create_upload_path,
+    discard_upload,
+)
+from apps.tasks.models import Tag, Task
+from apps.users.models import User
+
+API = '/api/v1'
+BULK_SIZE = 100
+BULK_USERS_SIZE = 20
+
+
+class Scenario:
+    """
+    One benchmarked request. ``path`` and string bodies are formatted with
+    the context built from the seeded data; ``setup`` may add per-request
+    values such as an upload id, ``teardown`` removes what it left on disk.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        method: str,
+        path: str,
+        data=None,
+        content_type: str = 'application/json',
+        headers: dict | None = None,
+        write: bool = False,
+        setup=None,
+        teardown=None,
+    ):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.data = data
+        self.content_type = content_type
+        self.headers = headers or {}
+        self.write = write
+        self.setup = setup
+        self.teardown = teardown
+
+    def get_path(self, context: dict) -> str:
+        return self.path.format(
+            **{name: quote(str(value)) for name, value in context.items()}
+        )
+
+    def get_data(self, context: dict):
+        if callable(self.data):
+            return self.data(context)
+        return self.data
+
+
+def build_context() -> dict:
+    """
+    Picks the rows the scenarios point at: the busiest project and
+    assignee, so the filters run over the largest slices of the data.
+    """
+    project = Project.objects.filter(name__startswith=PREFIX).first()
+    task = Task.objects.filter(project=project, assignee__isnull=False)
+    task = task.select_related('assignee').first()
+    return {
+        'project_id': project.pk,
+        'project_name': project.name,
+        'task_id': task.pk,
+        'assignee_email': task.assignee.email,
+        'tag_id': Tag.objects.get(name=TAG_NAMES[0]).pk,
+        'file_id': ProjectFile.objects.filter(file_name__startswith=PREFIX)
+        .first()
+        .pk,
+    }
+
+
+def get_runner_user() -> User:
+    user, _ = User.objects.get_or_create(
+        email='{}_runner@example.com'.format(PREFIX),
+        defaults={
+            'username': '{}_runner'.format(PREFIX),
+            'first_name': 'Bench',
+            'last_name': 'Runner',
+            'position': 'QA',
+            'is_staff': True,
+        },
+    )
+    return user
+
+
+def _create_upload(context: dict, received: int = 0) -> dict:
+    upload = FileUpload.objects.create(
+        project_id=context['project_id'],
+        file_name='{}_upload.pdf'.format(PREFIX),
+        size=len(BLOB_CONTENT),
+        received=received,
+    )
+    if received:
+        os.makedirs(UPLOAD_PATH, exist_ok=True)
+        with open(create_upload_path(upload.pk), 'wb') as part:
+            part.write(BLOB_CONTENT)
+    return {'upload_id': upload.pk}
+
+
+def _complete_upload(context: dict) -> dict:
+    return _create_upload(context, received=len(BLOB_CONTENT))
+
+
+def _discard_upload(context: dict) -> None:
+    discard_upload(context['upload_id'])
+    FileUpload.objects.filter(pk=context['upload_id']).delete()
+
+
+def _create_job(context: dict) -> dict:
+    job = enqueue('tasks.bulk_update', {'rows': []})
+    return {'job_id': job.pk}
+
+
+def _delete_job(context: dict) -> None:
+    Job.objects.filter(pk=context['job_id']).delete()
+
+
+def _deadline() -> str:
+    return (timezone.now() + timedelta(days=30)).isoformat()
+
+
+def _task_body(context: dict) -> dict:
+    return {
+        'name': '{} created task'.format(PREFIX),
+        'description': 'Task created by the benchmark to time the endpoint.',
+        'priority': 3,
+        'project': context['project_name'],
+        'tags': [context['tag_id']],
+        'deadline': _deadline(),
+    }
+
+
+def _status_body(context: dict) -> dict:
+    # Always a change: the write is rolled back after each request.
+    current = Task.objects.filter(pk=context['task_id']).values_list(
+        'status', flat=True
+    )[0]
+    return {'status': 'BLOCKED' if current != 'BLOCKED' else 'IN_PROGRESS'}
+
+
+def _bulk_body(context: dict) -> list:
+    return [
+        {
+            'name': '{} bulk task {}'.format(PREFIX, index),
+            'description': 'Task created by the benchmark in a batch of bulk inserts.',
+            'priority': 3,
+            'project': context['project_name'],
+            'assignee': context['assignee_email'],
+            'tags': TAG_NAMES[:2],
+            'deadline': _deadline(),
+        }
+        for index in range(BULK_SIZE)
+    ]
+
+
+def _bulk_users_body(context: dict) -> list:
+    return [
+        {
+            'username': '{}_imported_{}'.format(PREFIX, index),
+            'first_name': 'Bench',
+            'last_name': 'Imported',
+            'email': '{}_imported_{}@example.com'.format(PREFIX, index),
+            'position': 'QA',
+            'password': 'Benchmark-password-{}'.format(index),
+            'project': context['project_name'],
+        }
+        for index in range(BULK_USERS_SIZE)
+    ]
+
+
+def _token_body(context: dict) -> dict:
+    return {'email': context['assignee_email'], 'password': PASSWORD}
+
+
+SCENARIOS = [
+    # Tasks
+    Scenario('tasks-list', 'GET', API + '/tasks/'),
+    Scenario('tasks-list-deep-page', 'GET', API + '/tasks/?page=1000'),
+    Scenario('tasks-list-cursor', 'GET', API + '/tasks/?cursor='),
+    Scenario(
+        'tasks-by-project', 'GET', API + '/tasks/?project={project_name}'
+    ),
+    Scenario(
+        'tasks-by-assignee', 'GET', API + '/tasks/?assignee={assignee_email}'
+    ),
+    Scenario(
+        'tasks-filtered',
+        'GET',
+        API + '/tasks/?project={project_name}&status=NEW,BLOCKED'
+        '&priority_min=3&tags=Backend,Testing',
+    ),
+    Scenario(
+        'tasks-unassigned-tagged',
+        'GET',
+        API + '/tasks/?unassigned=true&tags=Backend,Frontend&tags_match=all',
+    ),
+    Scenario(
+        'tasks-export-csv',
+        'GET',
+        API + '/tasks/export/?project={project_name}',
+    ),
+    Scenario(
+        'tasks-export-ndjson',
+        'GET',
+        API + '/tasks/export/?project={project_name}&export_format=ndjson',
+    ),
+    Scenario('task-detail', 'GET', API + '/tasks/{task_id}/'),
+    Scenario('task-create', 'POST', API + '/tasks/', _task_body, write=True),
+    Scenario(
+        'task-status-update',
+        'PATCH',
+        API + '/tasks/{task_id}/',
+        _status_body,
+        write=True,
+    ),
+    Scenario(
+        'tasks-bulk-create',
+        'POST',
+        API + '/tasks/bulk/',
+        _bulk_body,
+        write=True,
+    ),
+    Scenario('tags-list', 'GET', API + '/tasks/tags/'),
+    Scenario('tag-detail', 'GET', API + '/tasks/tags/{tag_id}'),
+    Scenario(
+        'tag-create',
+        'POST',
+        API + '/tasks/tags/',
+        {'name': 'Benchmark'},
+        write=True,
+    ),
+    # Projects
+    Scenario('projects-list', 'GET', API + '/projects/'),
+    Scenario(
+        'projects-by-date',
+        'GET',
+        API + '/projects/?date_from=2000-01-01&date_to=2100-01-01',
+    ),
+    Scenario('project-detail', 'GET', API + '/projects/{project_id}/'),
+    Scenario('project-stats', 'GET', API + '/projects/{project_id}/stats/'),
+    Scenario(
+        'project-create',
+        'POST',
+        API + '/projects/',
+        {
+            'name': '{} created project'.format(PREFIX),
+            'description': 'Project created by the benchmark to time the endpoint.',
+        },
+        write=True,
+    ),
+    Scenario('project-files', 'GET', API + '/projects/files/'),
+    Scenario(
+        'file-download', 'GET', API + '/projects/files/download/{file_id}'
+    ),
+    Scenario(
+        'file-download-range',
+        'GET',
+        API + '/projects/files/download/{file_id}',
+        headers={'Range': 'bytes=0-1023'},
+    ),
+    Scenario(
+        'file-upload-create',
+        'POST',
+        API + '/projects/files/uploads/',
+        lambda context: {
+            'project_id': context['project_id'],
+            'file_name': '{}_upload.pdf'.format(PREFIX),
+            'size': len(BLOB_CONTENT),
+        },
+        write=True,
+    ),
+    Scenario(
+        'file-upload-status',
+        'GET',
+        API + '/projects/files/uploads/{upload_id}/',
+        setup=_create_upload,
+        teardown=_discard_upload,
+    ),
+    Scenario(
+        'file-upload-chunk',
+        'PATCH',
+        API + '/projects/files/uploads/{upload_id}/',
+        BLOB_CONTENT,
+        content_type='application/offset+octet-stream',
+        headers={'Upload-Offset': '0'},
+        write=True,
+        setup=_create_upload,
+        teardown=_discard_upload,
+    ),
+    Scenario(
+        'file-upload-finalize',
+        'POST',
+        API + '/projects/files/uploads/{upload_id}/finalize/',
+        write=True,
+        setup=_complete_upload,
+        teardown=_discard_upload,
+    ),
+    # Users
+    Scenario('users-list', 'GET', API + '/users/'),
+    Scenario(
+        'users-by-project', 'GET', API + '/users/?project_name={project_name}'
+    ),
+    Scenario(
+        'user-register',
+        'POST',
+        API + '/users/register/',
+        {
+            'username': '{}_registered'.format(PREFIX),
+            'first_name': 'Bench',
+            'last_name': 'Registered',
+            'email': '{}_registered@example.com'.format(PREFIX),
+            'position': 'QA',
+            'password': 'Benchmark-password-1',
+            're_password': 'Benchmark-password-1',
+        },
+        write=True,
+    ),
+    Scenario(
+        'users-bulk-create',
+        'POST',
+        API + '/users/bulk/',
+        _bulk_users_body,
+        write=True,
+    ),
+    Scenario(
+        'user-token', 'POST', API + '/users/token/', _token_body, write=True
+    ),
+    # Search
+    Scenario('search-prefix', 'GET', API + '/search/?q=synth'),
+    Scenario('search-tasks', 'GET', API + '/search/?q=bench+task&type=task'),
+    # Jobs
+    Scenario(
+        'job-detail',
+        'GET',
+        API + '/jobs/{job_id}/',
+        setup=_create_job,
+        teardown=_delete_job,
+    ),
+]
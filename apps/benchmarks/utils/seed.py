@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+import random
+from datetime import timedelta
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.projects.models import FileBlob, Project, ProjectFile
+from apps.projects.utils.upload_file_helper import save_file
+from apps.search.utils.search_index import rebuild_index
+from apps.tasks.choices.priorities import Priorities
+from apps.tasks.choices.statuses import Statuses
+from apps.tasks.models import Tag, Task
+from apps.tasks.utils.task_stats import rebuild_task_stats
+from apps.users.choices.positions import Positions
+from apps.users.models import User
+from apps.utils.response_cache import invalidate
+
+DEFAULT_SIZES = {
+    'projects': 1_000,
+    'users': 50_000,
+    'tasks': 500_000,
+    'files': 100_000,
+}
+BATCH_SIZE = 5_000
+PREFIX = 'bench'
+PASSWORD = 'benchmark-password'
+TAG_NAMES = [
+    'Backend',
+    'Frontend',
+    'Database',
+    'Testing',
+    'Design',
+    'Deploy',
+    'Security',
+    'Docs',
+]
+BLOB_CONTENT = b'%PDF-1.7\n' + b'benchmark file\n' * 4096
+
+
+def scaled_sizes(scale: float = 1.0, **overrides) -> dict:
+    sizes = {
+        name: max(int(size * scale), 1) for name, size in DEFAULT_SIZES.items()
+    }
+    sizes.update(
+        {name: size for name, size in overrides.items() if size is not None}
+    )
+    return sizes
+
+
+def _batches(objects, size: int = BATCH_SIZE):
+    iterator = iter(objects)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _insert(model, objects) -> None:
+    # Generators keep at most one batch of instances in memory.
+    for batch in _batches(objects):
+        model.objects.bulk_create(batch, batch_size=BATCH_SIZE)
+
+
+def _ids(queryset) -> list[int]:
+    # Read ids back: MySQL can't return them from a multi-row INSERT.
+    return list(queryset.order_by('pk').values_list('pk', flat=True))
+
+
+def clear_dataset() -> None:
+    # all_objects: rows a scenario soft deleted are part of the dataset too.
+    with transaction.atomic():
+        Task.all_objects.filter(name__startswith=PREFIX).delete()
+        files = ProjectFile.objects.filter(file_name__startswith=PREFIX)
+        Project.files.through.objects.filter(projectfile__in=files).delete()
+        files.delete()
+        User.all_objects.filter(username__startswith=PREFIX).delete()
+        Project.all_objects.filter(name__startswith=PREFIX).delete()
+
+
+def seed_dataset(sizes: dict, seed: int = 0) -> dict:
+    """
+    Bulk-inserts a synthetic dataset of ``sizes`` rows; every row it
+    creates is prefixed with ``PREFIX`` so ``clear_dataset`` can find it.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+
+    with transaction.atomic():
+        _insert(
+            Project,
+            (
+                Project(
+                    name='{} project {}'.format(PREFIX, index),
+                    description='Synthetic project for the benchmarks.',
+                )
+                for index in range(sizes['projects'])
+            ),
+        )
+        project_ids = _ids(Project.objects.filter(name__startswith=PREFIX))
+
+        for name in TAG_NAMES:
+            Tag.objects.get_or_create(name=name)
+        tag_ids = list(
+            Tag.objects.filter(name__in=TAG_NAMES).values_list('pk', flat=True)
+        )
+
+        # Hashing is the slow part of creating users; one hash serves all.
+        password = make_password(PASSWORD)
+        positions = [position.name for position in Positions]
+        _insert(
+            User,
+            (
+                User(
+                    username='{}_user_{}'.format(PREFIX, index),
+                    email='{}_user_{}@example.com'.format(PREFIX, index),
+                    first_name='Bench',
+                    last_name='User',
+                    password=password,
+                    position=positions[index % len(positions)],
+                    project_id=project_ids[index % len(project_ids)],
+                )
+                for index in range(sizes['users'])
+            ),
+        )
+        user_ids = _ids(User.objects.filter(username__startswith=PREFIX))
+
+        statuses = [item.name for item in Statuses]
+        priorities = [item[0] for item in Priorities.choices()]
+        _insert(
+            Task,
+            (
+                Task(
+                    name='{} task {}'.format(PREFIX, index),
+                    description='Synthetic task for the benchmarks. ' * 3,
+                    status=rng.choice(statuses),
+                    priority=rng.choice(priorities),
+                    project_id=project_ids[index % len(project_ids)],
+                    # Every fifth task stays unassigned.
+                    assignee_id=(
+                        None if index % 5 == 0 else rng.choice(user_ids)
+                    ),
+                    deadline=now
+                    + timedelta(minutes=rng.randint(-100_000, 100_000)),
+                )
+                for index in range(sizes['tasks'])
+            ),
+        )
+        Task.objects.filter(
+            name__startswith=PREFIX, status=Statuses.CLOSED.name
+        ).update(closed_at=F('updated_at'))
+        task_ids = _ids(Task.objects.filter(name__startswith=PREFIX))
+        TaskTag = Task.tags.through
+        _insert(
+            TaskTag,
+            (
+                TaskTag(task_id=task_id, tag_id=tag_id)
+                for task_id in task_ids
+                for tag_id in rng.sample(tag_ids, rng.randint(0, 2))
+            ),
+        )
+
+        # Content-addressed storage: all the files share one blob.
+        digest, file_path = save_file(
+            ContentFile(BLOB_CONTENT, name='benchmark.pdf')
+        )
+        FileBlob.objects.get_or_create(
+            digest=digest,
+            defaults={'file_path': file_path, 'size': len(BLOB_CONTENT)},
+        )
+        _insert(
+            ProjectFile,
+            (
+                ProjectFile(
+                    file_name='{}_file_{}.pdf'.format(PREFIX, index),
+                    file_path=file_path,
+                    blob_id=digest,
+                )
+                for index in range(sizes['files'])
+            ),
+        )
+        file_ids = _ids(
+            ProjectFile.objects.filter(file_name__startswith=PREFIX)
+        )
+        ProjectFiles = Project.files.through
+        _insert(
+            ProjectFiles,
+            (
+                ProjectFiles(
+                    project_id=project_ids[index % len(project_ids)],
+                    projectfile_id=file_id,
+                )
+                for index, file_id in enumerate(file_ids)
+            ),
+        )
+        Project.objects.filter(name__startswith=PREFIX).refresh_files_count()
+
+    # bulk_create sends no post_save signals.
+    rebuild_index()
+    rebuild_task_stats()
+    invalidate(
+        Project._meta.label_lower,
+        ProjectFile._meta.label_lower,
+        Task._meta.label_lower,
+        Tag._meta.label_lower,
+        User._meta.label_lower,
+    )
+    return dataset_counts()
+
+
+def dataset_counts() -> dict:
+    return {
+        'projects': Project.objects.count(),
+        'users': User.objects.count(),
+        'tasks': Task.objects.count(),
+        'files': ProjectFile.objects.count(),
+    }
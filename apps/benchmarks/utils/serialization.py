@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+import time
+
+from rest_framework.renderers import JSONRenderer
+
+from apps.projects.serializers.project_file_serializers import (
+    AllProjectFileSerializer,
+)
+from apps.projects.serializers.project_serializers import (
+    AllProjectsSerializer,
+)
+from apps.tasks.serializers.tasks_serializers import AllTasksSerializer
+from apps.users.serializers import UserListSerializer
+from apps.utils.renderers import FastJSONRenderer
+
+SERIALIZERS = {
+    'tasks': AllTasksSerializer,
+    'projects': AllProjectsSerializer,
+    'users': UserListSerializer,
+    'files': AllProjectFileSerializer,
+}
+
+
+def render_instances(serializer_class, queryset) -> bytes:
+    # What the list views did before: model instances, DRF serializer.
+    instances = serializer_class.optimize_queryset(queryset)
+    data = serializer_class(instances, many=True).data
+    return JSONRenderer().render(data)
+
+
+def render_values(serializer_class, queryset) -> bytes:
+    rows = serializer_class.values_queryset(queryset)
+    return FastJSONRenderer().render(serializer_class.represent_values(rows))
+
+
+def _best_of(func, repeat: int) -> tuple[float, bytes]:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, body
+
+
+def compare_serialization(rows: int = 10_000, repeat: int = 3) -> dict:
+    """
+    Times the first ``rows`` rows of every list serializer through model
+    instances and DRF, then through ``values()`` rows and the compiled
+    row function; both include the queries and rendering.
+    """
+    results = {}
+    for name, serializer_class in SERIALIZERS.items():
+        model = serializer_class.Meta.model
+        queryset = model._default_manager.order_by('pk')[:rows]
+        drf_seconds, drf_body = _best_of(
+            lambda: render_instances(serializer_class, queryset), repeat
+        )
+        fast_seconds, fast_body = _best_of(
+            lambda: render_values(serializer_class, queryset), repeat
+        )
+        results[name] = {
+            'rows': queryset.count(),
+            'drf_ms': round(drf_seconds * 1000, 2),
+            'compiled_ms': round(fast_seconds * 1000, 2),
+            'speedup': round(drf_seconds / max(fast_seconds, 1e-9), 2),
+            'identical': drf_body == fast_body,
+        }
+    return results
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+from apps.benchmarks.utils.runner import PERCENTILES, percentile
+
+
+async def slow_download(
+    base_url: str, path: str, host: str, read_size: int, delay: float
+) -> dict:
+    """
+    Downloads ``path`` like a client on a slow link: ``read_size`` bytes
+    at a time with a pause between reads, so the server has to hold the
+    response open for the whole transfer.
+    """
+    url = urlsplit(base_url)
+    start = time.perf_counter()
+    reader, writer = await asyncio.open_connection(url.hostname, url.port)
+    try:
+        writer.write(
+            'GET {}{} HTTP/1.1\r\nHost: {}\r\nConnection: close\r\n\r\n'.format(
+                url.path.rstrip('/'), path, host
+            ).encode(
+                'ascii'
+            )
+        )
+        await writer.drain()
+        status_line = await reader.readline()
+        first_byte = time.perf_counter() - start
+        received = len(status_line)
+        while chunk := await reader.read(read_size):
+            received += len(chunk)
+            await asyncio.sleep(delay)
+    finally:
+        writer.close()
+    return {
+        'status': int(status_line.split()[1]) if status_line else None,
+        'first_byte': first_byte,
+        'duration': time.perf_counter() - start,
+        'bytes': received,
+    }
+
+
+async def run_slow_clients(
+    base_url: str,
+    path: str,
+    clients: int,
+    host: str = 'localhost',
+    read_size: int = 16 * 1024,
+    delay: float = 0.01,
+    timeout: float = 120,
+) -> dict:
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(
+                slow_download(base_url, path, host, read_size, delay), timeout
+            )
+            for _ in range(clients)
+        ),
+        return_exceptions=True,
+    )
+    finished = [
+        result
+        for result in results
+        if isinstance(result, dict) and result['status'] == 200
+    ]
+    report = {
+        'clients': clients,
+        'completed': len(finished),
+        'failed': clients - len(finished),
+        'wall_seconds': round(time.perf_counter() - start, 3),
+    }
+    for name in ('first_byte', 'duration'):
+        samples = [result[name] * 1000 for result in finished]
+        for pct in PERCENTILES:
+            report['{}_p{}_ms'.format(name, pct)] = (
+                round(percentile(samples, pct), 3) if samples else None
+            )
+    return report
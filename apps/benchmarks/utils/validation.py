@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import re
+import time
+
+from apps.tasks.choices.priorities import Priorities
+from apps.tasks.choices.statuses import Statuses
+from apps.utils.validation import PRIORITIES, STATUSES, name_errors
+
+
+def build_rows(rows: int) -> list[dict]:
+    # Every seventh row has an invalid name and every eleventh an unknown
+    # priority, so both outcomes of every check are timed.
+    statuses = [status.name for status in Statuses]
+    return [
+        {
+            'username': (
+                'user {}'.format(index)
+                if index % 7 == 0
+                else 'user_{}'.format(index)
+            ),
+            'first_name': 'Bench',
+            'last_name': 'User',
+            'status': statuses[index % len(statuses)],
+            'priority': 9 if index % 11 == 0 else index % 5 + 1,
+        }
+        for index in range(rows)
+    ]
+
+
+def legacy_names(row: dict) -> bool:
+    # RegisterUserSerializer.validate before the patterns were compiled.
+    return bool(
+        re.match('^[A-Za-z0-9_.]+$', row['username'])
+        and re.match('^[A-Za-z]+$', row['first_name'])
+        and re.match('^[A-Za-z]+$', row['last_name'])
+    )
+
+
+def compiled_names(row: dict) -> bool:
+    return not name_errors(row)
+
+
+def legacy_choices(row: dict) -> bool:
+    # The choices() bodies the serializers rebuilt on every call.
+    priorities = [(attr.value[0], attr.value[1]) for attr in Priorities]
+    statuses = [(attr.name, attr.value) for attr in Statuses]
+    return row['priority'] in [item[0] for item in priorities] and row[
+        'status'
+    ] in [item[0] for item in statuses]
+
+
+def compiled_choices(row: dict) -> bool:
+    return row['priority'] in PRIORITIES and row['status'] in STATUSES
+
+
+CHECKS = {
+    'names': (legacy_names, compiled_names),
+    'choices': (legacy_choices, compiled_choices),
+}
+
+
+def _best_of(check, rows: list, repeat: int) -> tuple[float, list]:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        verdicts = [check(row) for row in rows]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, verdicts
+
+
+def compare_validation(rows: int = 100_000, repeat: int = 3) -> dict:
+    """
+    Times every check over ``rows`` synthetic rows, as written before and
+    with the shared precompiled lookups, and checks they agree per row.
+    """
+    data = build_rows(rows)
+    results = {}
+    for name, (legacy, compiled) in CHECKS.items():
+        legacy_seconds, legacy_verdicts = _best_of(legacy, data, repeat)
+        compiled_seconds, compiled_verdicts = _best_of(compiled, data, repeat)
+        results[name] = {
+            'rows': rows,
+            'legacy_us_per_row': round(legacy_seconds / rows * 1e6, 3),
+            'compiled_us_per_row': round(compiled_seconds / rows * 1e6, 3),
+            'speedup': round(legacy_seconds / max(compiled_seconds, 1e-9), 2),
+            'identical': legacy_verdicts == compiled_verdicts,
+        }
+    return results
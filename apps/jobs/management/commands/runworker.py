@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import multiprocessing
+import os
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.jobs.models import Job
+from apps.jobs.utils.process import setup_process
+from apps.jobs.utils.queue import claim, requeue_stale, run_job, run_job_by_id
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs queued background jobs in a pool of worker processes, polling "
+        "the job table; no broker needed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Pool size; 0 runs the jobs in this process.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds between polls while the queue is empty.",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once no job is due instead of waiting for more.",
+        )
+
+    def handle(self, *args, **options):
+        self.worker = "{}:{}".format(socket.gethostname(), os.getpid())
+        self.interval = options["interval"]
+        self.burst = options["burst"]
+        start = time.perf_counter()
+        if options["processes"] > 0:
+            counts = self.run_pool(options["processes"])
+        else:
+            counts = self.run_inline()
+        self.stdout.write(
+            "Ran {} jobs ({} failed) in {:.1f}s.".format(
+                counts["ran"], counts["failed"], time.perf_counter() - start
+            )
+        )
+
+    def poll(self, limit: int) -> list:
+        close_old_connections()
+        requeue_stale()
+        return claim(self.worker, limit)
+
+    def run_inline(self) -> dict:
+        counts = {"ran": 0, "failed": 0}
+        try:
+            while True:
+                jobs = self.poll(1)
+                if not jobs:
+                    if self.burst:
+                        break
+                    time.sleep(self.interval)
+                    continue
+                job = run_job(jobs[0])
+                counts["ran"] += 1
+                counts["failed"] += job.status == Job.FAILED
+        except KeyboardInterrupt:
+            pass
+        return counts
+
+    def run_pool(self, processes: int) -> dict:
+        counts = {"ran": 0, "failed": 0}
+        running = set()
+        pool = ProcessPoolExecutor(
+            processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=setup_process,
+        )
+        try:
+            while True:
+                jobs = self.poll(processes - len(running))
+                running.update(
+                    pool.submit(run_job_by_id, job.pk) for job in jobs
+                )
+                if not running:
+                    if self.burst:
+                        break
+                    time.sleep(self.interval)
+                    continue
+                done, running = wait(
+                    running, timeout=self.interval, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    counts["ran"] += 1
+                    # A crashed process leaves its job running; the
+                    # timeout queues it again.
+                    if future.exception() or future.result() == Job.FAILED:
+                        counts["failed"] += 1
+        except KeyboardInterrupt:
+            pass
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        return counts
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    One unit of background work: ``name`` picks the registered function,
+    which ``runworker`` calls with ``payload`` as keyword arguments.
+    """
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    STATUSES = (
+        (QUEUED, 'Queued'),
+        (RUNNING, 'Running'),
+        (SUCCEEDED, 'Succeeded'),
+        (FAILED, 'Failed'),
+    )
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=10, choices=STATUSES, default=QUEUED)
+    # Higher runs first.
+    priority = models.SmallIntegerField(default=0)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    idempotency_key = models.CharField(max_length=100, blank=True, null=True)
+    run_at = models.DateTimeField(default=timezone.now)
+    worker = models.CharField(max_length=100, blank=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    result = models.JSONField(blank=True, null=True)
+    error = models.TextField(blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name='jobs',
+        blank=True,
+        null=True,
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f'{self.name} #{self.pk}: {self.status}'
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            # The order workers claim queued jobs in.
+            models.Index(
+                fields=['status', '-priority', 'run_at'], name='job_queue_idx'
+            ),
+        ]
+        constraints = [
+            # NULL keys never collide, so jobs without one are not limited.
+            models.UniqueConstraint(
+                fields=['name', 'idempotency_key'],
+                name='job_idempotency_key',
+            ),
+        ]
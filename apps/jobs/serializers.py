@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+from rest_framework import serializers
+
+from apps.jobs.models import Job
+
+
+class JobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Job
+        fields = (
+            'id',
+            'name',
+            'status',
+            'priority',
+            'attempts',
+            'max_attempts',
+            'result',
+            'error',
+            'created_at',
+            'started_at',
+            'finished_at',
+        )
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+import io
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+from apps.jobs.models import Job
+from apps.jobs.utils.queue import (
+    JOBS,
+    JobError,
+    claim,
+    enqueue,
+    register,
+    requeue_stale,
+    run_job,
+)
+from apps.projects.models import Project
+from apps.tasks.models import Task
+from apps.users.models import User
+
+calls = []
+
+
+@register('tests.echo')
+def echo(value=None) -> dict:
+    calls.append(value)
+    if value == 'invalid':
+        raise JobError({'value': ['Not allowed']})
+    if value == 'flaky':
+        raise RuntimeError('Try again')
+    return {'value': value}
+
+
+class TestJobQueue(APITestCase):
+    def setUp(self) -> None:
+        calls.clear()
+
+    def test_registered_jobs_are_discovered(self):
+        self.assertIn('tasks.bulk_create', JOBS)
+        self.assertIn('projects.finalize_upload', JOBS)
+
+    def test_idempotency_key_returns_the_first_job(self):
+        first = enqueue('tests.echo', {'value': 1}, idempotency_key='abc')
+        again = enqueue('tests.echo', {'value': 2}, idempotency_key='abc')
+        other = enqueue('tests.echo', {'value': 3})
+        self.assertEqual(first.pk, again.pk)
+        self.assertNotEqual(first.pk, other.pk)
+        self.assertEqual(Job.objects.count(), 2)
+
+    def test_claim_order_and_due_jobs(self):
+        low = enqueue('tests.echo', priority=0)
+        high = enqueue('tests.echo', priority=5)
+        later = enqueue('tests.echo', priority=9)
+        Job.objects.filter(pk=later.pk).update(
+            run_at=timezone.now() + timedelta(minutes=5)
+        )
+
+        claimed = claim('worker-1', 5)
+        self.assertEqual([job.pk for job in claimed], [high.pk, low.pk])
+        self.assertTrue(all(job.status == Job.RUNNING for job in claimed))
+        self.assertTrue(all(job.attempts == 1 for job in claimed))
+        self.assertEqual(claim('worker-2', 5), [])
+
+    def test_outcomes(self):
+        enqueue('tests.echo', {'value': 'ok'})
+        done = run_job(claim('worker', 1)[0])
+        self.assertEqual(done.status, Job.SUCCEEDED)
+        self.assertEqual(done.result, {'value': 'ok'})
+
+        enqueue('tests.echo', {'value': 'invalid'})
+        invalid = run_job(claim('worker', 1)[0])
+        self.assertEqual(invalid.status, Job.FAILED)
+        self.assertEqual(invalid.result, {'value': ['Not allowed']})
+
+    @override_settings(JOB_RETRY_DELAY=0)
+    def test_failures_are_retried_until_attempts_run_out(self):
+        job = enqueue('tests.echo', {'value': 'flaky'})
+        for attempt in range(1, job.max_attempts + 1):
+            claimed = claim('worker', 1)
+            self.assertEqual(claimed[0].attempts, attempt)
+            with self.assertLogs('apps.jobs', 'ERROR'):
+                run_job(claimed[0])
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertIn('Try again', job.error)
+        self.assertEqual(calls, ['flaky'] * job.max_attempts)
+
+    def test_retry_waits_with_backoff(self):
+        job = enqueue('tests.echo', {'value': 'flaky'})
+        with self.assertLogs('apps.jobs', 'ERROR'):
+            run_job(claim('worker', 1)[0])
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.QUEUED)
+        self.assertGreater(job.run_at, timezone.now())
+        self.assertEqual(claim('worker', 1), [])
+
+    @override_settings(JOB_TIMEOUT=60)
+    def test_abandoned_jobs_are_requeued(self):
+        job = enqueue('tests.echo')
+        claim('worker', 1)
+        Job.objects.filter(pk=job.pk).update(
+            started_at=timezone.now() - timedelta(minutes=5)
+        )
+        requeue_stale()
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.QUEUED)
+        self.assertEqual(claim('worker', 1)[0].attempts, 2)
+
+
+class TestAsyncEndpoints(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='jobs_user',
+            email='jobs@example.com',
+            password='jobs-password',
+            first_name='Jobs',
+            last_name='User',
+            position='QA',
+        )
+        self.client.force_authenticate(user=self.user)
+        Project.objects.create(
+            name='Jobs Project',
+            description='Project used to check the background job endpoints.',
+        )
+        self.rows = [
+            {
+                'name': f'Queued import task {index}',
+                'description': 'Imported task description that is long '
+                'enough to pass.',
+                'priority': 2,
+                'project': 'Jobs Project',
+            }
+            for index in range(3)
+        ]
+
+    def run_worker(self) -> str:
+        out = io.StringIO()
+        call_command('runworker', burst=True, processes=0, stdout=out)
+        return out.getvalue()
+
+    def test_bulk_create_returns_202_and_runs_in_the_worker(self):
+        response = self.client.post(
+            '/api/v1/tasks/bulk/',
+            self.rows,
+            format='json',
+            HTTP_PREFER='respond-async',
+            HTTP_IDEMPOTENCY_KEY='import-1',
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response['Location'], response.data['url'])
+        self.assertFalse(Task.objects.exists())
+
+        retried = self.client.post(
+            '/api/v1/tasks/bulk/',
+            self.rows,
+            format='json',
+            HTTP_PREFER='respond-async',
+            HTTP_IDEMPOTENCY_KEY='import-1',
+        )
+        self.assertEqual(retried.data['job'], response.data['job'])
+
+        self.assertTrue(self.run_worker().startswith('Ran 1 jobs (0 failed)'))
+        self.assertEqual(Task.objects.count(), 3)
+
+        job = self.client.get(response.data['url'])
+        self.assertEqual(job.status_code, status.HTTP_200_OK)
+        self.assertEqual(job.data['status'], Job.SUCCEEDED)
+        self.assertEqual(job.data['result']['created'], 3)
+
+    def test_invalid_rows_fail_the_job(self):
+        self.rows[0]['project'] = 'Missing Project'
+        response = self.client.post(
+            '/api/v1/tasks/bulk/',
+            self.rows,
+            format='json',
+            HTTP_PREFER='respond-async',
+        )
+        self.assertTrue(self.run_worker().startswith('Ran 1 jobs (1 failed)'))
+
+        job = self.client.get(response.data['url']).data
+        self.assertEqual(job['status'], Job.FAILED)
+        self.assertEqual(job['result'][0]['index'], 0)
+        self.assertFalse(Task.objects.exists())
+
+    def test_jobs_are_private_to_their_creator(self):
+        response = self.client.post(
+            '/api/v1/tasks/bulk/',
+            self.rows,
+            format='json',
+            HTTP_PREFER='respond-async',
+        )
+        other = User.objects.create_user(
+            username='jobs_other',
+            email='jobs_other@example.com',
+            password='jobs-password',
+            first_name='Other',
+            last_name='User',
+            position='QA',
+        )
+        self.client.force_authenticate(user=other)
+        job = self.client.get(response.data['url'])
+        self.assertEqual(job.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from apps.jobs.views import JobDetailAPIView
+
+urlpatterns = [
+    path('<int:pk>/', JobDetailAPIView.as_view(), name='job-detail'),
+]
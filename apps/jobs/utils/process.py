@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+import django
+
+
+def setup_process() -> None:
+    # Pool initializer. Spawned processes start without Django and open
+    # their own database connections instead of sharing the parent's; the
+    # module imports no models, so it loads before the app registry.
+    django.setup()
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+import logging
+from datetime import timedelta
+from typing import Callable, NamedTuple
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.jobs.models import Job
+
+logger = logging.getLogger(__name__)
+
+
+class JobSpec(NamedTuple):
+    func: Callable
+    priority: int
+    max_attempts: int
+
+
+class JobError(Exception):
+    """
+    A failure retrying can't fix, e.g. invalid input: the job fails at
+    once with ``detail`` as its result.
+    """
+
+    def __init__(self, detail):
+        super().__init__(detail)
+        self.detail = detail
+
+
+JOBS: dict[str, JobSpec] = {}
+
+
+def register(name: str, priority: int = 0, max_attempts: int = 3):
+    """
+    Registers the decorated function as job ``name``. It is called with
+    the job payload as keyword arguments and returns a JSON result.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        JOBS[name] = JobSpec(func, priority, max_attempts)
+        return func
+
+    return decorator
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    base = getattr(settings, 'JOB_RETRY_DELAY', 30)
+    return timedelta(seconds=base * 2 ** (attempts - 1))
+
+
+def _timeout() -> timedelta:
+    return timedelta(seconds=getattr(settings, 'JOB_TIMEOUT', 600))
+
+
+def enqueue(
+    name: str,
+    payload: dict | None = None,
+    priority: int | None = None,
+    idempotency_key: str | None = None,
+    created_by=None,
+) -> Job:
+    """
+    Queues job ``name``; a repeated ``idempotency_key`` returns the job
+    queued with it instead of a new one.
+    """
+    spec = JOBS[name]
+    if idempotency_key:
+        job = Job.objects.filter(
+            name=name, idempotency_key=idempotency_key
+        ).first()
+        if job is not None:
+            return job
+    try:
+        with transaction.atomic():
+            return Job.objects.create(
+                name=name,
+                payload=payload or {},
+                priority=spec.priority if priority is None else priority,
+                max_attempts=spec.max_attempts,
+                idempotency_key=idempotency_key or None,
+                created_by=created_by,
+            )
+    except IntegrityError:
+        # A concurrent request queued it first.
+        return Job.objects.get(name=name, idempotency_key=idempotency_key)
+
+
+def requeue_stale() -> int:
+    """
+    Returns jobs whose worker died mid-run to the queue, or fails them
+    when they have no attempts left.
+    """
+    stale = Job.objects.filter(
+        status=Job.RUNNING, started_at__lt=timezone.now() - _timeout()
+    )
+    failed = stale.filter(attempts__gte=F('max_attempts')).update(
+        status=Job.FAILED,
+        error='Timed out',
+        finished_at=timezone.now(),
+    )
+    return failed + stale.update(status=Job.QUEUED, worker='')
+
+
+def claim(worker: str, limit: int) -> list[Job]:
+    """
+    Marks up to ``limit`` due jobs as running for ``worker``, highest
+    priority first, and returns them.
+    """
+    if limit <= 0:
+        return []
+    now = timezone.now()
+    due = Job.objects.filter(status=Job.QUEUED, run_at__lte=now).order_by(
+        '-priority', 'run_at', 'pk'
+    )
+    claimed = Job.objects.filter(status=Job.QUEUED)
+    with transaction.atomic():
+        if connection.features.has_select_for_update_skip_locked:
+            ids = list(
+                due.select_for_update(skip_locked=True).values_list(
+                    'pk', flat=True
+                )[:limit]
+            )
+            claimed = claimed.filter(pk__in=ids)
+        else:
+            # SQLite: one UPDATE takes the write lock up front, where a
+            # SELECT first would fail to upgrade its lock under load.
+            claimed = claimed.filter(pk__in=due.values('pk')[:limit])
+        claimed.update(
+            status=Job.RUNNING,
+            worker=worker,
+            started_at=now,
+            attempts=F('attempts') + 1,
+        )
+    # The worker and start time tell this claim apart from the others.
+    return list(
+        Job.objects.filter(
+            status=Job.RUNNING, worker=worker, started_at=now
+        ).order_by('-priority', 'run_at', 'pk')
+    )
+
+
+def _finish(job: Job, status: str, result=None, error: str = '') -> None:
+    job.status = status
+    job.result = result
+    job.error = error
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'result', 'error', 'finished_at'])
+
+
+def run_job(job: Job) -> Job:
+    """
+    Runs a claimed job and records its outcome; failures are retried
+    with exponential backoff until ``max_attempts`` is used up.
+    """
+    spec = JOBS.get(job.name)
+    try:
+        if spec is None:
+            raise JobError(f'Unknown job {job.name}')
+        result = spec.func(**job.payload)
+    except JobError as exc:
+        _finish(job, Job.FAILED, result=exc.detail, error=str(exc))
+    except Exception as exc:
+        logger.exception('Job %s #%s failed', job.name, job.pk)
+        if job.attempts >= job.max_attempts:
+            _finish(job, Job.FAILED, error=repr(exc))
+        else:
+            job.status = Job.QUEUED
+            job.error = repr(exc)
+            job.run_at = timezone.now() + _retry_delay(job.attempts)
+            job.save(update_fields=['status', 'error', 'run_at'])
+    else:
+        _finish(job, Job.SUCCEEDED, result=result)
+    return job
+
+
+def run_job_by_id(job_id: int) -> str:
+    # Entry point of the pool processes, which only get the id.
+    job = run_job(Job.objects.get(pk=job_id))
+    return job.status
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from apps.jobs.utils.queue import enqueue
+
+
+def prefers_async(request: Request) -> bool:
+    # RFC 7240: clients opt in to a 202 for work that may take long.
+    return 'respond-async' in request.headers.get('Prefer', '')
+
+
+def enqueue_for(
+    request: Request,
+    name: str,
+    payload: dict,
+    idempotency_key: str | None = None,
+) -> Response:
+    """
+    Queues job ``name`` for the requesting user and answers 202 with
+    the job and the URL to poll. Retried requests with the same
+    ``idempotency_key``, by default the ``Idempotency-Key`` header, get
+    the first job back.
+    """
+    job = enqueue(
+        name,
+        payload,
+        idempotency_key=idempotency_key
+        or request.headers.get('Idempotency-Key'),
+        created_by=request.user if request.user.is_authenticated else None,
+    )
+    url = reverse('job-detail', kwargs={'pk': job.pk})
+    response = Response(
+        data={'job': job.pk, 'status': job.status, 'url': url},
+        status=status.HTTP_202_ACCEPTED,
+    )
+    response['Location'] = url
+    return response
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from rest_framework import status
+from rest_framework.generics import get_object_or_404
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.jobs.models import Job
+from apps.jobs.serializers import JobSerializer
+
+
+class JobDetailAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        jobs = Job.objects.all()
+        if not request.user.is_staff:
+            jobs = jobs.filter(created_by=request.user)
+        job = get_object_or_404(jobs, pk=self.kwargs.get('pk'))
+        return Response(
+            data=JobSerializer(job).data, status=status.HTTP_200_OK
+        )
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+from rest_framework.exceptions import NotFound
+
+from apps.jobs.utils.queue import JobError, register
+from apps.projects.models import FileUpload
+from apps.projects.serializers.project_file_serializers import (
+    AllProjectFileSerializer,
+    FinalizeFileUploadSerializer,
+)
+
+
+# Someone is usually waiting for the file, so it goes before bulk work.
+@register('projects.finalize_upload', priority=10)
+def finalize_upload(upload_id: str) -> dict:
+    upload = (
+        FileUpload.objects.select_related('project')
+        .filter(pk=upload_id)
+        .first()
+    )
+    if upload is None:
+        raise JobError('Upload not found')
+    serializer = FinalizeFileUploadSerializer(upload, data={})
+    if not serializer.is_valid():
+        raise JobError(serializer.errors)
+    try:
+        project_file = serializer.save()
+    except NotFound:
+        raise JobError('Upload not found')
+    return AllProjectFileSerializer(project_file).data
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+from datetime import timedelta
+from functools import partial
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.projects.models import FileBlob
+from apps.projects.utils.upload_file_helper import BLOB_PATH
+
+
+class Command(BaseCommand):
+    help = "Deletes stored file blobs that no project file references."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-minutes",
+            type=int,
+            default=60,
+            help="Keep blobs younger than this, uploads may still use them.",
+        )
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        grace = timedelta(minutes=options["grace_minutes"])
+
+        orphans = FileBlob.objects.filter(
+            files__isnull=True, created_at__lt=timezone.now() - grace
+        )
+        removed_rows = 0
+        for blob_id in list(orphans.values_list("pk", flat=True)):
+            if dry_run or self.remove_orphan(blob_id):
+                removed_rows += 1
+
+        # Files left behind by uploads that never got their row.
+        known = set(FileBlob.objects.values_list("file_path", flat=True))
+        cutoff = time.time() - grace.total_seconds()
+        removed_files = 0
+        for root, _, file_names in os.walk(BLOB_PATH):
+            for file_name in file_names:
+                file_path = "{}/{}".format(root, file_name)
+                if file_path in known or os.path.getmtime(file_path) > cutoff:
+                    continue
+                if not dry_run:
+                    self.remove(file_path)
+                removed_files += 1
+
+        self.stdout.write(
+            "{}Removed {} orphaned blobs and {} stray files.".format(
+                "[dry run] " if dry_run else "", removed_rows, removed_files
+            )
+        )
+
+    def remove_orphan(self, blob_id: int) -> bool:
+        # Uploads lock a blob they reuse, so once it is locked here no new
+        # file can link to it until it is gone.
+        with transaction.atomic():
+            blob = (
+                FileBlob.objects.select_for_update().filter(pk=blob_id).first()
+            )
+            if blob is None or blob.files.exists():
+                return False
+            blob.delete()
+            # The bytes stay until the row's delete is committed.
+            transaction.on_commit(partial(self.remove, blob.file_path.name))
+        return True
+
+    def remove(self, file_path: str) -> None:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,33 @@
+# Generated by Django 5.0 on 2026-10-18 11:42
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_files_count(apps, schema_editor):
+    Project = apps.get_model('projects', 'Project')
+    links = (
+        Project.files.through.objects.filter(project=OuterRef('pk'))
+        .order_by()
+        .values('project')
+        .annotate(total=Count('*'))
+        .values('total')
+    )
+    Project.objects.update(files_count=Coalesce(Subquery(links), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_projectfile_project_files'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='files_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_files_count, migrations.RunPython.noop),
+    ]
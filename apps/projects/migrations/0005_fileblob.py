@@ -0,0 +1,52 @@
+# Generated by Django 5.0 on 2026-10-18 11:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_fileupload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FileBlob',
+            fields=[
+                (
+                    'digest',
+                    models.CharField(
+                        max_length=64, primary_key=True, serialize=False
+                    ),
+                ),
+                (
+                    'file_path',
+                    models.FileField(
+                        max_length=150, upload_to='documents/blobs/'
+                    ),
+                ),
+                ('size', models.PositiveBigIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AlterField(
+            model_name='projectfile',
+            name='file_path',
+            field=models.FileField(max_length=150, upload_to='documents/'),
+        ),
+        migrations.AddField(
+            model_name='projectfile',
+            name='blob',
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name='files',
+                to='projects.fileblob',
+            ),
+        ),
+    ]
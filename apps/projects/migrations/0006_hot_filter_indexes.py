@@ -0,0 +1,25 @@
+# Generated by Django 5.0 on 2026-10-18 11:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_fileblob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(
+                fields=['created_at'], name='project_created_at_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='projectfile',
+            index=models.Index(
+                fields=['-created_at'], name='file_created_at_idx'
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0 on 2026-10-18 12:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_hot_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(
+                condition=models.Q(('deleted_at__isnull', False)),
+                fields=['deleted_at'],
+                name='project_deleted_at_idx',
+            ),
+        ),
+    ]
@@ -1,2 +1,4 @@
 from apps.projects.models.project import Project
 from apps.projects.models.project_file import ProjectFile
+from apps.projects.models.file_upload import FileUpload
+from apps.projects.models.file_blob import FileBlob
@@ -0,0 +1,14 @@
+from django.db import models
+
+
+class FileBlob(models.Model):
+    digest = models.CharField(max_length=64, primary_key=True)
+    file_path = models.FileField(upload_to="documents/blobs/", max_length=150)
+    size = models.PositiveBigIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.digest
+
+    class Meta:
+        ordering = ["-created_at"]
@@ -0,0 +1,25 @@
+import uuid
+
+from django.db import models
+
+
+class FileUpload(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    project = models.ForeignKey(
+        'Project', on_delete=models.CASCADE, related_name='uploads'
+    )
+    file_name = models.CharField(max_length=120)
+    size = models.PositiveBigIntegerField()
+    received = models.PositiveBigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def is_complete(self):
+        return self.received == self.size
+
+    def __str__(self):
+        return f"{self.file_name} ({self.received}/{self.size})"
+
+    class Meta:
+        ordering = ["-created_at"]
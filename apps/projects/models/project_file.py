@@ -3,11 +3,21 @@ from django.db import models
 
 class ProjectFile(models.Model):
     file_name = models.CharField(max_length=120)
-    file_path = models.FileField(upload_to="documents/")
+    file_path = models.FileField(upload_to="documents/", max_length=150)
     created_at = models.DateTimeField(auto_now_add=True)
+    blob = models.ForeignKey(
+        "FileBlob",
+        on_delete=models.PROTECT,
+        related_name="files",
+        blank=True,
+        null=True,
+    )
 
     def __str__(self):
         return self.file_name
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"], name="file_created_at_idx"),
+        ]
@@ -1,16 +1,45 @@
 # -*- coding: utf-8 -*-
+from django.db import transaction
 from rest_framework import serializers
+from rest_framework.exceptions import NotFound
 
-from apps.projects.models import ProjectFile
+from apps.projects.models import FileBlob, FileUpload, Project, ProjectFile
 from apps.projects.utils.upload_file_helper import (
+    MAX_CHUNKED_SIZE,
     validate_file_extension,
-    create_file_path,
+    validate_chunked_size,
     validate_file_size,
+    discard_upload,
+    lock_upload,
     save_file,
+    store_upload,
 )
+from apps.utils.query_plan import QueryPlanMixin
 
 
-class AllProjectFileSerializer(serializers.ModelSerializer):
+def create_project_file(
+    file_name: str, project: Project, digest: str, file_path: str, size: int
+) -> ProjectFile:
+    # The m2m_changed handler bumps Project.files_count in the same
+    # transaction as the link row.
+    with transaction.atomic():
+        # A reused blob is locked as collect_file_blobs locks an orphan
+        # before deleting it, so it can't be collected under the new file.
+        blob = (
+            FileBlob.objects.select_for_update().filter(digest=digest).first()
+        )
+        if blob is None:
+            blob, _ = FileBlob.objects.get_or_create(
+                digest=digest, defaults={"file_path": file_path, "size": size}
+            )
+        project_file = ProjectFile.objects.create(
+            file_name=file_name, file_path=file_path, blob=blob
+        )
+        project_file.project.add(project)
+    return project_file
+
+
+class AllProjectFileSerializer(QueryPlanMixin, serializers.ModelSerializer):
 
     project = serializers.SlugRelatedField(
         read_only=True, slug_field="name", many=True
@@ -19,6 +48,7 @@ class AllProjectFileSerializer(serializers.ModelSerializer):
     class Meta:
         model = ProjectFile
         fields = ["id", "file_name", "project"]
+        prefetch_related = ["project"]
 
 
 class CreateProjectFileSerializer(serializers.ModelSerializer):
@@ -41,14 +71,84 @@ class CreateProjectFileSerializer(serializers.ModelSerializer):
         project = self.context.get("project", None)
         file = self.context.get("file", None)
 
-        file_path = create_file_path(
-            file_name=validated_data.get("file_name"),
-            project_name=project.name,
-        )
         if not validate_file_size(file):
             raise serializers.ValidationError("File should be less than 2 Mb.")
-        save_file(file, file_path)
-        validated_data["file_path"] = file_path
-        project_file = ProjectFile.objects.create(**validated_data)
-        project_file.project.add(project)
+        digest, file_path = save_file(file)
+        return create_project_file(
+            file_name=validated_data.get("file_name"),
+            project=project,
+            digest=digest,
+            file_path=file_path,
+            size=file.size,
+        )
+
+
+class FileUploadSerializer(serializers.ModelSerializer):
+    upload_id = serializers.UUIDField(source="id", read_only=True)
+    project_id = serializers.PrimaryKeyRelatedField(
+        source="project", queryset=Project.objects.all()
+    )
+    offset = serializers.IntegerField(source="received", read_only=True)
+
+    class Meta:
+        model = FileUpload
+        fields = ["upload_id", "project_id", "file_name", "size", "offset"]
+
+    validate_file_name = CreateProjectFileSerializer.validate_file_name
+
+    def validate_size(self, value):
+        if not validate_chunked_size(value):
+            raise serializers.ValidationError(
+                f"File should be less than {MAX_CHUNKED_SIZE} Mb."
+            )
+        return value
+
+
+class FinalizeFileUploadSerializer(serializers.Serializer):
+    def validate(self, attrs):
+        self.check_complete(self.instance)
+        return attrs
+
+    def check_complete(self, upload: FileUpload) -> None:
+        if not upload.is_complete:
+            raise serializers.ValidationError(
+                f"Upload is incomplete: {upload.received} of "
+                f"{upload.size} bytes received."
+            )
+
+    def save(self, **kwargs):
+        """
+        Hashes and moves the file under the upload's file lock, which
+        appends and other finalizes take too; the transaction only
+        creates the rows and deletes the upload. Raises
+        ``UploadBusyError`` while another request holds the lock.
+        """
+        upload_id = self.instance.pk
+        with lock_upload(upload_id):
+            # Read again under the lock: a concurrent finalize may have
+            # moved the file and deleted the upload meanwhile.
+            upload = FileUpload.objects.filter(pk=upload_id).first()
+            if upload is None:
+                discard_upload(upload_id)
+                raise NotFound("Upload not found")
+            self.check_complete(upload)
+            digest, file_path = store_upload(upload_id)
+            with transaction.atomic():
+                # Cancelling doesn't take the file lock.
+                if not (
+                    FileUpload.objects.select_for_update()
+                    .filter(pk=upload_id)
+                    .exists()
+                ):
+                    raise NotFound("Upload not found")
+                project_file = create_project_file(
+                    file_name=upload.file_name,
+                    project=self.instance.project,
+                    digest=digest,
+                    file_path=file_path,
+                    size=upload.size,
+                )
+                upload.delete()
+        # The lock file goes last, once the upload row is gone.
+        discard_upload(upload_id)
         return project_file
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
+
 from apps.projects.models import Project
+from apps.utils.query_plan import QueryPlanMixin
 
 
-class AllProjectsSerializer(serializers.ModelSerializer):
+class AllProjectsSerializer(QueryPlanMixin, serializers.ModelSerializer):
     class Meta:
         model = Project
         fields = ('id', 'name', 'created_at')
@@ -15,6 +18,14 @@ class CreateUpdateProjectSerializer(serializers.ModelSerializer):
     class Meta:
         model = Project
         fields = ('name', 'description', 'created_at')
+        # Deleted projects keep their names until they are purged.
+        extra_kwargs = {
+            'name': {
+                'validators': [
+                    UniqueValidator(queryset=Project.all_objects.all())
+                ]
+            }
+        }
 
     def validate_description(self, value):
         if len(value) < 50:
@@ -34,3 +45,7 @@ class ProjectShortInfoSerializer(serializers.ModelSerializer):
     class Meta:
         model = Project
         fields = ['name', 'created_at']
+
+
+class ProjectStatsQuerySerializer(serializers.Serializer):
+    days = serializers.IntegerField(min_value=1, max_value=365, default=30)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+from django.db.models.signals import m2m_changed, pre_delete, post_delete
+from django.dispatch import receiver
+
+from apps.projects.models import Project, ProjectFile
+from apps.utils.response_cache import invalidate_on_change
+
+invalidate_on_change(Project, ProjectFile)
+
+
+@receiver(m2m_changed, sender=Project.files.through)
+def update_files_count(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear' and reverse:
+        # pk_set is empty on clear, so remember the projects beforehand.
+        instance._cleared_project_ids = list(
+            instance.project.values_list('pk', flat=True)
+        )
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        project_ids = [instance.pk]
+    elif action == 'post_clear':
+        project_ids = instance.__dict__.pop('_cleared_project_ids', [])
+    else:
+        project_ids = pk_set
+
+    Project.objects.filter(pk__in=project_ids).refresh_files_count()
+
+
+@receiver(pre_delete, sender=ProjectFile)
+def remember_file_projects(sender, instance, **kwargs):
+    instance._deleted_project_ids = list(
+        instance.project.values_list('pk', flat=True)
+    )
+
+
+@receiver(post_delete, sender=ProjectFile)
+def release_file_projects(sender, instance, **kwargs):
+    project_ids = instance.__dict__.pop('_deleted_project_ids', [])
+    Project.objects.filter(pk__in=project_ids).refresh_files_count()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import tempfile
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import AsyncRequestFactory
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+from apps.projects.models import Project, ProjectFile
+from apps.projects.views.project_files_views import (
+    ProjectFileDownloadAsyncView,
+)
+from apps.projects.views.project_views import ProjectListAsyncView
+from apps.utils.response_cache import get_cache
+
+
+async def anonymous():
+    return AnonymousUser()
+
+
+class TestProjectAsyncViews(APITestCase):
+    content = b'%PDF-1.7 ' + bytes(range(256)) * 400
+
+    def setUp(self) -> None:
+        get_cache().clear()
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+
+        self.client = APIClient()
+        self.factory = AsyncRequestFactory()
+        self.project = Project.objects.create(
+            name='Async Project',
+            description='Project used to check the async list and downloads.',
+        )
+        self.client.post(
+            reverse('project-files'),
+            {
+                'project_id': self.project.pk,
+                'file': SimpleUploadedFile('spec.pdf', self.content),
+            },
+            format='multipart',
+        )
+        self.project_file = ProjectFile.objects.get()
+
+    def tearDown(self) -> None:
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    async def call(self, view, request, **kwargs):
+        request.auser = anonymous
+        return await view.as_view()(request, **kwargs)
+
+    async def read(self, response) -> bytes:
+        return b''.join([chunk async for chunk in response.streaming_content])
+
+    async def test_project_list_matches_sync_view(self):
+        response = await self.call(
+            ProjectListAsyncView, self.factory.get('/api/v1/projects/')
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        get_cache().clear()
+        expected = await self.async_client.get('/api/v1/projects/')
+        self.assertEqual(json.loads(response.content), expected.json())
+
+    async def test_project_list_is_cached(self):
+        url = '/api/v1/projects/'
+        await self.call(ProjectListAsyncView, self.factory.get(url))
+        response = await self.call(ProjectListAsyncView, self.factory.get(url))
+
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+    async def test_project_list_empty_range(self):
+        response = await self.call(
+            ProjectListAsyncView,
+            self.factory.get(
+                '/api/v1/projects/',
+                {'date_from': '2000-01-01', 'date_to': '2000-01-02'},
+            ),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    async def test_post_falls_back_to_sync_view(self):
+        response = await self.call(
+            ProjectListAsyncView,
+            self.factory.post(
+                '/api/v1/projects/',
+                {
+                    'name': 'Created Async',
+                    'description': 'Project created through the async view '
+                    'fallback to the sync one.',
+                },
+                content_type='application/json',
+            ),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(
+            await Project.objects.filter(name='Created Async').aexists()
+        )
+
+    async def test_download_streams_asynchronously(self):
+        response = await self.call(
+            ProjectFileDownloadAsyncView,
+            self.factory.get('/'),
+            pk=self.project_file.pk,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.is_async)
+        self.assertEqual(int(response['Content-Length']), len(self.content))
+        self.assertEqual(response['ETag'], f'"{self.project_file.blob_id}"')
+        self.assertEqual(await self.read(response), self.content)
+
+    async def test_download_ranges(self):
+        single = await self.call(
+            ProjectFileDownloadAsyncView,
+            self.factory.get('/', headers={'Range': 'bytes=10-99'}),
+            pk=self.project_file.pk,
+        )
+        multi = await self.call(
+            ProjectFileDownloadAsyncView,
+            self.factory.get('/', headers={'Range': 'bytes=0-9,-10'}),
+            pk=self.project_file.pk,
+        )
+
+        self.assertEqual(single.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(await self.read(single), self.content[10:100])
+        body = await self.read(multi)
+        self.assertEqual(len(body), int(multi['Content-Length']))
+        self.assertIn(self.content[:10], body)
+        self.assertIn(self.content[-10:], body)
+
+    async def test_download_missing_file(self):
+        response = await self.call(
+            ProjectFileDownloadAsyncView,
+            self.factory.get('/'),
+            pk=self.project_file.pk + 100,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIn('detail', json.loads(response.content))
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+from unittest.mock import patch
+
+from django.db import transaction
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+from apps.projects.models import Project
+from apps.projects.views.project_views import ProjectListAPIView
+from apps.utils.response_cache import get_cache, get_stats, reset_stats
+
+
+class TestProjectListCache(APITestCase):
+    def setUp(self) -> None:
+        get_cache().clear()
+        reset_stats()
+        self.client = APIClient()
+        self.url = reverse('project-list')
+        Project.objects.create(
+            name='Cached Project',
+            description='Project used to check the project list response cache.',
+        )
+
+    def test_second_request_is_served_from_cache(self):
+        first = self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+
+        self.assertEqual(first['X-Cache'], 'MISS')
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(get_stats(), {'hits': 1, 'misses': 1})
+
+    def test_query_params_are_normalized(self):
+        self.client.get(f'{self.url}?date_to=2100-01-01&date_from=2000-01-01')
+        response = self.client.get(
+            f'{self.url}?date_from=2000-01-01&date_to=2100-01-01'
+        )
+
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+    def test_if_none_match_returns_not_modified(self):
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_project_change_invalidates_entry(self):
+        etag = self.client.get(self.url)['ETag']
+        Project.objects.create(
+            name='Another Project',
+            description='Saving a project must drop the cached project list.',
+        )
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(len(response.data), 2)
+
+    def test_entry_cached_before_the_commit_is_dropped(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                project = Project.objects.create(
+                    name='Committed Project',
+                    description='Project saved while a concurrent request '
+                    'still reads the rows from before the commit.',
+                )
+                # A concurrent request can't see the uncommitted row yet.
+                with patch.object(
+                    ProjectListAPIView,
+                    'get_objects',
+                    return_value=Project.objects.exclude(pk=project.pk),
+                ):
+                    stale = self.client.get(self.url)
+                self.assertEqual(len(stale.data), 1)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(len(response.data), 2)
+
+    def test_empty_response_is_not_cached(self):
+        Project.objects.all().delete()
+
+        self.client.get(self.url)
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(response['X-Cache'], 'MISS')
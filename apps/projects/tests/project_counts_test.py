@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+from django.test import TestCase
+
+from apps.projects.models import Project, ProjectFile
+from apps.projects.serializers.project_serializers import (
+    ProjectDetailSerializer,
+)
+from apps.tasks.models import Task
+
+
+class TestProjectCounts(TestCase):
+    def setUp(self) -> None:
+        self.project = Project.objects.create(
+            name='Counted Project',
+            description='Project with files and tasks to check the counters.',
+        )
+        self.other = Project.objects.create(
+            name='Other Project',
+            description='Second project sharing one of the project files.',
+        )
+        self.files = [
+            ProjectFile.objects.create(
+                file_name=f'file_{index}.pdf',
+                file_path=f'documents/Counted_Project/file_{index}.pdf',
+            )
+            for index in range(3)
+        ]
+
+    def test_files_count_follows_forward_links(self):
+        self.project.files.add(*self.files)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.count_of_files, 3)
+
+        self.project.files.remove(self.files[0])
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.count_of_files, 2)
+
+        self.project.files.clear()
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.count_of_files, 0)
+
+    def test_files_count_follows_reverse_links(self):
+        shared = self.files[0]
+        shared.project.add(self.project, self.other)
+        self.assertEqual(
+            list(
+                Project.objects.order_by('pk').values_list(
+                    'files_count', flat=True
+                )
+            ),
+            [1, 1],
+        )
+
+        shared.project.clear()
+        self.assertFalse(Project.objects.filter(files_count__gt=0).exists())
+
+    def test_files_count_after_file_delete(self):
+        self.project.files.add(*self.files)
+        self.files[1].delete()
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.count_of_files, 2)
+
+    def test_with_counts_is_a_single_query(self):
+        self.project.files.add(*self.files)
+        self.other.files.add(self.files[0])
+        Task.objects.create(
+            name='Counted task',
+            description='Task that belongs to the counted project.',
+            project=self.project,
+        )
+
+        with self.assertNumQueries(1):
+            projects = {
+                project.name: project
+                for project in Project.objects.with_counts()
+            }
+
+        counted = projects['Counted Project']
+        self.assertEqual(
+            (counted.files_total, counted.tasks_total, counted.users_total),
+            (3, 1, 0),
+        )
+        other = projects['Other Project']
+        self.assertEqual((other.files_total, other.tasks_total), (1, 0))
+
+    def test_detail_serializer_needs_no_count_query(self):
+        self.project.files.add(*self.files)
+        projects = list(Project.objects.all())
+
+        with self.assertNumQueries(0):
+            data = ProjectDetailSerializer(projects, many=True).data
+
+        self.assertEqual(data[0]['count_of_files'], 3)
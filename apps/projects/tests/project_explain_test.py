@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.projects.models import Project, ProjectFile
+from apps.utils.explain import find_sequential_scans
+
+
+@skipUnless(connection.vendor == 'sqlite', 'EXPLAIN output is SQLite-specific')
+class TestProjectQueryPlans(TestCase):
+    def assertIndexed(self, queryset) -> None:
+        self.assertEqual(find_sequential_scans(queryset), [])
+
+    def test_filter_by_created_at_range_uses_index(self):
+        now = timezone.now()
+        self.assertIndexed(
+            Project.objects.filter(
+                created_at__range=(now - timedelta(days=7), now)
+            )
+        )
+
+    def test_latest_files_use_index(self):
+        self.assertIndexed(ProjectFile.objects.order_by('-created_at')[:10])
+
+    def test_files_by_project_name_use_index(self):
+        self.assertIndexed(ProjectFile.objects.filter(project__name='Backend'))
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+from apps.projects.models import Project, ProjectFile
+
+
+class TestProjectFileDownload(APITestCase):
+    content = b'%PDF-1.7 ' + bytes(range(256)) * 40
+
+    def setUp(self) -> None:
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+
+        self.client = APIClient()
+        project = Project.objects.create(
+            name='Download Project',
+            description='Project used to check the project file downloads.',
+        )
+        self.client.post(
+            reverse('project-files'),
+            {
+                'project_id': project.pk,
+                'file': SimpleUploadedFile('spec.pdf', self.content),
+            },
+            format='multipart',
+        )
+        self.project_file = ProjectFile.objects.get()
+        self.url = reverse(
+            'download-file', kwargs={'pk': self.project_file.pk}
+        )
+
+    def tearDown(self) -> None:
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def test_full_download(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(response.streaming_content), self.content)
+        self.assertEqual(response['ETag'], f'"{self.project_file.blob_id}"')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertIn('spec.pdf', response['Content-Disposition'])
+        response.close()
+
+    def test_conditional_get(self):
+        response = self.client.get(self.url)
+        response.close()
+
+        for headers in (
+            {'HTTP_IF_NONE_MATCH': response['ETag']},
+            {'HTTP_IF_MODIFIED_SINCE': response['Last-Modified']},
+        ):
+            with self.subTest(headers=headers):
+                not_modified = self.client.get(self.url, **headers)
+                self.assertEqual(
+                    not_modified.status_code, status.HTTP_304_NOT_MODIFIED
+                )
+                self.assertEqual(not_modified['ETag'], response['ETag'])
+
+    def test_single_range(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=100-199')
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(
+            response['Content-Range'], f'bytes 100-199/{len(self.content)}'
+        )
+        self.assertEqual(
+            b''.join(response.streaming_content), self.content[100:200]
+        )
+
+    def test_suffix_range(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=-10')
+
+        self.assertEqual(
+            b''.join(response.streaming_content), self.content[-10:]
+        )
+
+    def test_multi_range(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-9,50-59')
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertTrue(
+            response['Content-Type'].startswith('multipart/byteranges')
+        )
+        body = b''.join(response.streaming_content)
+        self.assertEqual(int(response['Content-Length']), len(body))
+        self.assertIn(self.content[0:10], body)
+        self.assertIn(self.content[50:60], body)
+        self.assertIn(b'Content-Range: bytes 50-59/', body)
+
+    def test_unsatisfiable_range(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=999999-')
+
+        self.assertEqual(
+            response.status_code,
+            status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+        )
+        self.assertEqual(
+            response['Content-Range'], f'bytes */{len(self.content)}'
+        )
+
+    def test_stale_if_range_returns_full_file(self):
+        response = self.client.get(
+            self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"outdated"'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response.close()
+
+    @override_settings(
+        FILE_DOWNLOAD_OFFLOAD='x-accel-redirect',
+        FILE_DOWNLOAD_ACCEL_PREFIX='/protected/',
+    )
+    def test_accel_redirect_offload(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(
+            response['X-Accel-Redirect'],
+            f'/protected/{self.project_file.file_path.name}',
+        )
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+import io
+import os
+import tempfile
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import QuerySet
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.test import APITestCase, APIClient
+
+from apps.projects.models import FileBlob, FileUpload, Project, ProjectFile
+from apps.projects.serializers.project_file_serializers import (
+    FinalizeFileUploadSerializer,
+)
+from apps.projects.utils import upload_file_helper
+from apps.users.models import User
+
+
+class TestChunkedFileUpload(APITestCase):
+    content = b'%PDF-1.7' + b'x' * 200_000
+
+    def setUp(self) -> None:
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+
+        self.client = APIClient()
+        self.project = Project.objects.create(
+            name='Upload Project',
+            description='Project used to check the chunked file uploads.',
+        )
+
+    def tearDown(self) -> None:
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def init_upload(self, file_name='spec.pdf', size=None):
+        return self.client.post(
+            reverse('file-upload-create'),
+            {
+                'project_id': self.project.pk,
+                'file_name': file_name,
+                'size': len(self.content) if size is None else size,
+            },
+            format='json',
+        )
+
+    def send_chunk(self, upload_id, offset, chunk):
+        return self.client.patch(
+            reverse('file-upload-detail', kwargs={'upload_id': upload_id}),
+            data=chunk,
+            content_type='application/offset+octet-stream',
+            HTTP_UPLOAD_OFFSET=str(offset),
+        )
+
+    def test_upload_in_chunks_and_resume(self):
+        upload_id = self.init_upload().data['upload_id']
+        first, rest = self.content[:70_000], self.content[70_000:]
+
+        self.assertEqual(
+            self.send_chunk(upload_id, 0, first).data['offset'], 70_000
+        )
+
+        # A client that lost the response re-sends from a stale offset.
+        response = self.send_chunk(upload_id, 0, first)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+        offset = self.client.get(
+            reverse('file-upload-detail', kwargs={'upload_id': upload_id})
+        ).data['offset']
+        self.send_chunk(upload_id, offset, rest)
+
+        response = self.client.post(
+            reverse('file-upload-finalize', kwargs={'upload_id': upload_id})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['project'], ['Upload Project'])
+        project_file = ProjectFile.objects.get(pk=response.data['id'])
+        with open(project_file.file_path.name, 'rb') as stored:
+            self.assertEqual(stored.read(), self.content)
+        self.assertFalse(FileUpload.objects.exists())
+        self.assertEqual(os.listdir('documents/.uploads'), [])
+
+    def test_finalize_incomplete_upload(self):
+        upload_id = self.init_upload().data['upload_id']
+        self.send_chunk(upload_id, 0, self.content[:100])
+
+        response = self.client.post(
+            reverse('file-upload-finalize', kwargs={'upload_id': upload_id})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ProjectFile.objects.exists())
+
+    def test_finalize_in_the_background(self):
+        user = User.objects.create_user(
+            username='upload_user',
+            email='upload@example.com',
+            password='upload-password',
+            first_name='Upload',
+            last_name='User',
+            position='QA',
+        )
+        self.client.force_authenticate(user=user)
+        upload_id = self.init_upload().data['upload_id']
+        self.send_chunk(upload_id, 0, self.content)
+        url = reverse('file-upload-finalize', kwargs={'upload_id': upload_id})
+
+        response = self.client.post(url, HTTP_PREFER='respond-async')
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        # Finalizing twice while it is queued returns the same job.
+        again = self.client.post(url, HTTP_PREFER='respond-async')
+        self.assertEqual(again.data['job'], response.data['job'])
+        self.assertFalse(ProjectFile.objects.exists())
+
+        call_command(
+            'runworker', burst=True, processes=0, stdout=io.StringIO()
+        )
+        job = self.client.get(response.data['url']).data
+        self.assertEqual(job['status'], 'succeeded')
+        self.assertEqual(job['result']['project'], ['Upload Project'])
+        self.assertFalse(FileUpload.objects.exists())
+
+    def test_chunk_is_read_outside_transactions(self):
+        upload_id = self.init_upload().data['upload_id']
+        # The test case's own atomic blocks.
+        blocks = len(connection.atomic_blocks)
+        append_chunk = upload_file_helper.append_chunk
+
+        def check_append_chunk(upload, stream):
+            self.assertEqual(len(connection.atomic_blocks), blocks)
+            return append_chunk(upload, stream)
+
+        with patch(
+            'apps.projects.views.project_files_views.append_chunk',
+            check_append_chunk,
+        ):
+            response = self.send_chunk(upload_id, 0, self.content)
+        self.assertEqual(response.data['offset'], len(self.content))
+
+    def test_concurrent_chunk_is_rejected(self):
+        upload_id = self.init_upload().data['upload_id']
+
+        with upload_file_helper.lock_upload(upload_id):
+            response = self.send_chunk(upload_id, 0, self.content)
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(FileUpload.objects.get().received, 0)
+
+    def test_chunk_over_declared_size(self):
+        upload_id = self.init_upload(size=100).data['upload_id']
+
+        response = self.send_chunk(upload_id, 0, self.content)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        )
+        self.assertEqual(FileUpload.objects.get().received, 0)
+
+    def test_content_must_match_extension(self):
+        upload_id = self.init_upload().data['upload_id']
+
+        response = self.send_chunk(upload_id, 0, b'MZ' + self.content[2:])
+
+        self.assertEqual(
+            response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+        )
+
+    def test_signature_may_span_chunks(self):
+        upload_id = self.init_upload().data['upload_id']
+
+        self.assertEqual(
+            self.send_chunk(upload_id, 0, self.content[:2]).data['offset'], 2
+        )
+        response = self.send_chunk(upload_id, 2, self.content[2:])
+        self.assertEqual(response.data['offset'], len(self.content))
+
+        upload_id = self.init_upload(file_name='other.pdf').data['upload_id']
+        response = self.send_chunk(upload_id, 0, b'MZ')
+        self.assertEqual(
+            response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+        )
+
+    def test_concurrent_finalize(self):
+        upload_id = self.init_upload().data['upload_id']
+        self.send_chunk(upload_id, 0, self.content)
+        upload = FileUpload.objects.select_related('project').get()
+        first = FinalizeFileUploadSerializer(upload, data={})
+        second = FinalizeFileUploadSerializer(upload, data={})
+        self.assertTrue(first.is_valid() and second.is_valid())
+
+        first.save()
+        with self.assertRaises(NotFound):
+            second.save()
+        self.assertEqual(ProjectFile.objects.count(), 1)
+
+    def test_finalize_hashes_outside_transactions(self):
+        upload_id = self.init_upload().data['upload_id']
+        self.send_chunk(upload_id, 0, self.content)
+        depths = []
+        hash_chunks = upload_file_helper.hash_chunks
+
+        def record_depth(chunks):
+            depths.append(len(connection.atomic_blocks))
+            return hash_chunks(chunks)
+
+        outer = len(connection.atomic_blocks)
+        with patch.object(upload_file_helper, 'hash_chunks', record_depth):
+            response = self.client.post(
+                reverse(
+                    'file-upload-finalize', kwargs={'upload_id': upload_id}
+                )
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(depths, [outer])
+
+    def test_finalize_while_a_chunk_is_written(self):
+        upload_id = self.init_upload().data['upload_id']
+        self.send_chunk(upload_id, 0, self.content)
+
+        with upload_file_helper.lock_upload(upload_id):
+            response = self.client.post(
+                reverse(
+                    'file-upload-finalize', kwargs={'upload_id': upload_id}
+                )
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertFalse(ProjectFile.objects.exists())
+
+    def test_init_validation(self):
+        self.assertEqual(
+            self.init_upload(file_name='tool.exe').status_code,
+            status.HTTP_400_BAD_REQUEST,
+        )
+        self.assertEqual(
+            self.init_upload(size=1024**4).status_code,
+            status.HTTP_400_BAD_REQUEST,
+        )
+
+
+class TestDeduplicatedFileStorage(APITestCase):
+    def setUp(self) -> None:
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+
+        self.client = APIClient()
+        self.projects = [
+            Project.objects.create(
+                name=f'Blob Project {index}',
+                description='Project used to check deduplicated file storage.',
+            )
+            for index in range(2)
+        ]
+
+    def tearDown(self) -> None:
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def upload(self, project, name, content):
+        return self.client.post(
+            reverse('project-files'),
+            {
+                'project_id': project.pk,
+                'file': SimpleUploadedFile(name, content),
+            },
+            format='multipart',
+        )
+
+    def test_identical_uploads_share_one_blob(self):
+        content = b'%PDF-1.7 shared specification'
+        for project in self.projects:
+            response = self.upload(project, 'spec.pdf', content)
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        with patch(
+            'apps.projects.utils.upload_file_helper.write_chunks'
+        ) as mock_write:
+            self.upload(self.projects[0], 'copy.pdf', content)
+        mock_write.assert_not_called()
+
+        self.assertEqual(ProjectFile.objects.count(), 3)
+        blob = FileBlob.objects.get()
+        self.assertEqual(blob.files.count(), 3)
+        self.assertEqual(blob.size, len(content))
+        with open(blob.file_path.name, 'rb') as stored:
+            self.assertEqual(stored.read(), content)
+
+    def test_collect_orphaned_blobs(self):
+        self.upload(self.projects[0], 'spec.pdf', b'%PDF-1.7 kept')
+        self.upload(self.projects[0], 'old.pdf', b'%PDF-1.7 dropped')
+        dropped = ProjectFile.objects.get(file_name='old.pdf')
+        orphan_path = dropped.blob.file_path.name
+        dropped.delete()
+        FileBlob.objects.update(created_at=timezone.now() - timedelta(days=1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('collect_file_blobs', stdout=io.StringIO())
+            # The bytes outlive the row until the delete is committed.
+            self.assertTrue(os.path.exists(orphan_path))
+
+        self.assertEqual(FileBlob.objects.count(), 1)
+        self.assertFalse(os.path.exists(orphan_path))
+        self.assertTrue(os.path.exists(FileBlob.objects.get().file_path.name))
+
+    def test_orphan_reused_meanwhile_is_kept(self):
+        self.upload(self.projects[0], 'old.pdf', b'%PDF-1.7 reused')
+        ProjectFile.objects.get().delete()
+        FileBlob.objects.update(created_at=timezone.now() - timedelta(days=1))
+        lock = QuerySet.select_for_update
+        calls = []
+
+        def upload_then_lock(queryset, *args, **kwargs):
+            # The same content is uploaded between the orphan query and
+            # the collector's lock.
+            calls.append(queryset.model)
+            if len(calls) == 1:
+                self.upload(self.projects[1], 'new.pdf', b'%PDF-1.7 reused')
+            return lock(queryset, *args, **kwargs)
+
+        with (
+            self.captureOnCommitCallbacks(execute=True),
+            patch.object(QuerySet, 'select_for_update', upload_then_lock),
+        ):
+            call_command('collect_file_blobs', stdout=io.StringIO())
+
+        blob = FileBlob.objects.get()
+        self.assertEqual(blob.files.get().file_name, 'new.pdf')
+        self.assertTrue(os.path.exists(blob.file_path.name))
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from django.db.models import QuerySet
 from django.test import TestCase
-from unittest.mock import patch, Mock, MagicMock
+from unittest.mock import patch, Mock
 from rest_framework import status
 
 from apps.projects.models import ProjectFile, Project
@@ -55,11 +55,9 @@ class ProjectFileListGenericViewTest(TestCase):
 
         project.files.add(proj_file)
 
-        mock_queryset = MagicMock(spec=QuerySet)
-        mock_queryset.exists.return_value = True
-        mock_queryset.__iter__.return_value = iter([proj_file])
-
-        mock_get_queryset.return_value = mock_queryset
+        mock_get_queryset.return_value = ProjectFile.objects.filter(
+            pk=proj_file.pk
+        )
 
         response = self.client.get(
             '/api/v1/projects/files/?project_name=Test%20Project'
@@ -87,7 +85,8 @@ class ProjectFileListGenericViewTest(TestCase):
 class TestCreateProjectFileSerializer(TestCase):
     @patch('apps.projects.serializers.project_file_serializers.save_file')
     def test_create_project_file(self, mock_save_file):
-        mock_save_file.return_value = 'documents/Mock_Project/mock_file.pdf'
+        digest = 'a' * 64
+        mock_save_file.return_value = (digest, f'documents/blobs/aa/{digest}')
 
         project = Project.objects.create(
             name='Mock Project',
@@ -108,13 +107,13 @@ class TestCreateProjectFileSerializer(TestCase):
 
         project_file = serializer.save()
 
-        mock_save_file.assert_called_once_with(
-            mock_file, 'documents/Mock_Project/mock_file.pdf'
-        )
+        mock_save_file.assert_called_once_with(mock_file)
 
         self.assertEqual(
-            project_file.file_path, 'documents/Mock_Project/mock_file.pdf'
+            project_file.file_path, f'documents/blobs/aa/{digest}'
         )
+        self.assertEqual(project_file.blob.digest, digest)
+        self.assertEqual(project_file.blob.size, mock_file.size)
 
         self.assertEqual(project_file.file_name, 'mock_file.pdf')
         self.assertEqual(project_file.project.first(), project)
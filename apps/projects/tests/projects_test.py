@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from django.urls import reverse
-from django.db.models import QuerySet
 
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
@@ -48,10 +47,9 @@ class TestProjectListAPIView(APITestCase):
     @patch.object(ProjectListAPIView, 'get_objects')
     def test_get_project_list(self, mock_get_objects):
         projects = [self.project1, self.project2]
-
-        mock_queryset = MagicMock(spec=QuerySet)
-        mock_queryset.__iter__.return_value = iter(projects)
-        mock_get_objects.return_value = mock_queryset
+        mock_get_objects.return_value = Project.objects.filter(
+            pk__in=[project.pk for project in projects]
+        )
 
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
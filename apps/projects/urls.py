@@ -1,23 +1,56 @@
 # -*- coding: utf-8 -*-
+from django.conf import settings
 from django.urls import path
 
 from apps.projects.views.project_files_views import (
     ProjectFileListGenericView,
     ProjectFileDownloadApiView,
+    ProjectFileDownloadAsyncView,
+    FileUploadCreateAPIView,
+    FileUploadDetailAPIView,
+    FileUploadFinalizeAPIView,
 )
 from apps.projects.views.project_views import (
     ProjectListAPIView,
+    ProjectListAsyncView,
     ProjectDetailAPIView,
+    ProjectStatsAPIView,
 )
 
+ProjectListView = (
+    ProjectListAsyncView if settings.ASYNC_VIEWS else ProjectListAPIView
+)
+DownloadView = (
+    ProjectFileDownloadAsyncView
+    if settings.ASYNC_VIEWS
+    else ProjectFileDownloadApiView
+)
 
 urlpatterns = [
-    path('', ProjectListAPIView.as_view(), name='project-list'),
+    path('', ProjectListView.as_view(), name='project-list'),
     path('<int:pk>/', ProjectDetailAPIView.as_view(), name='project-detail'),
+    path(
+        '<int:pk>/stats/', ProjectStatsAPIView.as_view(), name='project-stats'
+    ),
     path('files/', ProjectFileListGenericView.as_view(), name='project-files'),
     path(
         'files/download/<int:pk>',
-        ProjectFileDownloadApiView.as_view(),
+        DownloadView.as_view(),
         name='download-file',
     ),
+    path(
+        'files/uploads/',
+        FileUploadCreateAPIView.as_view(),
+        name='file-upload-create',
+    ),
+    path(
+        'files/uploads/<uuid:upload_id>/',
+        FileUploadDetailAPIView.as_view(),
+        name='file-upload-detail',
+    ),
+    path(
+        'files/uploads/<uuid:upload_id>/finalize/',
+        FileUploadFinalizeAPIView.as_view(),
+        name='file-upload-finalize',
+    ),
 ]
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import mimetypes
+import os
+import re
+import uuid
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date
+
+READ_SIZE = 64 * 1024
+MAX_RANGES = 16
+RANGE_RE = re.compile(r"^(\d*)-(\d*)$")
+
+
+def parse_range_header(header: str, size: int) -> list | None:
+    """
+    Returns inclusive ``(start, end)`` byte ranges, ``[]`` when none of
+    them can be satisfied, or ``None`` when the header should be ignored.
+    """
+    unit, _, specs = header.partition("=")
+    if unit.strip() != "bytes" or not specs:
+        return None
+
+    ranges = []
+    for spec in specs.split(","):
+        match = RANGE_RE.match(spec.strip())
+        if not match or match.groups() == ("", ""):
+            return None
+        first, last = match.groups()
+        if not first:
+            suffix = int(last)
+            if suffix:
+                ranges.append((max(size - suffix, 0), size - 1))
+            continue
+        start = int(first)
+        end = int(last) if last else size - 1
+        if last and end < start:
+            return None
+        if start < size:
+            ranges.append((start, min(end, size - 1)))
+
+    if len(ranges) > MAX_RANGES:
+        return None
+    return ranges
+
+
+def iter_file_range(file_path: str, start: int, end: int):
+    with open(file_path, "rb") as source:
+        source.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = source.read(min(READ_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+async def aiter_file_range(file_path: str, start: int, end: int):
+    # Disk reads go to the default executor one chunk at a time, so a slow
+    # client holds no thread while it drains the previous chunk.
+    source = await asyncio.to_thread(open, file_path, "rb")
+    try:
+        await asyncio.to_thread(source.seek, start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await asyncio.to_thread(
+                source.read, min(READ_SIZE, remaining)
+            )
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        await asyncio.to_thread(source.close)
+
+
+class FileDownload:
+    """
+    Builds the download response for a stored file. With ``asynchronous``
+    the body is an async iterator, which ASGI servers stream without
+    tying up a thread per client.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        file_name: str,
+        digest: str | None,
+        asynchronous: bool = False,
+    ):
+        self.file_path = file_path
+        self.asynchronous = asynchronous
+        self.file_name = file_name
+        stat = os.stat(file_path)
+        self.size = stat.st_size
+        self.last_modified = int(stat.st_mtime)
+        # Only content digests make strong validators usable in If-Range.
+        self.etag = '"{}"'.format(digest) if digest else None
+        self.content_type = (
+            mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+        )
+
+    def set_headers(self, response) -> None:
+        response["Accept-Ranges"] = "bytes"
+        response["Last-Modified"] = http_date(self.last_modified)
+        if self.etag:
+            response["ETag"] = self.etag
+        response["Content-Disposition"] = content_disposition_header(
+            as_attachment=True, filename=self.file_name
+        )
+
+    def get_ranges(self, request) -> list | None:
+        header = request.headers.get("Range")
+        if not header:
+            return None
+        if_range = request.headers.get("If-Range")
+        if if_range and if_range not in (
+            self.etag,
+            http_date(self.last_modified),
+        ):
+            return None
+        return parse_range_header(header, self.size)
+
+    def build_response(self, request):
+        response = get_conditional_response(
+            request, etag=self.etag, last_modified=self.last_modified
+        )
+        if response is None:
+            offload = getattr(settings, "FILE_DOWNLOAD_OFFLOAD", "")
+            if offload:
+                response = self.offload_response(offload)
+            else:
+                response = self.file_response(request)
+        self.set_headers(response)
+        return response
+
+    def offload_response(self, offload: str) -> HttpResponse:
+        # The front proxy serves the bytes (and ranges); Django only
+        # authorizes the request and sets the headers.
+        response = HttpResponse(content_type=self.content_type)
+        if offload == "x-accel-redirect":
+            response["X-Accel-Redirect"] = "{}{}".format(
+                settings.FILE_DOWNLOAD_ACCEL_PREFIX,
+                self.file_path.lstrip("/"),
+            )
+        else:
+            response["X-Sendfile"] = os.path.abspath(self.file_path)
+        return response
+
+    def iter_range(self, start: int, end: int):
+        if self.asynchronous:
+            return aiter_file_range(self.file_path, start, end)
+        return iter_file_range(self.file_path, start, end)
+
+    def file_response(self, request):
+        ranges = self.get_ranges(request)
+        if ranges is None:
+            if self.asynchronous:
+                response = StreamingHttpResponse(
+                    self.iter_range(0, self.size - 1),
+                    content_type=self.content_type,
+                )
+                response["Content-Length"] = self.size
+                return response
+            return FileResponse(
+                open(self.file_path, "rb"), content_type=self.content_type
+            )
+        if not ranges:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = "bytes */{}".format(self.size)
+            return response
+        if len(ranges) == 1:
+            return self.single_range_response(*ranges[0])
+        return self.multi_range_response(ranges)
+
+    def single_range_response(self, start: int, end: int):
+        response = StreamingHttpResponse(
+            self.iter_range(start, end),
+            status=206,
+            content_type=self.content_type,
+        )
+        response["Content-Range"] = "bytes {}-{}/{}".format(
+            start, end, self.size
+        )
+        response["Content-Length"] = end - start + 1
+        return response
+
+    def multi_range_response(self, ranges: list):
+        boundary = uuid.uuid4().hex
+        parts = [
+            (
+                (
+                    "\r\n--{}\r\nContent-Type: {}\r\n"
+                    "Content-Range: bytes {}-{}/{}\r\n\r\n"
+                )
+                .format(boundary, self.content_type, start, end, self.size)
+                .encode("ascii"),
+                start,
+                end,
+            )
+            for start, end in ranges
+        ]
+        closing = "\r\n--{}--\r\n".format(boundary).encode("ascii")
+
+        def stream():
+            for head, start, end in parts:
+                yield head
+                yield from self.iter_range(start, end)
+            yield closing
+
+        async def astream():
+            for head, start, end in parts:
+                yield head
+                async for chunk in self.iter_range(start, end):
+                    yield chunk
+            yield closing
+
+        response = StreamingHttpResponse(
+            astream() if self.asynchronous else stream(),
+            status=206,
+            content_type="multipart/byteranges; boundary={}".format(boundary),
+        )
+        response["Content-Length"] = len(closing) + sum(
+            len(head) + end - start + 1 for head, start, end in parts
+        )
+        return response
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
+import fcntl
+import hashlib
 import os.path
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
 
 EXTENSIONS = (".pdf", ".csv", ".doc", ".xlsx")
 FILE_PATH = "documents"
+BLOB_PATH = "{}/blobs".format(FILE_PATH)
 MAX_SIZE = 2
 
 
@@ -21,22 +26,190 @@ def validate_file_size(file) -> bool:
     return True
 
 
-def create_file_path(file_name: str, project_name: str) -> str:
-    new_file, file_extension = file_name.split(".")
-    file_path = "{}/{}/{}.{}".format(
-        FILE_PATH,
-        project_name.replace(' ', '_'),
-        new_file.replace(' ', '_'),
-        file_extension,
-    )
-    # file_path = os.path.join(FILE_PATH, file_path)
-    return file_path
+def create_blob_path(digest: str) -> str:
+    return "{}/{}/{}".format(BLOB_PATH, digest[:2], digest)
 
 
-def save_file(file, file_path):
-    path = os.path.dirname(Path(file_path))
-    os.makedirs(path, exist_ok=True)
-    with open(file_path, "wb") as new_file:
-        for chunk in file.chunks():
+def hash_chunks(chunks) -> tuple[str, int]:
+    sha256 = hashlib.sha256()
+    size = 0
+    for chunk in chunks:
+        sha256.update(chunk)
+        size += len(chunk)
+    return sha256.hexdigest(), size
+
+
+def write_chunks(chunks, file_path: str) -> None:
+    # Write next to the target and rename, so readers never see half a blob.
+    os.makedirs(os.path.dirname(Path(file_path)), exist_ok=True)
+    tmp_path = "{}.{}.tmp".format(file_path, uuid.uuid4().hex)
+    with open(tmp_path, "wb") as new_file:
+        for chunk in chunks:
             new_file.write(chunk)
-    return file_path
+    os.replace(tmp_path, file_path)
+
+
+def save_file(file) -> tuple[str, str]:
+    """
+    Stores an uploaded file under its sha256 digest and returns the digest
+    and the blob path. The first pass only reads the upload, which Django
+    keeps in memory or in its own temporary file, so content that is
+    already stored is never written again.
+    """
+    digest, _ = hash_chunks(file.chunks())
+    file_path = create_blob_path(digest)
+    if not os.path.exists(file_path):
+        write_chunks(file.chunks(), file_path)
+    return digest, file_path
+
+
+# Chunked uploads: files up to MAX_CHUNKED_SIZE Mb are streamed into a
+# ".part" file next to the documents and moved into place on finalize.
+MAX_CHUNKED_SIZE = 512
+UPLOAD_PATH = os.path.join(FILE_PATH, ".uploads")
+READ_SIZE = 64 * 1024
+SIGNATURES = {
+    ".pdf": (b"%PDF",),
+    ".xlsx": (b"PK\x03\x04",),
+    ".doc": (b"\xd0\xcf\x11\xe0",),
+}
+# Bytes a file needs before its signature can be checked.
+SIGNATURE_SIZE = max(
+    len(signature) for options in SIGNATURES.values() for signature in options
+)
+
+
+class UploadSizeError(Exception):
+    pass
+
+
+class UploadSignatureError(Exception):
+    pass
+
+
+class UploadBusyError(Exception):
+    pass
+
+
+def validate_chunked_size(size: int) -> bool:
+    return 0 < size <= MAX_CHUNKED_SIZE * 1024**2
+
+
+def validate_file_signature(
+    file_name: str, head: bytes, partial: bool = False
+) -> bool:
+    """
+    Whether ``head`` starts with a signature of the file's extension;
+    a ``partial`` head, more of which is still to come, only has to be
+    the start of one.
+    """
+    signatures = SIGNATURES.get(Path(file_name).suffix)
+    if signatures is None:
+        return True
+    if partial:
+        return any(signature.startswith(head) for signature in signatures)
+    return head.startswith(signatures)
+
+
+def check_head(upload, head: bytes, chunk: bytes, end: int) -> bytes | None:
+    """
+    Adds ``chunk``, whose last byte is at ``end``, to the upload's first
+    bytes and checks them. Returns them while they are still too short
+    for the signature, ``None`` once it was checked.
+    """
+    head += chunk[: SIGNATURE_SIZE - len(head)]
+    partial = len(head) < SIGNATURE_SIZE and end < upload.size
+    if not validate_file_signature(upload.file_name, head, partial):
+        raise UploadSignatureError()
+    return head if partial else None
+
+
+def create_upload_path(upload_id) -> str:
+    return os.path.join(UPLOAD_PATH, "{}.part".format(upload_id))
+
+
+def create_lock_path(upload_id) -> str:
+    return os.path.join(UPLOAD_PATH, "{}.lock".format(upload_id))
+
+
+@contextmanager
+def lock_upload(upload_id):
+    """
+    Lets one request at a time append to an upload: another one raises
+    ``UploadBusyError`` instead of waiting. The lock is the OS's, not a
+    database one, so no transaction stays open while a client sends its
+    chunk, and it is released when its process dies.
+    """
+    os.makedirs(UPLOAD_PATH, exist_ok=True)
+    with open(create_lock_path(upload_id), "wb") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise UploadBusyError()
+        # Closing the file releases the lock.
+        yield
+
+
+def append_chunk(upload, stream) -> int:
+    """
+    Writes ``stream`` into the upload's part file at ``upload.received``
+    and returns the number of bytes written.
+
+    Bytes are checked as they arrive: the declared size can't be exceeded
+    and the first bytes of the file must match its extension.
+    """
+    if stream is None:
+        return 0
+    part_path = create_upload_path(upload.pk)
+    os.makedirs(UPLOAD_PATH, exist_ok=True)
+    written = 0
+    mode = "r+b" if os.path.exists(part_path) else "w+b"
+    with open(part_path, mode) as part:
+        # The signature is checked once enough bytes arrived, which may
+        # take more than one chunk.
+        head = None
+        if upload.received < SIGNATURE_SIZE:
+            head = part.read(upload.received)
+        # Drop any tail a dropped connection left behind.
+        part.seek(upload.received)
+        part.truncate()
+        while chunk := stream.read(READ_SIZE):
+            end = upload.received + written + len(chunk)
+            if end > upload.size:
+                raise UploadSizeError()
+            if head is not None:
+                head = check_head(upload, head, chunk, end)
+            part.write(chunk)
+            written += len(chunk)
+    return written
+
+
+def read_chunks(file_path: str):
+    with open(file_path, "rb") as source:
+        while chunk := source.read(READ_SIZE):
+            yield chunk
+
+
+def store_upload(upload_id) -> tuple[str, str]:
+    """
+    Moves a complete upload's part file to its blob path and returns the
+    digest and the blob path. Run it under ``lock_upload``, outside any
+    transaction: hashing a large upload takes a while.
+    """
+    part_path = create_upload_path(upload_id)
+    digest, _ = hash_chunks(read_chunks(part_path))
+    file_path = create_blob_path(digest)
+    if os.path.exists(file_path):
+        os.remove(part_path)
+    else:
+        os.makedirs(os.path.dirname(Path(file_path)), exist_ok=True)
+        os.replace(part_path, file_path)
+    return digest, file_path
+
+
+def discard_upload(upload_id) -> None:
+    for path in (create_upload_path(upload_id), create_lock_path(upload_id)):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
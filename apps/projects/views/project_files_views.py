@@ -1,24 +1,41 @@
 # -*- coding: utf-8 -*-
 from django.http import FileResponse
+from django.utils import timezone
+from django.shortcuts import aget_object_or_404
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.generics import ListCreateAPIView, get_object_or_404
+from rest_framework.exceptions import NotFound
 from rest_framework.views import APIView
 
-from apps.projects.models import Project, ProjectFile
+from apps.jobs.utils.responses import enqueue_for, prefers_async
+from apps.projects.models import FileUpload, Project, ProjectFile
 from apps.projects.serializers.project_file_serializers import (
     CreateProjectFileSerializer,
     AllProjectFileSerializer,
+    FileUploadSerializer,
+    FinalizeFileUploadSerializer,
 )
+from apps.projects.utils.download_file_helper import FileDownload
+from apps.projects.utils.upload_file_helper import (
+    UploadBusyError,
+    UploadSignatureError,
+    UploadSizeError,
+    append_chunk,
+    discard_upload,
+    lock_upload,
+)
+from apps.utils.async_views import AsyncAPIView
 
 
 class ProjectFileListGenericView(ListCreateAPIView):
     def get_queryset(self):
         project_name = self.request.query_params.get("project_name")
+        project_files = ProjectFile.objects.all()
         if project_name:
-            return ProjectFile.objects.filter(project__name=project_name)
-        return ProjectFile.objects.all()
+            project_files = project_files.filter(project__name=project_name)
+        return project_files
 
     def get_serializer_class(self, *args, **kwargs):
         if self.request.method == 'GET':
@@ -29,8 +46,10 @@ class ProjectFileListGenericView(ListCreateAPIView):
         project_files = self.get_queryset()
         if not project_files.exists():
             return Response(data=[], status=status.HTTP_204_NO_CONTENT)
-        serializer = self.get_serializer(project_files, many=True)
-        return Response(data=serializer.data, status=status.HTTP_200_OK)
+        data = AllProjectFileSerializer.represent_values(
+            AllProjectFileSerializer.values_queryset(project_files)
+        )
+        return Response(data=data, status=status.HTTP_200_OK)
 
     def post(self, request: Request, *args, **kwargs) -> Response:
         file = request.FILES.get("file", None)
@@ -57,6 +76,133 @@ class ProjectFileDownloadApiView(APIView):
             ProjectFile, pk=self.kwargs.get("pk")
         )
 
-        file = project_object.file_path.open()
-        response = FileResponse(file, as_attachment=True)
-        return response
+        try:
+            download = FileDownload(
+                file_path=project_object.file_path.name,
+                file_name=project_object.file_name,
+                digest=project_object.blob_id,
+            )
+        except FileNotFoundError:
+            raise NotFound("File is missing from the storage")
+        return download.build_response(request)
+
+
+class ProjectFileDownloadAsyncView(AsyncAPIView):
+    async def get(self, request: Request, *args, **kwargs):
+        project_object = await aget_object_or_404(
+            ProjectFile, pk=self.kwargs.get("pk")
+        )
+
+        try:
+            download = FileDownload(
+                file_path=project_object.file_path.name,
+                file_name=project_object.file_name,
+                digest=project_object.blob_id,
+                asynchronous=True,
+            )
+        except FileNotFoundError:
+            raise NotFound("File is missing from the storage")
+        return download.build_response(request)
+
+
+class FileUploadCreateAPIView(APIView):
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        serializer = FileUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        return Response(data=serializer.data, status=status.HTTP_201_CREATED)
+
+
+class FileUploadDetailAPIView(APIView):
+    def get_object(self):
+        return get_object_or_404(FileUpload, pk=self.kwargs.get("upload_id"))
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        upload = self.get_object()
+        serializer = FileUploadSerializer(upload)
+
+        return Response(data=serializer.data, status=status.HTTP_200_OK)
+
+    def patch(self, request: Request, *args, **kwargs) -> Response:
+        upload = self.get_object()
+        offset = request.headers.get("Upload-Offset")
+        try:
+            with lock_upload(upload.pk):
+                # Only the lock holder moves the offset, so it is read
+                # again once the lock is held.
+                upload.refresh_from_db(fields=["received"])
+                if offset != str(upload.received):
+                    return self.offset_conflict(upload)
+                return self.append(request, upload)
+        except UploadBusyError:
+            return self.offset_conflict(upload)
+
+    def append(self, request: Request, upload: FileUpload) -> Response:
+        # The body is read outside any transaction; the offset is then
+        # moved with one UPDATE.
+        try:
+            received = upload.received + append_chunk(upload, request.stream)
+        except UploadSizeError:
+            return Response(
+                data={"message": "Chunk exceeds the declared file size"},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        except UploadSignatureError:
+            return Response(
+                data={"message": "File content does not match extension"},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            )
+        updated = FileUpload.objects.filter(pk=upload.pk).update(
+            received=received, updated_at=timezone.now()
+        )
+        if not updated:
+            # Cancelled while the chunk was sent.
+            discard_upload(upload.pk)
+            raise NotFound()
+        return Response(data={"offset": received}, status=status.HTTP_200_OK)
+
+    def offset_conflict(self, upload: FileUpload) -> Response:
+        return Response(
+            data={"offset": upload.received}, status=status.HTTP_409_CONFLICT
+        )
+
+    def delete(self, request: Request, *args, **kwargs) -> Response:
+        upload = self.get_object()
+        upload_id = upload.pk
+        upload.delete()
+        discard_upload(upload_id)
+
+        return Response(
+            data={"message": "Upload cancelled"}, status=status.HTTP_200_OK
+        )
+
+
+class FileUploadFinalizeAPIView(APIView):
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        upload = get_object_or_404(
+            FileUpload.objects.select_related("project"),
+            pk=self.kwargs.get("upload_id"),
+        )
+        serializer = FinalizeFileUploadSerializer(upload, data={})
+        serializer.is_valid(raise_exception=True)
+        if prefers_async(request):
+            # Hashing a large upload can outlast the request timeout.
+            return enqueue_for(
+                request,
+                "projects.finalize_upload",
+                {"upload_id": str(upload.pk)},
+                idempotency_key=str(upload.pk),
+            )
+        try:
+            project_file = serializer.save()
+        except UploadBusyError:
+            return Response(
+                data={"message": "Upload is being written, retry later"},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        return Response(
+            data=AllProjectFileSerializer(project_file).data,
+            status=status.HTTP_201_CREATED,
+        )
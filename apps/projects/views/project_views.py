@@ -2,20 +2,25 @@
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from django.utils import timezone
 from datetime import datetime
 from rest_framework.generics import get_object_or_404
 
 from apps.projects.models import Project
+from apps.tasks.utils.task_stats import project_stats
+from apps.utils.async_views import AsyncAPIView
+from apps.utils.response_cache import acache_response, cache_response
 from apps.projects.serializers.project_serializers import (
     CreateUpdateProjectSerializer,
     AllProjectsSerializer,
     ProjectDetailSerializer,
+    ProjectStatsQuerySerializer,
 )
 
 
-class ProjectListAPIView(APIView):
+class ProjectFilterMixin:
     def get_objects(self, date_from=None, date_to=None):
         if date_from:
             date_from = timezone.make_aware(
@@ -35,15 +40,20 @@ class ProjectListAPIView(APIView):
             return projects
         return Project.objects.all()
 
+
+class ProjectListAPIView(ProjectFilterMixin, APIView):
+    @cache_response('projects.Project')
     def get(self, request: Request) -> Response:
         date_from = request.query_params.get('date_from')
         date_to = request.query_params.get('date_to')
         projects = self.get_objects(date_from, date_to)
         if not projects.exists():
             return Response(data=[], status=status.HTTP_204_NO_CONTENT)
-        serializer = AllProjectsSerializer(projects, many=True)
+        data = AllProjectsSerializer.represent_values(
+            AllProjectsSerializer.values_queryset(projects)
+        )
 
-        return Response(data=serializer.data, status=status.HTTP_200_OK)
+        return Response(data=data, status=status.HTTP_200_OK)
 
     def post(self, request: Request) -> Response:
         serializer = CreateUpdateProjectSerializer(data=request.data)
@@ -58,6 +68,24 @@ class ProjectListAPIView(APIView):
         )
 
 
+class ProjectListAsyncView(ProjectFilterMixin, AsyncAPIView):
+    sync_view = ProjectListAPIView
+
+    @acache_response('projects.Project')
+    async def get(self, request: Request) -> Response:
+        date_from = request.query_params.get('date_from')
+        date_to = request.query_params.get('date_to')
+        projects = AllProjectsSerializer.values_queryset(
+            self.get_objects(date_from, date_to)
+        )
+        projects = [project async for project in projects]
+        if not projects:
+            return Response(data=[], status=status.HTTP_204_NO_CONTENT)
+        data = AllProjectsSerializer.represent_values(projects)
+
+        return Response(data=data, status=status.HTTP_200_OK)
+
+
 class ProjectDetailAPIView(APIView):
 
     def get_object(self):
@@ -85,9 +113,28 @@ class ProjectDetailAPIView(APIView):
 
     def delete(self, request: Request, *args, **kwargs) -> Response:
         project = self.get_object()
-        project.delete()
+        # Its tasks are hidden with it; purge_deleted removes the rows.
+        project.soft_delete()
 
         return Response(
             data={'message': 'Project deleted successfully'},
             status=status.HTTP_200_OK,
         )
+
+
+class ProjectStatsAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        project = get_object_or_404(
+            Project.objects.only('pk'), pk=self.kwargs.get('pk')
+        )
+        serializer = ProjectStatsQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        return Response(
+            data=project_stats(
+                project.pk, days=serializer.validated_data['days']
+            ),
+            status=status.HTTP_200_OK,
+        )
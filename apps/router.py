@@ -5,4 +5,6 @@ urlpatterns = [
     path('tasks/', include('apps.tasks.urls')),
     path('projects/', include('apps.projects.urls')),
     path('users/', include('apps.users.urls')),
+    path('search/', include('apps.search.urls')),
+    path('jobs/', include('apps.jobs.urls')),
 ]
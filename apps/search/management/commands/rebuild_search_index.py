@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.search.utils.search_index import (
+    BATCH_SIZE,
+    get_index,
+    rebuild_index,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the full-text search index from the tasks and projects. "
+        "Signals keep it current afterwards; run it after bulk loads that "
+        "bypass them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        with transaction.atomic():
+            counts = rebuild_index(options["batch_size"])
+        self.stdout.write(
+            "Indexed {} in {:.1f}s with {}.".format(
+                ", ".join(
+                    "{} {}s".format(count, kind)
+                    for kind, count in counts.items()
+                ),
+                time.perf_counter() - start,
+                type(get_index()).__name__,
+            )
+        )
@@ -0,0 +1,65 @@
+# Generated by Django 5.0 on 2026-10-18 12:12
+
+from django.db import migrations, models
+
+CREATE_FTS_TABLE = (
+    "CREATE VIRTUAL TABLE search_fts USING fts5(name, description, "
+    "prefix='3', tokenize='unicode61 remove_diacritics 2')"
+)
+DROP_FTS_TABLE = 'DROP TABLE IF EXISTS search_fts'
+
+
+def uses_fts5(connection):
+    # SQLite only; other backends search the SearchTerm table.
+    if connection.vendor != 'sqlite':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA compile_options')
+        return ('ENABLE_FTS5',) in cursor.fetchall()
+
+
+def create_fts_table(apps, schema_editor):
+    if uses_fts5(schema_editor.connection):
+        schema_editor.execute(CREATE_FTS_TABLE)
+
+
+def drop_fts_table(apps, schema_editor):
+    if uses_fts5(schema_editor.connection):
+        schema_editor.execute(DROP_FTS_TABLE)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchTerm',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('term', models.CharField(db_index=True, max_length=40)),
+                ('kind', models.CharField(max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('weight', models.FloatField()),
+            ],
+            options={
+                'indexes': [
+                    models.Index(
+                        fields=['kind', 'object_id'],
+                        name='search_document_idx',
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(create_fts_table, drop_fts_table),
+    ]
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+from django.db import models
+
+
+class SearchTerm(models.Model):
+    """
+    One posting of the portable inverted index: ``term`` occurs in the
+    ``kind`` document ``object_id``, which it ranks by ``weight``.
+    """
+
+    # db_index also creates the pattern-ops index PostgreSQL needs for
+    # prefix (LIKE 'abc%') lookups.
+    term = models.CharField(max_length=40, db_index=True)
+    kind = models.CharField(max_length=20)
+    object_id = models.PositiveBigIntegerField()
+    weight = models.FloatField()
+
+    def __str__(self):
+        return f'{self.term}: {self.kind} {self.object_id}'
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['kind', 'object_id'], name='search_document_idx'
+            ),
+        ]
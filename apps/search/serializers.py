@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+from rest_framework import serializers
+
+from apps.search.utils.search_index import KINDS
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=200)
+    type = serializers.ChoiceField(choices=list(KINDS), required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=20)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from django.db.models.signals import post_delete, post_save
+
+from apps.search.utils.search_index import (
+    FIELDS,
+    KINDS,
+    get_kind,
+    get_model,
+    index_objects,
+    remove_matching,
+    remove_objects,
+)
+
+# Saves that touch none of these leave the document unchanged.
+WATCHED_FIELDS = {*FIELDS, 'deleted_at'}
+
+
+def index_document(sender, instance, created, raw, update_fields, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not WATCHED_FIELDS & set(update_fields):
+        return
+    if instance.deleted_at is not None:
+        remove_objects(get_kind(sender), [instance.pk])
+        return
+    index_objects(get_kind(sender), [instance], new=created)
+
+
+def remove_project_tasks(sender, instance, raw, update_fields, **kwargs):
+    # The tasks of a soft deleted project are hidden with it, so they
+    # leave the index with it too.
+    if raw or instance.deleted_at is None:
+        return
+    if update_fields is not None and 'deleted_at' not in update_fields:
+        return
+    remove_matching(
+        'task', get_model('task').all_objects.filter(project=instance)
+    )
+
+
+def remove_document(sender, instance, **kwargs):
+    # Soft deleted rows left the index when they were deleted.
+    if instance.deleted_at is None:
+        remove_objects(get_kind(sender), [instance.pk])
+
+
+for kind in KINDS:
+    model = get_model(kind)
+    post_save.connect(
+        index_document, sender=model, dispatch_uid=f'search_index_{kind}'
+    )
+    post_delete.connect(
+        remove_document, sender=model, dispatch_uid=f'search_remove_{kind}'
+    )
+
+post_save.connect(
+    remove_project_tasks,
+    sender=get_model('project'),
+    dispatch_uid='search_remove_project_tasks',
+)
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+from apps.projects.models import Project
+from apps.search.models import SearchTerm
+from apps.search.utils import search_index
+from apps.search.utils.search_index import (
+    FTS5Index,
+    TermIndex,
+    parse_query,
+    search,
+)
+from apps.tasks.models import Task
+from apps.tasks.utils.bulk_tasks import bulk_create_tasks
+from apps.users.models import User
+
+
+class TestSearchIndex(APITestCase):
+    url = '/api/v1/search/'
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='search_user',
+            email='search@example.com',
+            password='search-password',
+            first_name='Search',
+            last_name='User',
+            position='QA',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.project = Project.objects.create(
+            name='Deployment Pipeline',
+            description='Release automation for every service we run.',
+        )
+        self.title_hit = self.create_task(
+            'Deploy the billing service',
+            'Roll the new version out to production.',
+        )
+        self.body_hit = self.create_task(
+            'Release checklist',
+            'Write down how we deploy and roll back a release.',
+        )
+        self.create_task(
+            'Fix login form', 'The submit button does nothing on Safari.'
+        )
+
+    def create_task(self, name: str, description: str) -> Task:
+        return Task.objects.create(
+            name=name, description=description, project=self.project
+        )
+
+    def hits(self, query: str, **kwargs) -> list[tuple[str, int]]:
+        return [(hit.kind, hit.pk) for hit in search(query, **kwargs)]
+
+    def test_uses_fts5_on_sqlite(self):
+        if connection.vendor == 'sqlite' and search_index.sqlite_has_fts5():
+            self.assertIsInstance(search_index.get_index(), FTS5Index)
+        else:
+            self.assertIsInstance(search_index.get_index(), TermIndex)
+
+    def test_parse_query(self):
+        self.assertEqual(
+            parse_query('Deploy to "prod"! deploy'),
+            [('deploy', False), ('to', False), ('prod', True)],
+        )
+        self.assertEqual(parse_query('*** ---'), [])
+
+    def test_prefix_match_ranks_titles_first(self):
+        self.assertEqual(
+            self.hits('depl'),
+            [
+                ('project', self.project.pk),
+                ('task', self.title_hit.pk),
+                ('task', self.body_hit.pk),
+            ],
+        )
+
+    def test_every_term_must_match(self):
+        self.assertEqual(
+            self.hits('deploy production'), [('task', self.title_hit.pk)]
+        )
+        self.assertEqual(self.hits('deploy safari'), [])
+
+    def test_short_terms_match_whole_words(self):
+        self.assertEqual(self.hits('de'), [])
+
+    def test_kind_filter_and_limit(self):
+        self.assertEqual(
+            self.hits('deploy', kind='task', limit=1),
+            [('task', self.title_hit.pk)],
+        )
+        self.assertEqual(
+            self.hits('automation', kind='project'),
+            [('project', self.project.pk)],
+        )
+
+    def test_signals_keep_the_index_current(self):
+        self.body_hit.description = 'Write down the release steps.'
+        self.body_hit.save()
+        self.assertNotIn(('task', self.body_hit.pk), self.hits('deploy'))
+
+        # Saves that don't touch the indexed fields leave it alone.
+        with self.assertNumQueries(1):
+            self.body_hit.save(update_fields=['updated_at'])
+
+        self.title_hit.delete()
+        self.assertEqual(self.hits('billing'), [])
+
+        self.project.delete()
+        self.assertEqual(self.hits('deploy'), [])
+
+    def test_soft_deleted_project_takes_its_tasks_along(self):
+        other = Project.objects.create(
+            name='Billing',
+            description='Invoices and payments for every customer we have.',
+        )
+        kept = Task.objects.create(
+            name='Deploy the invoice service',
+            description='Ship the invoices to production.',
+            project=other,
+        )
+
+        self.project.soft_delete()
+
+        self.assertEqual(self.hits('deploy', kind='task'), [('task', kept.pk)])
+
+    def test_bulk_created_tasks_are_indexed(self):
+        ids = bulk_create_tasks(
+            [
+                {
+                    'name': f'Imported migration {index}',
+                    'description': (
+                        'Imported from the old tracker with its full history.'
+                    ),
+                    'priority': 3,
+                    'project': self.project.name,
+                }
+                for index in range(3)
+            ]
+        )
+        self.assertEqual(
+            sorted(pk for _, pk in self.hits('imported tracker')), ids
+        )
+
+    def test_rebuild_command(self):
+        search_index.get_index().clear()
+        self.assertEqual(self.hits('deploy'), [])
+
+        call_command('rebuild_search_index', stdout=mock.Mock())
+
+        self.assertEqual(len(self.hits('deploy')), 3)
+
+    def test_search_endpoint(self):
+        response = self.client.get(self.url, {'q': 'deploy', 'type': 'task'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data['results']
+        self.assertEqual(
+            [(item['type'], item['id']) for item in results],
+            [('task', self.title_hit.pk), ('task', self.body_hit.pk)],
+        )
+        self.assertEqual(results[0]['name'], self.title_hit.name)
+        self.assertGreater(results[0]['score'], results[1]['score'])
+
+    def test_search_endpoint_validation(self):
+        response = self.client.get(self.url, {'type': 'user'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data), {'q', 'type'})
+
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.url, {'q': 'deploy'})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TestTermIndexSearch(TestSearchIndex):
+    """The same behaviour from the portable index other backends use."""
+
+    def setUp(self) -> None:
+        patcher = mock.patch.object(
+            search_index, 'get_index', return_value=TermIndex()
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+    def test_uses_fts5_on_sqlite(self):
+        self.assertTrue(SearchTerm.objects.filter(term='deploy').exists())
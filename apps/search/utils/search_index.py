@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+import math
+import re
+import sqlite3
+from collections import Counter, defaultdict
+from functools import cache, reduce
+from itertools import islice
+from operator import or_
+from typing import NamedTuple
+
+from django.apps import apps
+from django.db import connection
+from django.db.models import Case, F, IntegerField, Max, Q, Sum, When
+
+from apps.search.models import SearchTerm
+
+# Searchable document kinds and the model each one indexes.
+KINDS = {
+    'task': 'tasks.Task',
+    'project': 'projects.Project',
+}
+# Every kind is indexed on the same fields, weighted for ranking.
+FIELDS = ('name', 'description')
+WEIGHTS = (5.0, 1.0)
+
+TOKEN_RE = re.compile(r'[^\W_]+')
+MAX_TERM_LENGTH = 40
+MAX_QUERY_TERMS = 8
+# Shorter terms only match whole words: a one or two letter prefix
+# expands to a large part of the index.
+MIN_PREFIX_LENGTH = 3
+# bm25 costs about 2µs per matching document; queries matching more than
+# this only rank the newest ones.
+MAX_RANKED = 5000
+BATCH_SIZE = 1000
+
+FTS_TABLE = 'search_fts'
+# FTS5 rowids pack the kind into the low bits: pk * STRIDE + code.
+ROWID_STRIDE = 8
+KIND_CODES = {'task': 1, 'project': 2}
+CREATE_FTS_TABLE = (
+    "CREATE VIRTUAL TABLE {} USING fts5({}, prefix='3', "
+    "tokenize='unicode61 remove_diacritics 2')"
+).format(FTS_TABLE, ', '.join(FIELDS))
+DROP_FTS_TABLE = 'DROP TABLE IF EXISTS {}'.format(FTS_TABLE)
+
+
+class Hit(NamedTuple):
+    kind: str
+    pk: int
+    score: float
+
+
+def get_model(kind: str):
+    return apps.get_model(KINDS[kind])
+
+
+def get_kind(model) -> str | None:
+    label = model._meta.label
+    return next((kind for kind, name in KINDS.items() if name == label), None)
+
+
+def tokenize(text: str) -> list[str]:
+    return [
+        token
+        for token in TOKEN_RE.findall(text.lower())
+        if len(token) <= MAX_TERM_LENGTH
+    ]
+
+
+def parse_query(query: str) -> list[tuple[str, bool]]:
+    """
+    Returns the ``(term, is_prefix)`` pairs of a query; every term must
+    match. The last term is the one still being typed and matches as a
+    prefix, so "deploy" also finds "deployment". Earlier terms match
+    whole words: a prefix of a common word expands to many long posting
+    lists, which made queries two orders of magnitude slower.
+    """
+    terms = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
+    return [
+        (term, term == terms[-1] and len(term) >= MIN_PREFIX_LENGTH)
+        for term in terms
+    ]
+
+
+def document(instance) -> list[str]:
+    return [getattr(instance, field) or '' for field in FIELDS]
+
+
+def term_weights(values: list[str]) -> Counter:
+    # Log-scaled term frequency, normalised by the field length.
+    weights = Counter()
+    for value, field_weight in zip(values, WEIGHTS):
+        tokens = tokenize(value)
+        if not tokens:
+            continue
+        norm = field_weight / math.sqrt(len(tokens))
+        for term, count in Counter(tokens).items():
+            weights[term] += norm * (1 + math.log(count))
+    return weights
+
+
+@cache
+def sqlite_has_fts5() -> bool:
+    # Django's SQLite backend runs on the stdlib module's library.
+    with sqlite3.connect(':memory:') as memory:
+        options = memory.execute('PRAGMA compile_options').fetchall()
+    return ('ENABLE_FTS5',) in options
+
+
+def uses_fts5(db_connection) -> bool:
+    return db_connection.vendor == 'sqlite' and sqlite_has_fts5()
+
+
+class TermIndex:
+    """
+    Inverted index in the ``SearchTerm`` table, for backends without a
+    full-text engine: one row per term and document, prefix lookups on
+    the term index and ranking by the summed term weights.
+    """
+
+    def index(self, kind: str, instances: list, new: bool = False) -> None:
+        if not new:
+            self.remove(kind, [instance.pk for instance in instances])
+        SearchTerm.objects.bulk_create(
+            (
+                SearchTerm(
+                    term=term, kind=kind, object_id=instance.pk, weight=weight
+                )
+                for instance in instances
+                for term, weight in term_weights(document(instance)).items()
+            ),
+            batch_size=BATCH_SIZE,
+        )
+
+    def remove(self, kind: str, pks: list[int]) -> None:
+        SearchTerm.objects.filter(kind=kind, object_id__in=pks).delete()
+
+    def remove_matching(self, kind: str, queryset) -> None:
+        SearchTerm.objects.filter(
+            kind=kind, object_id__in=queryset.values('pk')
+        ).delete()
+
+    def clear(self) -> None:
+        SearchTerm.objects.all().delete()
+
+    def search(
+        self, terms: list[tuple[str, bool]], kind: str | None, limit: int
+    ) -> list[Hit]:
+        matches = [
+            Q(term__startswith=term) if prefix else Q(term=term)
+            for term, prefix in terms
+        ]
+        postings = SearchTerm.objects.filter(reduce(or_, matches))
+        if kind:
+            postings = postings.filter(kind=kind)
+        # A document is a hit only when each query term matched one of
+        # its postings.
+        matched = {
+            'matched_{}'.format(index): Max(
+                Case(
+                    When(match, then=1),
+                    default=0,
+                    output_field=IntegerField(),
+                )
+            )
+            for index, match in enumerate(matches)
+        }
+        rows = (
+            postings.values('kind', 'object_id')
+            .annotate(score=Sum('weight'), **matched)
+            .filter(**{name: 1 for name in matched})
+            .order_by('-score', '-object_id')
+            .values_list('kind', 'object_id', 'score')[:limit]
+        )
+        return [Hit(*row) for row in rows]
+
+
+class FTS5Index:
+    """
+    SQLite FTS5 table ranked with bm25. The table has no kind or pk
+    columns: both are packed in the rowid, so updates and deletes are
+    rowid lookups instead of scans.
+    """
+
+    @staticmethod
+    def rowid(kind: str, pk: int) -> int:
+        return pk * ROWID_STRIDE + KIND_CODES[kind]
+
+    def index(self, kind: str, instances: list, new: bool = False) -> None:
+        if not new:
+            self.remove(kind, [instance.pk for instance in instances])
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                'INSERT INTO {} (rowid, {}) VALUES (%s, {})'.format(
+                    FTS_TABLE,
+                    ', '.join(FIELDS),
+                    ', '.join(['%s'] * len(FIELDS)),
+                ),
+                [
+                    (self.rowid(kind, instance.pk), *document(instance))
+                    for instance in instances
+                ],
+            )
+
+    def remove(self, kind: str, pks: list[int]) -> None:
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                'DELETE FROM {} WHERE rowid = %s'.format(FTS_TABLE),
+                [(self.rowid(kind, pk),) for pk in pks],
+            )
+
+    def remove_matching(self, kind: str, queryset) -> None:
+        rowids = (
+            queryset.order_by()
+            .annotate(fts_rowid=F('pk') * ROWID_STRIDE + KIND_CODES[kind])
+            .values_list('fts_rowid')
+        )
+        sql, params = rowids.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'DELETE FROM {} WHERE rowid IN ({})'.format(FTS_TABLE, sql),
+                params,
+            )
+
+    def clear(self) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM {}'.format(FTS_TABLE))
+
+    def search(
+        self, terms: list[tuple[str, bool]], kind: str | None, limit: int
+    ) -> list[Hit]:
+        # Terms are runs of word characters, so quoting them is enough to
+        # keep FTS5 from reading them as operators.
+        match = ' '.join(
+            '"{}"{}'.format(term, '*' if prefix else '')
+            for term, prefix in terms
+        )
+        where = '{} MATCH %s'.format(FTS_TABLE)
+        params = [match]
+        if kind:
+            where += ' AND rowid %% {} = %s'.format(ROWID_STRIDE)
+            params.append(KIND_CODES[kind])
+
+        kinds = {code: name for name, code in KIND_CODES.items()}
+        with connection.cursor() as cursor:
+            # Walking the rowids is cheap, scoring them is not: find where
+            # the newest MAX_RANKED matches start.
+            cursor.execute(
+                'SELECT rowid FROM {} WHERE {} ORDER BY rowid DESC '
+                'LIMIT 1 OFFSET %s'.format(FTS_TABLE, where),
+                [*params, MAX_RANKED],
+            )
+            cutoff = cursor.fetchone()
+            if cutoff is not None:
+                where += ' AND rowid > %s'
+                params.append(cutoff[0])
+            cursor.execute(
+                'SELECT rowid, bm25({}, {}) FROM {} WHERE {} '
+                'ORDER BY 2, 1 DESC LIMIT %s'.format(
+                    FTS_TABLE, ', '.join(map(str, WEIGHTS)), FTS_TABLE, where
+                ),
+                [*params, limit],
+            )
+            return [
+                # bm25 is negative, lower is better.
+                Hit(kinds[rowid % ROWID_STRIDE], rowid // ROWID_STRIDE, -rank)
+                for rowid, rank in cursor.fetchall()
+            ]
+
+
+def get_index() -> TermIndex | FTS5Index:
+    if uses_fts5(connection):
+        return FTS5Index()
+    return TermIndex()
+
+
+def index_objects(kind: str, instances: list, new: bool = False) -> None:
+    """
+    Adds or replaces the documents of ``instances``; ``new`` skips the
+    removal of previous versions, for freshly inserted rows.
+    """
+    if instances:
+        get_index().index(kind, instances, new=new)
+
+
+def remove_objects(kind: str, pks: list[int]) -> None:
+    if pks:
+        get_index().remove(kind, pks)
+
+
+def remove_matching(kind: str, queryset) -> None:
+    """
+    Removes the documents of the rows of ``queryset`` in one query,
+    without loading their primary keys.
+    """
+    get_index().remove_matching(kind, queryset)
+
+
+def rebuild_index(batch_size: int = BATCH_SIZE) -> dict:
+    search_index = get_index()
+    search_index.clear()
+    counts = {}
+    for kind in KINDS:
+        rows = get_model(kind).objects.only(*FIELDS).order_by()
+        iterator = rows.iterator(chunk_size=batch_size)
+        counts[kind] = 0
+        while batch := list(islice(iterator, batch_size)):
+            search_index.index(kind, batch, new=True)
+            counts[kind] += len(batch)
+    return counts
+
+
+def search(query: str, kind: str | None = None, limit: int = 20) -> list[Hit]:
+    terms = parse_query(query)
+    if not terms:
+        return []
+    return get_index().search(terms, kind, limit)
+
+
+def describe_hits(hits: list[Hit]) -> list[dict]:
+    """
+    Loads the names of the hits, one query per kind. Hits whose row is
+    gone are dropped.
+    """
+    pks = defaultdict(list)
+    for hit in hits:
+        pks[hit.kind].append(hit.pk)
+    names = {}
+    for kind, kind_pks in pks.items():
+        rows = get_model(kind).objects.filter(pk__in=kind_pks).order_by()
+        for pk, name in rows.values_list('pk', 'name'):
+            names[(kind, pk)] = name
+    return [
+        {
+            'type': hit.kind,
+            'id': hit.pk,
+            'name': names[(hit.kind, hit.pk)],
+            'score': hit.score,
+        }
+        for hit in hits
+        if (hit.kind, hit.pk) in names
+    ]
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.search.serializers import SearchQuerySerializer
+from apps.search.utils.search_index import describe_hits, search
+
+
+class SearchAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request: Request) -> Response:
+        serializer = SearchQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+        hits = search(params['q'], params.get('type'), params['limit'])
+        return Response(
+            data={'results': describe_hits(hits)}, status=status.HTTP_200_OK
+        )
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from enum import Enum
+from functools import cache
 
 
 class Priorities(Enum):
@@ -10,8 +11,9 @@ class Priorities(Enum):
     CRITICAL = (5, "Critical")
 
     @classmethod
-    def choices(cls):
-        return [(attr.value[0], attr.value[1]) for attr in cls]
+    @cache
+    def choices(cls) -> tuple:
+        return tuple((attr.value[0], attr.value[1]) for attr in cls)
 
     def __getitem__(self, item):
         return self.value[item]
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from enum import Enum
+from functools import cache
 
 
 class Statuses(Enum):
@@ -11,5 +12,6 @@ class Statuses(Enum):
     CLOSED = "Closed"
 
     @classmethod
-    def choices(cls):
-        return [(attr.name, attr.value) for attr in cls]
+    @cache
+    def choices(cls) -> tuple:
+        return tuple((attr.name, attr.value) for attr in cls)
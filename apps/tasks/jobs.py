@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from rest_framework import serializers
+
+from apps.jobs.utils.queue import JobError, register
+from apps.tasks.utils.bulk_tasks import (
+    BulkTaskError,
+    bulk_create_tasks,
+    bulk_update_tasks,
+)
+
+
+@register('tasks.bulk_create')
+def bulk_create(rows: list) -> dict:
+    try:
+        task_ids = bulk_create_tasks(rows)
+    except BulkTaskError as exc:
+        raise JobError(exc.errors)
+    except serializers.ValidationError as exc:
+        raise JobError(exc.detail)
+    return {'created': len(task_ids), 'ids': task_ids}
+
+
+@register('tasks.bulk_update')
+def bulk_update(rows: list) -> dict:
+    try:
+        updated = bulk_update_tasks(rows)
+    except BulkTaskError as exc:
+        raise JobError(exc.errors)
+    except serializers.ValidationError as exc:
+        raise JobError(exc.detail)
+    return {'updated': updated}
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.tasks.utils.purge_deleted import BATCH_SIZE, purge_deleted
+
+
+class Command(BaseCommand):
+    help = (
+        "Hard deletes soft deleted tasks, projects and users in small "
+        "batches, so no transaction holds its locks for long. Run it "
+        "periodically."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-hours",
+            type=int,
+            default=24,
+            help="Keep rows deleted more recently than this.",
+        )
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        before = timezone.now() - timedelta(hours=options["grace_hours"])
+        counts = purge_deleted(before, batch_size=options["batch_size"])
+        self.stdout.write(
+            "Purged {tasks} tasks, {projects} projects and {users} users "
+            "in {elapsed:.1f}s.".format(
+                elapsed=time.perf_counter() - start, **counts
+            )
+        )
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.tasks.utils.task_stats import rebuild_task_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the project task statistics from scratch. Task signals "
+        "keep them current afterwards; run it after writes that bypass "
+        "them, such as queryset updates."
+    )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        counters = rebuild_task_stats()
+        self.stdout.write(
+            "Rebuilt {} counters in {:.1f}s.".format(
+                counters, time.perf_counter() - start
+            )
+        )
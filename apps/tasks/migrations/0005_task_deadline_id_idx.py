@@ -0,0 +1,20 @@
+# Generated by Django 5.0 on 2026-10-18 11:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_projectfile_project_files'),
+        ('tasks', '0004_alter_task_priority_alter_task_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['-deadline', '-id'], name='task_deadline_id_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.0 on 2026-10-18 11:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_hot_filter_indexes'),
+        ('tasks', '0005_task_deadline_id_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(
+                fields=['project', '-deadline'],
+                name='task_project_deadline_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(
+                fields=['assignee', 'status'], name='task_assignee_status_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(
+                condition=models.Q(('assignee__isnull', True)),
+                fields=['-deadline'],
+                name='task_unassigned_deadline_idx',
+            ),
+        ),
+    ]
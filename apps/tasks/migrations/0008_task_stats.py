@@ -0,0 +1,60 @@
+# Generated by Django 5.0 on 2026-10-18 12:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_closed_at(apps, schema_editor):
+    # The best guess for tasks closed before closed_at existed.
+    Task = apps.get_model('tasks', 'Task')
+    Task.objects.filter(status='CLOSED').update(closed_at=F('updated_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_hot_filter_indexes'),
+        ('tasks', '0007_tag_name_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='closed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_closed_at, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='TaskStat',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('dimension', models.CharField(max_length=10)),
+                ('key', models.CharField(max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                (
+                    'project',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='task_stats',
+                        to='projects.project',
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='taskstat',
+            constraint=models.UniqueConstraint(
+                fields=('project', 'dimension', 'key'),
+                name='task_stat_unique_key',
+            ),
+        ),
+    ]
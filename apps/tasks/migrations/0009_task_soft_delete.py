@@ -0,0 +1,38 @@
+# Generated by Django 5.0 on 2026-10-18 12:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0007_project_soft_delete'),
+        ('tasks', '0008_task_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_unassigned_deadline_idx',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(
+                condition=models.Q(
+                    ('assignee__isnull', True), ('deleted_at__isnull', True)
+                ),
+                fields=['-deadline'],
+                name='task_live_unassigned_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(
+                condition=models.Q(('deleted_at__isnull', False)),
+                fields=['deleted_at'],
+                name='task_deleted_at_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.0 on 2026-10-18 13:21
+
+from django.db import migrations, models
+
+# What the enum member used as the old default was stored as.
+BROKEN_STATUS = 'Statuses.NEW'
+
+
+def fix_default_status(apps, schema_editor):
+    Task = apps.get_model('tasks', 'Task')
+    TaskStat = apps.get_model('tasks', 'TaskStat')
+    Task._base_manager.filter(status=BROKEN_STATUS).update(status='NEW')
+
+    broken = TaskStat.objects.filter(dimension='status', key=BROKEN_STATUS)
+    for stat in broken:
+        merged, _ = TaskStat.objects.get_or_create(
+            project_id=stat.project_id, dimension='status', key='NEW'
+        )
+        merged.count += stat.count
+        merged.save(update_fields=['count'])
+    broken.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0009_task_soft_delete'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='status',
+            field=models.CharField(
+                choices=[
+                    ('NEW', 'New'),
+                    ('IN_PROGRESS', 'In progress'),
+                    ('PENDING', 'Pending'),
+                    ('BLOCKED', 'Blocked'),
+                    ('TESTING', 'Testing'),
+                    ('CLOSED', 'Closed'),
+                ],
+                default='NEW',
+                max_length=15,
+            ),
+        ),
+        migrations.RunPython(fix_default_status, migrations.RunPython.noop),
+    ]
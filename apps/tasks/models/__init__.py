@@ -1,2 +1,3 @@
 from apps.tasks.models.tag import Tag
 from apps.tasks.models.task import Task
+from apps.tasks.models.task_stat import TaskStat
@@ -7,3 +7,8 @@ class Tag(models.Model):
 
     def __str__(self):
         return self.name
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['name'], name='tag_name_idx'),
+        ]
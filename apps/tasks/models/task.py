@@ -1,21 +1,44 @@
 # -*- coding: utf-8 -*-
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 
 from apps.projects.models import Project
-from apps.tasks.choices.priorities import Priorities
-from apps.tasks.choices.statuses import Statuses
 from apps.tasks.utils.set_date_time import calculate_end_of_month
 from apps.users.models import User
+from apps.utils.soft_delete import (
+    SoftDeleteManager,
+    SoftDeleteModel,
+    SoftDeleteQuerySet,
+)
+from apps.utils.validation import (
+    CLOSED_STATUS,
+    DEFAULT_PRIORITY,
+    DEFAULT_STATUS,
+    PRIORITY_CHOICES,
+    STATUS_CHOICES,
+)
+from apps.utils.versioning import VersionedModel
 
 
-class Task(models.Model):
+class TaskManager(SoftDeleteManager):
+    def get_queryset(self):
+        # Tasks of a deleted project are hidden until the purge reaches
+        # them; the tombstone index keeps the subquery small.
+        return (
+            super()
+            .get_queryset()
+            .exclude(project__in=Project.all_objects.dead().values('pk'))
+        )
+
+
+class Task(SoftDeleteModel, VersionedModel):
     name = models.CharField(max_length=120)
     description = models.TextField()
     status = models.CharField(
-        max_length=15, choices=Statuses.choices(), default=Statuses.NEW
+        max_length=15, choices=STATUS_CHOICES, default=DEFAULT_STATUS
     )
     priority = models.SmallIntegerField(
-        choices=Priorities.choices(), default=Priorities.MEDIUM[0]
+        choices=PRIORITY_CHOICES, default=DEFAULT_PRIORITY
     )
     project = models.ForeignKey(
         Project, on_delete=models.CASCADE, related_name="tasks"
@@ -24,6 +47,7 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
+    closed_at = models.DateTimeField(null=True, blank=True, editable=False)
     deadline = models.DateTimeField(default=calculate_end_of_month)
     assignee = models.ForeignKey(
         User,
@@ -33,9 +57,53 @@ class Task(models.Model):
         null=True,
     )
 
+    objects = TaskManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
     def __str__(self):
         return f"Name: {self.name} | Status: {self.status}"
 
+    def set_closed_at(self) -> None:
+        if self.status != CLOSED_STATUS:
+            self.closed_at = None
+        elif self.closed_at is None:
+            self.closed_at = timezone.now()
+
+    def save(self, *args, update_fields=None, **kwargs):
+        self.set_closed_at()
+        if update_fields is not None and "status" in update_fields:
+            update_fields = {*update_fields, "closed_at"}
+        # The stats signal locks the previous row until the update is
+        # written; savepoint=False as save() already marks the outer
+        # transaction for rollback on errors.
+        with transaction.atomic(savepoint=False):
+            super().save(*args, update_fields=update_fields, **kwargs)
+
     class Meta:
         unique_together = ["name", "project"]
         ordering = ["-deadline"]
+        indexes = [
+            models.Index(
+                fields=["-deadline", "-id"], name="task_deadline_id_idx"
+            ),
+            models.Index(
+                fields=["project", "-deadline"],
+                name="task_project_deadline_idx",
+            ),
+            models.Index(
+                fields=["assignee", "status"], name="task_assignee_status_idx"
+            ),
+            # Partial: only backends with partial index support create them.
+            models.Index(
+                fields=["-deadline"],
+                condition=models.Q(
+                    assignee__isnull=True, deleted_at__isnull=True
+                ),
+                name="task_live_unassigned_idx",
+            ),
+            models.Index(
+                fields=["deleted_at"],
+                condition=models.Q(deleted_at__isnull=False),
+                name="task_deleted_at_idx",
+            ),
+        ]
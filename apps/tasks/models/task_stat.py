@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+from django.db import models
+
+from apps.projects.models import Project
+
+
+class TaskStat(models.Model):
+    """
+    One precomputed task count of a project, e.g. ("status", "NEW") or
+    ("created", "2024-06-30"); kept current by the task signals.
+    """
+
+    STATUS = "status"
+    PRIORITY = "priority"
+    # Open tasks per assignee id ("" for unassigned).
+    ASSIGNEE = "assignee"
+    # Open tasks per deadline day, summed up for the overdue count.
+    DUE = "due"
+    CREATED = "created"
+    CLOSED = "closed"
+
+    project = models.ForeignKey(
+        Project, on_delete=models.CASCADE, related_name="task_stats"
+    )
+    dimension = models.CharField(max_length=10)
+    key = models.CharField(max_length=20)
+    count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.project_id} {self.dimension}={self.key}: {self.count}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "dimension", "key"],
+                name="task_stat_unique_key",
+            ),
+        ]
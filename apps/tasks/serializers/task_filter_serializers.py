@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+from rest_framework import serializers
+
+from apps.utils.validation import PRIORITY_CHOICES, STATUS_CHOICES
+
+# Filters an index can drive the task query from; the others only narrow
+# the rows those indexes return.
+INDEXED_FILTERS = (
+    'project',
+    'assignee',
+    'unassigned',
+    'deadline_after',
+    'deadline_before',
+    'tags',
+)
+NARROWING_FILTERS = ('status', 'priority_min', 'priority_max')
+
+
+class CommaSeparatedListField(serializers.ListField):
+    """
+    Accepts ``?status=NEW,BLOCKED`` as well as repeated parameters.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, str):
+            data = [data]
+        if isinstance(data, list):
+            data = [
+                item.strip()
+                for value in data
+                if isinstance(value, str)
+                for item in value.split(',')
+                if item.strip()
+            ] or data
+        return super().to_internal_value(data)
+
+
+class TaskFilterSerializer(serializers.Serializer):
+    project = serializers.CharField(required=False)
+    assignee = serializers.EmailField(required=False)
+    unassigned = serializers.BooleanField(required=False)
+    status = CommaSeparatedListField(
+        child=serializers.ChoiceField(choices=STATUS_CHOICES),
+        required=False,
+        allow_empty=False,
+    )
+    priority_min = serializers.ChoiceField(
+        choices=PRIORITY_CHOICES, required=False
+    )
+    priority_max = serializers.ChoiceField(
+        choices=PRIORITY_CHOICES, required=False
+    )
+    tags = CommaSeparatedListField(
+        child=serializers.CharField(max_length=20),
+        required=False,
+        allow_empty=False,
+        max_length=10,
+    )
+    tags_match = serializers.ChoiceField(
+        choices=('any', 'all'), required=False
+    )
+    deadline_after = serializers.DateTimeField(required=False)
+    deadline_before = serializers.DateTimeField(required=False)
+
+    def validate(self, attrs: dict) -> dict:
+        if attrs.get('unassigned') and 'assignee' in attrs:
+            raise serializers.ValidationError(
+                'Filter by assignee or unassigned, not both'
+            )
+        if attrs.get('unassigned') is False:
+            # Only "unassigned=true" narrows the list.
+            del attrs['unassigned']
+        if (
+            'deadline_after' in attrs
+            and 'deadline_before' in attrs
+            and attrs['deadline_after'] > attrs['deadline_before']
+        ):
+            raise serializers.ValidationError(
+                'deadline_after must not be later than deadline_before'
+            )
+        if (
+            'priority_min' in attrs
+            and 'priority_max' in attrs
+            and attrs['priority_min'] > attrs['priority_max']
+        ):
+            raise serializers.ValidationError(
+                'priority_min must not be greater than priority_max'
+            )
+        if 'tags_match' in attrs and 'tags' not in attrs:
+            raise serializers.ValidationError('tags_match requires tags')
+
+        # A status or priority filter alone would scan the whole table.
+        if set(NARROWING_FILTERS) & set(attrs) and not (
+            set(INDEXED_FILTERS) & set(attrs)
+        ):
+            raise serializers.ValidationError(
+                'Combine {} with at least one of: {}'.format(
+                    ', '.join(
+                        name for name in NARROWING_FILTERS if name in attrs
+                    ),
+                    ', '.join(INDEXED_FILTERS),
+                )
+            )
+        return attrs
@@ -1,19 +1,25 @@
 # -*- coding: utf-8 -*-
+from django.core.validators import EmailValidator
+from django.db import transaction
 from rest_framework import serializers
+from rest_framework.validators import UniqueTogetherValidator
 from django.utils import timezone
 
 from apps.tasks.models import Task, Tag
 from apps.projects.models import Project
-from apps.tasks.choices.priorities import Priorities
 from apps.projects.serializers.project_serializers import (
     ProjectShortInfoSerializer,
 )
 
+from apps.tasks.utils.task_stats import StatsDelta, tracks
 from apps.users.models import User
+from apps.utils.query_plan import QueryPlanMixin
+from apps.utils.relations import RelationResolver
+from apps.utils.validation import PRIORITIES
+from apps.utils.versioning import VersionConflict
 
 
-
-class AllTasksSerializer(serializers.ModelSerializer):
+class AllTasksSerializer(QueryPlanMixin, serializers.ModelSerializer):
     project = serializers.SlugRelatedField(read_only=True, slug_field='name')
     assignee = serializers.SlugRelatedField(read_only=True, slug_field='email')
 
@@ -27,16 +33,50 @@ class AllTasksSerializer(serializers.ModelSerializer):
             'assignee',
             'deadline',
         )
+        select_related = ('project', 'assignee')
+
+
+class SlugReferenceField(serializers.CharField):
+    """
+    A related row given by its ``slug_field``. The serializer resolves the
+    slug together with its other relations; reads show the slug.
+    """
+
+    def __init__(self, slug_field: str, **kwargs):
+        self.slug_field = slug_field
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return getattr(value, self.slug_field)
+
+
+class TagReferenceField(serializers.Field):
+    default_error_messages = {
+        'invalid': 'Expected a tag id or name.',
+        'max_length': 'Tag names have at most 20 characters.',
+    }
+
+    def to_internal_value(self, data):
+        if isinstance(data, int) and not isinstance(data, bool):
+            return data
+        if isinstance(data, str) and data.strip():
+            if len(data.strip()) > 20:
+                self.fail('max_length')
+            return data.strip()
+        self.fail('invalid')
 
 
 class CreateUpdateTaskSerializer(serializers.ModelSerializer):
-    project = serializers.SlugRelatedField(
-        slug_field='name', queryset=Project.objects.all()
+    project = SlugReferenceField('name', max_length=100)
+    assignee = SlugReferenceField(
+        'email',
+        required=False,
+        allow_null=True,
+        validators=[EmailValidator()],
     )
-    assignee = serializers.SlugRelatedField(
-        slug_field='email',
-        queryset=User.objects.all(),
-        required=False
+    # Tag ids or names.
+    tags = serializers.ListField(
+        child=TagReferenceField(), required=False, write_only=True
     )
 
     class Meta:
@@ -44,12 +84,82 @@ class CreateUpdateTaskSerializer(serializers.ModelSerializer):
         fields = (
             'name',
             'description',
+            'status',
             'priority',
             'project',
+            'assignee',
             'tags',
             'deadline',
         )
+        # Deleted tasks keep their names until they are purged.
+        validators = [
+            UniqueTogetherValidator(
+                queryset=Task.all_objects.all(), fields=('name', 'project')
+            )
+        ]
 
+    def to_internal_value(self, data):
+        return self.resolve_relations(super().to_internal_value(data))
+
+    def resolve_relations(self, attrs: dict) -> dict:
+        """
+        Replaces the project, assignee and tag slugs with their rows, all
+        looked up in one query; every missing one is reported.
+        """
+        tags = attrs.get('tags', [])
+        tag_fields = [
+            (tag, 'pk' if isinstance(tag, int) else 'name') for tag in tags
+        ]
+        resolver = RelationResolver.for_request(self.context.get('request'))
+        resolver.load(
+            {
+                (Project, 'name'): [attrs.get('project')],
+                (User, 'email'): [attrs.get('assignee')],
+                (Tag, 'pk'): [
+                    tag for tag, field in tag_fields if field == 'pk'
+                ],
+                (Tag, 'name'): [
+                    tag for tag, field in tag_fields if field == 'name'
+                ],
+            }
+        )
+
+        errors = {}
+        if 'project' in attrs:
+            name = attrs['project']
+            pk = resolver.get(Project, 'name', name)
+            if pk is None:
+                errors['project'] = ['Project not found']
+            # The slug is all responses show of it, so no row is loaded.
+            attrs['project'] = Project(pk=pk, name=name)
+        if attrs.get('assignee'):
+            email = attrs['assignee']
+            pk = resolver.get(User, 'email', email)
+            if pk is None:
+                errors['assignee'] = ['Assignee not found']
+            attrs['assignee'] = User(pk=pk, email=email)
+        if 'tags' in attrs:
+            tag_ids = [
+                resolver.get(Tag, field, tag) for tag, field in tag_fields
+            ]
+            missing = [
+                str(tag)
+                for (tag, _), pk in zip(tag_fields, tag_ids)
+                if pk is None
+            ]
+            if missing:
+                errors['tags'] = [
+                    'Tags not found: {}'.format(', '.join(missing))
+                ]
+            attrs['tags'] = list(dict.fromkeys(tag_ids))
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        data['tags'] = [tag.pk for tag in instance.tags.all()]
+        return data
 
     def validate_name(self, value):
         if len(value) < 10:
@@ -66,22 +176,12 @@ class CreateUpdateTaskSerializer(serializers.ModelSerializer):
         return value
 
     def validate_priority(self, value):
-        if value not in [item[0] for item in Priorities.choices()]:
+        if value not in PRIORITIES:
             raise serializers.ValidationError(
                 "The priority of the task couldn't be one of the available options"
             )
         return value
 
-    def validate_project(self, value):
-        if not Project.objects.filter(name=value).exists():
-            raise serializers.ValidationError('Project not found')
-        return value
-
-    def validate_tags(self, value):
-        if not Tag.objects.filter(name__in=value).exists():
-            raise serializers.ValidationError('Tags not found')
-        return value
-
     def validate_deadline(self, value):
         # value = timezone.make_aware(value, timezone.get_current_timezone())
         if value < timezone.now():
@@ -93,25 +193,112 @@ class CreateUpdateTaskSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         tags = validated_data.pop('tags', [])
         task = Task.objects.create(**validated_data)
-        for tag in tags:
-            task.tags.add(tag)
-        task.save()
+        if tags:
+            task.tags.add(*tags)
         return task
 
-    def update(self, instance, validated_data):
-        tags = validated_data.pop('tags', [])
+    @staticmethod
+    def changed_fields(instance, validated_data: dict) -> dict:
+        """
+        The validated values that differ from the instance's, ``tags``
+        aside.
+        """
+        changes = {}
+        for name, value in validated_data.items():
+            if name == 'tags':
+                continue
+            field = Task._meta.get_field(name)
+            current = getattr(instance, field.attname)
+            if field.is_relation:
+                value = value.pk if value is not None else None
+            if current != value:
+                changes[name] = validated_data[name]
+        return changes
 
-        for key, value in validated_data.items():
-            setattr(instance, key, value)
+    @staticmethod
+    def changed_tags(instance, tags) -> tuple:
+        """
+        The tags to add and the tag ids to remove for the task to have
+        exactly ``tags``; nothing when ``tags`` wasn't sent.
+        """
+        if tags is None:
+            return (), ()
+        current_tags = {tag.pk for tag in instance.tags.all()}
+        added = [tag for tag in tags if tag not in current_tags]
+        return added, current_tags.difference(tags)
 
-        instance.tags.add(*tags)
-        instance.save()
+    def update(self, instance, validated_data):
+        """
+        Writes only the columns that change, with one UPDATE that fails
+        with ``VersionConflict`` when the row was changed since it was
+        read. ``tags`` replace the task's tags.
+        """
+        changes = self.changed_fields(instance, validated_data)
+        added, removed = self.changed_tags(
+            instance, validated_data.get('tags')
+        )
+        if not changes and not added and not removed:
+            return instance
+
+        if tracks(changes):
+            # The version check guarantees the row still holds what was
+            # read, so the stats signal doesn't need to read it again.
+            stats = StatsDelta()
+            stats.add(instance, -1)
+            instance._stats_delta = stats
+        for name, value in changes.items():
+            setattr(instance, name, value)
+        try:
+            with transaction.atomic():
+                instance.save(
+                    update_fields={*changes, 'updated_at'},
+                    check_version=True,
+                )
+                if removed:
+                    instance.tags.remove(*removed)
+                if added:
+                    instance.tags.add(*added)
+        except VersionConflict:
+            instance.__dict__.pop('_stats_delta', None)
+            raise
         return instance
 
 
-class TaskDetailSerializer(serializers.ModelSerializer):
+class TaskDetailSerializer(QueryPlanMixin, serializers.ModelSerializer):
     project = ProjectShortInfoSerializer()
 
     class Meta:
         model = Task
         exclude = ('updated_at', 'deleted_at')
+        select_related = ('project',)
+        prefetch_related = ('tags',)
+
+
+class BulkTaskSerializer(CreateUpdateTaskSerializer):
+    # Relations stay plain slugs here: bulk_tasks resolves them for the
+    # whole batch with one query per table.
+    project = serializers.CharField(max_length=100)
+    assignee = serializers.EmailField(required=False, allow_null=True)
+    tags = serializers.ListField(
+        child=serializers.CharField(max_length=20), required=False
+    )
+
+    class Meta:
+        model = Task
+        fields = (
+            'name',
+            'description',
+            'status',
+            'priority',
+            'project',
+            'assignee',
+            'tags',
+            'deadline',
+        )
+
+    def get_validators(self):
+        # unique_together is checked per batch in bulk_tasks.
+        return []
+
+    def resolve_relations(self, attrs: dict) -> dict:
+        return attrs
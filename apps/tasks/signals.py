@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.tasks.models import Task, Tag
+from apps.tasks.utils.task_stats import TRACKED_FIELDS, StatsDelta, tracks
+from apps.utils.response_cache import invalidate_on_change
+
+invalidate_on_change(Task, Tag)
+
+
+@receiver(pre_save, sender=Task)
+def remember_task_stats(sender, instance, raw, update_fields, **kwargs):
+    if raw or instance._state.adding:
+        return
+    if update_fields is not None and not tracks(update_fields):
+        return
+    if '_stats_delta' in instance.__dict__:
+        # Remembered by the caller from the row it read.
+        return
+    # Task.save runs in a transaction: the lock keeps a concurrent save
+    # from reading the same previous values and taking them off twice.
+    previous = (
+        Task.all_objects.select_for_update()
+        .filter(pk=instance.pk)
+        .only(*TRACKED_FIELDS)
+        .first()
+    )
+    delta = StatsDelta()
+    if previous is not None:
+        delta.add(previous, -1)
+    instance._stats_delta = delta
+
+
+@receiver(post_save, sender=Task)
+def update_task_stats(sender, instance, created, raw, **kwargs):
+    if raw:
+        return
+    delta = instance.__dict__.pop('_stats_delta', None)
+    if delta is None and not created:
+        # Only untracked fields were saved.
+        return
+    if delta is None:
+        delta = StatsDelta()
+    delta.add(instance)
+    delta.save()
+
+
+@receiver(post_delete, sender=Task)
+def release_task_stats(sender, instance, **kwargs):
+    delta = StatsDelta()
+    delta.add(instance, -1)
+    delta.save()
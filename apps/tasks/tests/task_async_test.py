@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+import base64
+import json
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from django.test import AsyncClient, AsyncRequestFactory, override_settings
+from django.urls import path
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+from apps.projects.models import Project
+from apps.tasks.models import Task
+from apps.tasks.views.task_view import AllTasksListAsyncView
+from apps.users.models import Token, User
+from apps.utils.response_cache import get_cache
+
+# The task routes as served with ASYNC_VIEWS=1.
+urlpatterns = [
+    path('api/v1/tasks/', AllTasksListAsyncView.as_view()),
+]
+
+
+class TestTaskAsyncList(APITestCase):
+    url = '/api/v1/tasks/'
+
+    def setUp(self) -> None:
+        get_cache().clear()
+        self.client = APIClient()
+        self.factory = AsyncRequestFactory()
+        self.user = User.objects.create_user(
+            username='async_user',
+            email='async@example.com',
+            password='async-password',
+            first_name='Async',
+            last_name='User',
+            position='QA',
+        )
+        self.client.force_authenticate(user=self.user)
+        project = Project.objects.create(
+            name='Async Tasks',
+            description='Project used to check the async task list view.',
+        )
+        for index in range(12):
+            Task.objects.create(
+                name=f'Async task {index}',
+                description='Task description for the async list test.',
+                project=project,
+                assignee=self.user if index % 2 else None,
+            )
+
+    async def get(self, params=None, user=None):
+        async def auser():
+            return user or self.user
+
+        request = self.factory.get(self.url, params or {})
+        request.auser = auser
+        response = await AllTasksListAsyncView.as_view()(request)
+        return response, json.loads(response.content or b'null')
+
+    @sync_to_async
+    def sync_get(self, params):
+        get_cache().clear()
+        return self.client.get(self.url, params).json()
+
+    async def test_pages_match_sync_view(self):
+        for params in (
+            {},
+            {'page': 2, 'page_size': 4},
+            {'assignee': 'async@example.com'},
+        ):
+            with self.subTest(params=params):
+                response, data = await self.get(params)
+                expected = await self.sync_get(params)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(data['count'], expected['count'])
+                self.assertEqual(data['results'], expected['results'])
+
+    async def test_cursor_pages_match_sync_view(self):
+        response, data = await self.get({'cursor': '', 'page_size': 5})
+        expected = await self.sync_get({'cursor': '', 'page_size': 5})
+
+        self.assertEqual(data['results'], expected['results'])
+        self.assertEqual(data['next'], expected['next'])
+
+    async def test_page_out_of_range(self):
+        response, data = await self.get({'page': 10})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIn('detail', data)
+
+    async def test_anonymous_is_rejected(self):
+        response, _ = await self.get(user=AnonymousUser())
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class TestTaskAsyncAuthentication(APITestCase):
+    url = '/api/v1/tasks/'
+
+    def setUp(self) -> None:
+        get_cache().clear()
+        self.client = AsyncClient(enforce_csrf_checks=True)
+        self.user = User.objects.create_user(
+            username='async_auth_user',
+            email='async_auth@example.com',
+            password='async-auth-password',
+            first_name='Async',
+            last_name='Auth',
+            position='QA',
+        )
+        self.project = Project.objects.create(
+            name='Async Auth Tasks',
+            description='Project used to check async view authentication.',
+        )
+
+    async def test_token_post_needs_no_csrf_token(self):
+        _, key = await sync_to_async(Token.issue)(self.user)
+        response = await self.client.post(
+            self.url,
+            {
+                'name': 'Async created task',
+                'description': 'Task created through the async list route '
+                'with token authentication.',
+                'priority': 3,
+                'project': 'Async Auth Tasks',
+                'deadline': (timezone.now() + timedelta(days=7)).isoformat(),
+            },
+            content_type='application/json',
+            headers={'Authorization': f'Token {key}'},
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    async def test_basic_authentication(self):
+        credentials = base64.b64encode(
+            b'async_auth@example.com:async-auth-password'
+        ).decode()
+        response = await self.client.get(
+            self.url, headers={'Authorization': f'Basic {credentials}'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+from unittest import mock
+
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+from apps.projects.models import Project
+from apps.tasks.models import Task, Tag
+from apps.tasks.utils import bulk_tasks
+from apps.users.models import User
+
+
+class TestTaskBulkAPIView(APITestCase):
+    url = '/api/v1/tasks/bulk/'
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='bulk_user',
+            email='bulk@example.com',
+            password='bulk-password',
+            first_name='Bulk',
+            last_name='User',
+            position='QA',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.project = Project.objects.create(
+            name='Bulk Project',
+            description='Project used to check the bulk task endpoint.',
+        )
+        self.backend = Tag.objects.create(name='Backend')
+        self.frontend = Tag.objects.create(name='Frontend')
+        self.deadline = (timezone.now() + timedelta(days=7)).isoformat()
+
+    def build_task(self, index: int, **extra) -> dict:
+        task = {
+            'name': f'Imported sprint task {index}',
+            'description': 'Imported task description that is long enough to pass.',
+            'priority': 4,
+            'project': 'Bulk Project',
+            'tags': ['Backend', 'Frontend'],
+            'deadline': self.deadline,
+        }
+        task.update(extra)
+        return task
+
+    def test_bulk_create(self):
+        rows = [self.build_task(index) for index in range(50)]
+        rows[0]['assignee'] = 'bulk@example.com'
+
+        # one query for the project, user and tag lookups, unique check,
+        # task, tag, search index and stats writes, plus the savepoint
+        # pair of the transaction
+        with self.assertNumQueries(8):
+            response = self.client.post(self.url, rows, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['created'], 50)
+        self.assertEqual(Task.objects.count(), 50)
+        self.assertEqual(Task.tags.through.objects.count(), 100)
+        task = Task.objects.get(pk=response.data['ids'][0])
+        self.assertEqual(task.assignee, self.user)
+        self.assertEqual(task.project, self.project)
+
+    def test_bulk_create_reports_errors_per_row(self):
+        Task.objects.create(
+            name='Imported sprint task 0',
+            description='Existing task with the same name in the project.',
+            project=self.project,
+        )
+        rows = [
+            self.build_task(0),
+            self.build_task(1, project='Missing Project'),
+            self.build_task(2, tags=['Backend', 'Design', 'Mobile']),
+            self.build_task(3, name='short'),
+            self.build_task(4),
+            self.build_task(4),
+        ]
+
+        response = self.client.post(self.url, rows, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = {error['index']: error['errors'] for error in response.data}
+        self.assertEqual(sorted(errors), [0, 1, 2, 3, 5])
+        self.assertIn('name', errors[0])
+        self.assertIn('project', errors[1])
+        self.assertEqual(errors[2]['tags'], ['Tags not found: Design, Mobile'])
+        self.assertIn('name', errors[3])
+        self.assertIn('name', errors[5])
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_bulk_update(self):
+        tasks = [
+            Task.objects.create(
+                name=f'Existing sprint task {index}',
+                description='Task that is going to be updated in bulk.',
+                project=self.project,
+            )
+            for index in range(3)
+        ]
+        rows = [
+            {'id': task.pk, 'status': 'CLOSED', 'tags': ['Backend']}
+            for task in tasks
+        ]
+        rows.append({'id': 0, 'status': 'CLOSED'})
+
+        response = self.client.patch(self.url, rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0]['index'], 3)
+
+        response = self.client.patch(self.url, rows[:3], format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'updated': 3})
+        self.assertEqual(
+            Task.objects.filter(status='CLOSED', tags=self.backend).count(), 3
+        )
+        # Clients holding the old version see the tasks changed.
+        self.assertEqual(
+            set(Task.objects.values_list('version', flat=True)), {2}
+        )
+
+    def create_tasks(self, count: int) -> list:
+        return [
+            Task.objects.create(
+                name=f'Existing sprint task {index}',
+                description='Task that is going to be updated in bulk.',
+                project=self.project,
+            )
+            for index in range(count)
+        ]
+
+    def test_bulk_update_replaces_tags(self):
+        first, second = self.create_tasks(2)
+        first.tags.add(self.backend, self.frontend)
+        second.tags.add(self.backend)
+        rows = [
+            {'id': first.pk, 'tags': ['Frontend']},
+            {'id': second.pk, 'status': 'CLOSED'},
+        ]
+
+        response = self.client.patch(self.url, rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            list(first.tags.values_list('name', flat=True)), ['Frontend']
+        )
+        # A row without tags leaves them alone.
+        self.assertEqual(
+            list(second.tags.values_list('name', flat=True)), ['Backend']
+        )
+
+    def test_bulk_update_rejects_stale_versions(self):
+        tasks = self.create_tasks(2)
+        Task.objects.get(pk=tasks[1].pk).save(update_fields=['updated_at'])
+        rows = [
+            {'id': task.pk, 'version': 1, 'status': 'CLOSED'} for task in tasks
+        ]
+        rows.append({'id': tasks[0].pk, 'priority': 5})
+
+        response = self.client.patch(self.url, rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([error['index'] for error in response.data], [1, 2])
+        self.assertIn('version', response.data[0]['errors'])
+        self.assertFalse(Task.objects.filter(status='CLOSED').exists())
+
+    def test_bulk_update_concurrent_change(self):
+        tasks = self.create_tasks(3)
+        rows = [
+            {'id': task.pk, 'status': 'CLOSED', 'tags': ['Backend']}
+            for task in tasks
+        ]
+        apply_updates = bulk_tasks._apply_updates
+
+        def change_task(updates):
+            # Another request saves the task between the read and the write.
+            Task.objects.get(pk=tasks[1].pk).save(update_fields=['priority'])
+            return apply_updates(updates)
+
+        with mock.patch.object(bulk_tasks, '_apply_updates', change_task):
+            response = self.client.patch(self.url, rows, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data,
+            [
+                {
+                    'index': 1,
+                    'errors': {'version': [bulk_tasks.STALE_MESSAGE]},
+                }
+            ],
+        )
+        self.assertFalse(Task.objects.filter(status='CLOSED').exists())
+        self.assertFalse(Task.objects.filter(tags=self.backend).exists())
+
+    def test_too_many_rows(self):
+        response = self.client.post(self.url, [{}] * 5001, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from apps.projects.models import Project
+from apps.tasks.models import Tag, Task
+from apps.users.models import User
+from apps.utils.relations import RelationResolver
+
+
+class TestTaskCreate(APITestCase):
+    url = '/api/v1/tasks/'
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='create_user',
+            email='create@example.com',
+            password='create-password',
+            first_name='Create',
+            last_name='User',
+            position='QA',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.project = Project.objects.create(
+            name='Create Project',
+            description='Project used to check the task create endpoint.',
+        )
+        self.backend = Tag.objects.create(name='Backend')
+        self.frontend = Tag.objects.create(name='Frontend')
+
+    def build_task(self, **extra) -> dict:
+        task = {
+            'name': 'Created sprint task',
+            'description': 'Created task description that is long enough to pass.',
+            'priority': 4,
+            'project': 'Create Project',
+            'assignee': 'create@example.com',
+            'tags': ['Backend', self.frontend.pk],
+            'deadline': (timezone.now() + timedelta(days=7)).isoformat(),
+        }
+        task.update(extra)
+        return task
+
+    def test_create(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                self.url, self.build_task(), format='json'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['project'], 'Create Project')
+        self.assertEqual(response.data['assignee'], 'create@example.com')
+        self.assertEqual(
+            sorted(response.data['tags']),
+            [self.backend.pk, self.frontend.pk],
+        )
+        task = Task.objects.get(name='Created sprint task')
+        self.assertEqual(task.project, self.project)
+        self.assertEqual(task.assignee, self.user)
+        self.assertEqual(task.status, 'NEW')
+
+        # Validation: the project, assignee and tags in one query, then
+        # the unique name check; everything after it writes.
+        sql = [query['sql'] for query in queries.captured_queries]
+        self.assertIn('UNION ALL', sql[0])
+        self.assertTrue(sql[1].startswith('SELECT 1 AS'))
+        self.assertTrue(sql[2].startswith('INSERT INTO'))
+
+    def test_every_missing_relation_is_reported(self):
+        response = self.client.post(
+            self.url,
+            self.build_task(
+                project='Missing Project',
+                assignee='nobody@example.com',
+                tags=['Backend', 'Design', 'Mobile', 999],
+            ),
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['project'], ['Project not found'])
+        self.assertEqual(response.data['assignee'], ['Assignee not found'])
+        self.assertEqual(
+            response.data['tags'], ['Tags not found: Design, Mobile, 999']
+        )
+        self.assertFalse(Task.objects.exists())
+
+    def test_deleted_projects_are_not_found(self):
+        self.project.soft_delete()
+        response = self.client.post(self.url, self.build_task(), format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('project', response.data)
+
+    def test_names_stay_unique_per_project(self):
+        self.client.post(self.url, self.build_task(), format='json')
+        response = self.client.post(self.url, self.build_task(), format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Task.objects.count(), 1)
+
+
+class TestRelationResolver(APITestCase):
+    def setUp(self) -> None:
+        self.project = Project.objects.create(
+            name='Resolver Project',
+            description='Project used to check the relation resolver.',
+        )
+        self.tag = Tag.objects.create(name='Backend')
+
+    def test_lookups_are_remembered(self):
+        resolver = RelationResolver()
+        lookups = {
+            (Project, 'name'): ['Resolver Project', 'Missing'],
+            (Tag, 'pk'): [self.tag.pk],
+        }
+        with self.assertNumQueries(1):
+            resolver.load(lookups)
+        with self.assertNumQueries(0):
+            resolver.load(lookups)
+
+        self.assertEqual(
+            resolver.get(Project, 'name', 'Resolver Project'), self.project.pk
+        )
+        self.assertIsNone(resolver.get(Project, 'name', 'Missing'))
+        self.assertEqual(resolver.get(Tag, 'pk', self.tag.pk), self.tag.pk)
+        self.assertEqual(
+            resolver.missing(Project, 'name', ['Resolver Project', 'Missing']),
+            ['Missing'],
+        )
+
+    def test_one_resolver_per_request(self):
+        request = type('Request', (), {})()
+        self.assertIs(
+            RelationResolver.for_request(request),
+            RelationResolver.for_request(request),
+        )
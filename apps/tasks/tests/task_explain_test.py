@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.tasks.models import Task
+from apps.tasks.serializers.task_filter_serializers import (
+    INDEXED_FILTERS,
+)
+from apps.tasks.utils.task_filters import filter_tasks
+from apps.utils.explain import find_sequential_scans
+
+
+@skipUnless(connection.vendor == 'sqlite', 'EXPLAIN output is SQLite-specific')
+class TestTaskQueryPlans(TestCase):
+    def assertIndexed(self, queryset) -> None:
+        self.assertEqual(find_sequential_scans(queryset), [])
+
+    def test_filter_by_project_uses_index(self):
+        self.assertIndexed(
+            Task.objects.filter(project__name='Backend').order_by('-deadline')
+        )
+
+    def test_filter_by_assignee_uses_index(self):
+        self.assertIndexed(
+            Task.objects.filter(assignee__email='user@example.com')
+        )
+
+    def test_filter_by_assignee_status_uses_index(self):
+        self.assertIndexed(Task.objects.filter(assignee_id=1, status='New'))
+
+    def test_cursor_page_uses_index(self):
+        now = timezone.now()
+        self.assertIndexed(
+            Task.objects.order_by('-deadline', '-id')[:6],
+        )
+        self.assertIndexed(
+            Task.objects.filter(deadline__lt=now).order_by('-deadline', '-id')[
+                :6
+            ],
+        )
+
+    def test_accepted_filter_combinations_use_indexes(self):
+        now = timezone.now().isoformat()
+        values = {
+            'project': 'Backend',
+            'assignee': 'user@example.com',
+            'unassigned': 'true',
+            'deadline_after': now,
+            'deadline_before': now,
+            'tags': 'Backend,Frontend',
+        }
+        narrowing = {
+            'status': 'NEW,BLOCKED',
+            'priority_min': '3',
+            'priority_max': '4',
+        }
+        for name in INDEXED_FILTERS:
+            for tags_match in ('any', 'all'):
+                params = {name: values[name], **narrowing}
+                if name == 'tags':
+                    params['tags_match'] = tags_match
+                with self.subTest(params=params):
+                    self.assertIndexed(filter_tasks(params))
+
+    def test_unindexed_filter_is_reported(self):
+        scans = find_sequential_scans(
+            Task.objects.filter(description__contains='report').order_by()
+        )
+        self.assertEqual(len(scans), 1)
+        self.assertIn('tasks_task', scans[0])
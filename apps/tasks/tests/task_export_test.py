@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import csv
+import io
+import json
+
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+from apps.projects.models import Project
+from apps.tasks.models import Task
+from apps.tasks.serializers.tasks_serializers import AllTasksSerializer
+from apps.users.models import User
+
+
+class TestTaskExportAPIView(APITestCase):
+    url = '/api/v1/tasks/export/'
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='export_user',
+            email='export@example.com',
+            password='export-password',
+            first_name='Export',
+            last_name='User',
+            position='QA',
+        )
+        self.client.force_authenticate(user=self.user)
+        for project_name in ('Export Project', 'Other Project'):
+            project = Project.objects.create(
+                name=project_name,
+                description='Project used to check the streaming task export.',
+            )
+            for index in range(3):
+                Task.objects.create(
+                    name=f'{project_name} task {index}',
+                    description='Task description for the export test.',
+                    project=project,
+                    assignee=self.user if index == 0 else None,
+                )
+
+    def read(self, response) -> str:
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_csv_export(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.reader(io.StringIO(self.read(response))))
+        self.assertEqual(rows[0], list(AllTasksSerializer.Meta.fields))
+        self.assertEqual(len(rows), 7)
+
+    def test_ndjson_export_uses_list_filters(self):
+        response = self.client.get(
+            self.url,
+            {'export_format': 'ndjson', 'project': 'Export Project'},
+        )
+
+        lines = self.read(response).splitlines()
+        tasks = Task.objects.filter(project__name='Export Project')
+        expected = AllTasksSerializer(
+            tasks.order_by('-deadline', '-id'), many=True
+        ).data
+        self.assertEqual([json.loads(line) for line in lines], expected)
+
+    def test_unknown_format(self):
+        response = self.client.get(self.url, {'export_format': 'xml'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+from apps.projects.models import Project
+from apps.tasks.models import Task, Tag
+from apps.users.models import User
+
+
+class TestTaskFilters(APITestCase):
+    url = '/api/v1/tasks/'
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='filter_user',
+            email='filter@example.com',
+            password='filter-password',
+            first_name='Filter',
+            last_name='User',
+            position='QA',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.project = Project.objects.create(
+            name='Filter Project',
+            description='Project used to check the task list filters.',
+        )
+        other = Project.objects.create(
+            name='Other Project',
+            description='Project whose tasks the filters should leave out.',
+        )
+        backend = Tag.objects.create(name='Backend')
+        frontend = Tag.objects.create(name='Frontend')
+        self.now = timezone.now()
+
+        # (project, status, priority, assignee, tags, days to deadline)
+        rows = [
+            (self.project, 'NEW', 1, self.user, [backend, frontend], 1),
+            (self.project, 'BLOCKED', 4, None, [backend], 5),
+            (self.project, 'CLOSED', 5, self.user, [frontend], 10),
+            (self.project, 'NEW', 3, None, [], 20),
+            (other, 'NEW', 5, self.user, [backend, frontend], 2),
+        ]
+        self.tasks = []
+        for index, row in enumerate(rows):
+            project, state, priority, assignee, tags, days = row
+            task = Task.objects.create(
+                name=f'Filtered task {index}',
+                description='Task description for the filter test.',
+                project=project,
+                status=state,
+                priority=priority,
+                assignee=assignee,
+                deadline=self.now + timedelta(days=days),
+            )
+            task.tags.set(tags)
+            self.tasks.append(task)
+
+    def names(self, **params) -> list[str]:
+        response = self.client.get(self.url, {'page_size': 50, **params})
+        if response.status_code == status.HTTP_204_NO_CONTENT:
+            return []
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(item['name'] for item in response.data['results'])
+
+    def expected(self, *indexes: int) -> list[str]:
+        return sorted(self.tasks[index].name for index in indexes)
+
+    def test_filters_combine(self):
+        self.assertEqual(
+            self.names(
+                project='Filter Project', assignee='filter@example.com'
+            ),
+            self.expected(0, 2),
+        )
+        self.assertEqual(
+            self.names(project='Filter Project', status='NEW,BLOCKED'),
+            self.expected(0, 1, 3),
+        )
+        self.assertEqual(
+            self.names(project='Filter Project', priority_min=4),
+            self.expected(1, 2),
+        )
+        self.assertEqual(
+            self.names(unassigned='true', priority_max=3), self.expected(3)
+        )
+
+    def test_repeated_params(self):
+        response = self.client.get(
+            f'{self.url}?project=Filter+Project&status=NEW&status=CLOSED'
+        )
+        self.assertEqual(
+            sorted(item['name'] for item in response.data['results']),
+            self.expected(0, 2, 3),
+        )
+
+    def test_deadline_range(self):
+        self.assertEqual(
+            self.names(
+                deadline_after=(self.now + timedelta(days=3)).isoformat(),
+                deadline_before=(self.now + timedelta(days=15)).isoformat(),
+            ),
+            self.expected(1, 2),
+        )
+
+    def test_tags_any_and_all_without_duplicates(self):
+        self.assertEqual(
+            self.names(tags='Backend,Frontend'), self.expected(0, 1, 2, 4)
+        )
+        self.assertEqual(
+            self.names(tags='Backend,Frontend', tags_match='all'),
+            self.expected(0, 4),
+        )
+        response = self.client.get(self.url, {'tags': 'Backend,Frontend'})
+        self.assertEqual(response.data['count'], 4)
+
+    def test_filters_run_in_one_query(self):
+        # exists() + COUNT(*) + the page, whatever the filters
+        with self.assertNumQueries(3):
+            names = self.names(
+                project='Filter Project',
+                status='NEW,CLOSED',
+                priority_min=1,
+                tags='Backend,Frontend',
+                tags_match='all',
+                deadline_before=(self.now + timedelta(days=3)).isoformat(),
+            )
+        self.assertEqual(names, self.expected(0))
+
+    def test_soft_deleted_tasks_are_excluded(self):
+        Task.objects.filter(pk=self.tasks[0].pk).update(deleted_at=self.now)
+        self.assertEqual(
+            self.names(project='Filter Project'), self.expected(1, 2, 3)
+        )
+
+    def test_unindexed_combinations_are_rejected(self):
+        for params in (
+            {'status': 'NEW'},
+            {'priority_min': 4},
+            {'status': 'NEW', 'unassigned': 'false'},
+        ):
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(
+                    response.status_code, status.HTTP_400_BAD_REQUEST
+                )
+                self.assertIn('non_field_errors', response.data)
+
+    def test_invalid_values_are_rejected(self):
+        for params in (
+            {'project': 'Filter Project', 'status': 'DONE'},
+            {'project': 'Filter Project', 'priority_min': 9},
+            {'assignee': 'filter@example.com', 'unassigned': 'true'},
+            {'tags_match': 'all'},
+            {
+                'deadline_after': self.now.isoformat(),
+                'deadline_before': (self.now - timedelta(days=1)).isoformat(),
+            },
+        ):
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(
+                    response.status_code, status.HTTP_400_BAD_REQUEST
+                )
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+import json
+
+from django.db import connection
+from django.http import StreamingHttpResponse
+from asgiref.sync import sync_to_async
+from django.test import (
+    AsyncClient,
+    AsyncRequestFactory,
+    RequestFactory,
+    override_settings,
+)
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+from apps.projects.models import Project
+from apps.tasks.models import Task, Tag
+from apps.tasks.tests import task_async_test
+from apps.users.models import User
+from apps.utils.instrumentation import (
+    InstrumentationMiddleware,
+    RequestProfile,
+    fingerprint,
+    registry,
+)
+from apps.utils.response_cache import get_cache
+
+LOGGER = 'apps.utils.instrumentation'
+VIEW = 'apps.tasks.views.task_view.AllTasksListAPIView'
+
+
+@override_settings(INSTRUMENTATION_SAMPLE_RATE=1.0)
+class TestRequestInstrumentation(APITestCase):
+    url = '/api/v1/tasks/'
+
+    def setUp(self) -> None:
+        get_cache().clear()
+        registry.reset()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='metrics_user',
+            email='metrics@example.com',
+            password='metrics-password',
+            first_name='Metrics',
+            last_name='User',
+            position='QA',
+        )
+        self.client.force_authenticate(user=self.user)
+        project = Project.objects.create(
+            name='Metrics Project',
+            description='Project used to check the request instrumentation.',
+        )
+        for index in range(3):
+            Task.objects.create(
+                name=f'Metrics task {index}',
+                description='Task description for the instrumentation test.',
+                project=project,
+            )
+
+    def test_sampled_request_is_profiled(self):
+        with self.assertLogs(LOGGER, 'INFO') as logs:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        timings = response['Server-Timing']
+        for metric in ('db;dur=', 'view;dur=', 'render;dur=', 'total;dur='):
+            self.assertIn(metric, timings)
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record['view'], VIEW)
+        self.assertEqual(record['status'], 200)
+        self.assertGreater(record['queries'], 0)
+        self.assertEqual(record['response_bytes'], len(response.content))
+        self.assertEqual(record['duplicates'], [])
+
+    @override_settings(INSTRUMENTATION_SAMPLE_RATE=0.0)
+    def test_unsampled_request_is_not_profiled(self):
+        response = self.client.get(self.url)
+
+        self.assertNotIn('Server-Timing', response)
+
+    def test_streamed_response_is_measured_when_consumed(self):
+        response = self.client.get(f'{self.url}export/')
+
+        with self.assertLogs(LOGGER, 'INFO') as logs:
+            body = b''.join(response.streaming_content)
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record['response_bytes'], len(body))
+        self.assertGreater(record['queries'], 0)
+
+    def test_repeated_queries_are_flagged(self):
+        tag = Tag.objects.create(name='Backend')
+        profile = RequestProfile(RequestFactory().get(self.url))
+        with connection.execute_wrapper(profile):
+            for _ in range(5):
+                Tag.objects.get(pk=tag.pk)
+
+        duplicates = profile.duplicates()
+        self.assertEqual(len(duplicates), 1)
+        self.assertEqual(duplicates[0][1], 5)
+
+    def test_in_lists_share_a_fingerprint(self):
+        self.assertEqual(
+            fingerprint('SELECT 1 WHERE id IN (%s, %s, %s)'),
+            fingerprint('SELECT 1 WHERE id IN (%s)'),
+        )
+
+    def test_metrics_endpoint(self):
+        with self.assertLogs(LOGGER, 'INFO'):
+            self.client.get(self.url)
+            forbidden = self.client.get('/metrics/')
+        self.assertEqual(forbidden.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_staff = True
+        self.user.save(update_fields=['is_staff'])
+        self.client.force_login(self.user)
+        with self.assertLogs(LOGGER, 'INFO'):
+            response = self.client.get('/metrics/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.content.decode()
+        self.assertIn(
+            'http_sampled_requests_total{{view="{}",method="GET",'
+            'status="200"}} 1'.format(VIEW),
+            body,
+        )
+        self.assertIn('http_request_duration_seconds_bucket', body)
+        self.assertIn('db_queries_total', body)
+
+    @override_settings(METRICS_TOKEN='scrape-token')
+    def test_metrics_endpoint_token(self):
+        with self.assertLogs(LOGGER, 'INFO'):
+            forbidden = self.client.get('/metrics/')
+            response = self.client.get(
+                '/metrics/', HTTP_AUTHORIZATION='Bearer scrape-token'
+            )
+        self.assertEqual(forbidden.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class TestAsyncInstrumentation(APITestCase):
+    @override_settings(INSTRUMENTATION_SAMPLE_RATE=1.0)
+    async def test_async_stream_is_profiled(self):
+        async def chunks():
+            yield b'first,'
+            yield b'second'
+
+        async def get_response(request):
+            return StreamingHttpResponse(chunks())
+
+        middleware = InstrumentationMiddleware(get_response)
+        response = await middleware(AsyncRequestFactory().get('/'))
+
+        self.assertIn('total;dur=', response['Server-Timing'])
+        with self.assertLogs(LOGGER, 'INFO') as logs:
+            body = b''.join([chunk async for chunk in response])
+
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record['response_bytes'], len(body))
+
+    @override_settings(
+        INSTRUMENTATION_SAMPLE_RATE=1.0,
+        ROOT_URLCONF=task_async_test.__name__,
+    )
+    async def test_asgi_queries_are_counted(self):
+        await sync_to_async(User.objects.create_user)(
+            username='asgi_metrics_user',
+            email='asgi_metrics@example.com',
+            password='asgi-metrics-password',
+            first_name='Asgi',
+            last_name='Metrics',
+            position='QA',
+        )
+        client = AsyncClient()
+        await client.alogin(
+            email='asgi_metrics@example.com', password='asgi-metrics-password'
+        )
+        get_cache().clear()
+
+        response = await client.get('/api/v1/tasks/')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertNotIn('desc="0 queries"', response['Server-Timing'])
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+from apps.projects.models import Project
+from apps.tasks.models import Task
+from apps.users.models import User
+
+
+class TestTaskCursorPagination(APITestCase):
+    url = '/api/v1/tasks/'
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='cursor_user',
+            email='cursor@example.com',
+            password='cursor-password',
+            first_name='Cursor',
+            last_name='User',
+            position='QA',
+        )
+        self.client.force_authenticate(user=self.user)
+
+        self.project = Project.objects.create(
+            name='Cursor Project',
+            description='Project for checking keyset pagination of tasks.',
+        )
+        deadline = timezone.now() + timedelta(days=10)
+        # Two tasks share every deadline to check the ``id`` tie-breaker.
+        for index in range(12):
+            Task.objects.create(
+                name=f'Cursor task {index}',
+                description='Task description for the cursor pagination.',
+                project=self.project,
+                deadline=deadline - timedelta(days=index // 2),
+            )
+
+    def test_cursor_walks_all_tasks_in_order(self):
+        expected = list(
+            Task.objects.order_by('-deadline', '-id').values_list(
+                'name', flat=True
+            )
+        )
+        names = []
+        url = f'{self.url}?cursor=&page_size=5'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            names.extend(task['name'] for task in response.data['results'])
+            url = response.data['next']
+
+        self.assertEqual(names, expected)
+
+    def test_cursor_page_uses_no_count_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'{self.url}?cursor=&page_size=3')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 3)
+        for query in queries.captured_queries:
+            self.assertNotIn('COUNT(', query['sql'])
+            self.assertNotIn('OFFSET', query['sql'])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(f'{self.url}?cursor=not-a-cursor')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_page_number_pagination_still_works(self):
+        response = self.client.get(f'{self.url}?page=2&page_size=5')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 12)
+        self.assertEqual(len(response.data['results']), 5)
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+import datetime
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase, APIClient
+
+from apps.projects.models import Project, ProjectFile
+from apps.projects.serializers.project_file_serializers import (
+    AllProjectFileSerializer,
+)
+from apps.tasks.models import Task, Tag
+from apps.tasks.serializers.tasks_serializers import (
+    AllTasksSerializer,
+    TaskDetailSerializer,
+)
+from apps.users.models import User
+from apps.users.serializers import UserListSerializer
+from apps.utils import renderers
+from apps.utils.renderers import FastJSONRenderer
+
+
+class TestTaskQueryPlan(APITestCase):
+    url = '/api/v1/tasks/'
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='plan_user',
+            email='plan@example.com',
+            password='plan-password',
+            first_name='Plan',
+            last_name='User',
+            position='QA',
+        )
+        self.client.force_authenticate(user=self.user)
+
+        tag = Tag.objects.create(name='Backend')
+        for index in range(10):
+            project = Project.objects.create(
+                name=f'Plan Project {index}',
+                description='Project for checking the task query plan.',
+            )
+            assignee = User.objects.create_user(
+                username=f'assignee_{index}',
+                email=f'assignee_{index}@example.com',
+                password='assignee-password',
+                first_name='Assignee',
+                last_name='User',
+                position='Programmer',
+            )
+            task = Task.objects.create(
+                name=f'Plan task {index}',
+                description='Task description for the query plan test.',
+                project=project,
+                assignee=assignee if index % 2 else None,
+            )
+            task.tags.add(tag)
+
+    def test_values_rows_match_serializer_output(self):
+        tasks = Task.objects.all()
+        rows = AllTasksSerializer.values_queryset(tasks)
+
+        self.assertEqual(
+            AllTasksSerializer.represent_values(rows),
+            AllTasksSerializer(tasks, many=True).data,
+        )
+
+    def test_values_rows_follow_the_active_timezone(self):
+        tasks = Task.objects.all()
+
+        with timezone.override('Asia/Kolkata'):
+            rows = AllTasksSerializer.represent_values(
+                AllTasksSerializer.values_queryset(tasks)
+            )
+            expected = AllTasksSerializer(tasks, many=True).data
+
+        self.assertEqual(rows, expected)
+        self.assertTrue(rows[0]['deadline'].endswith('+05:30'))
+
+    def test_values_rows_of_other_list_serializers(self):
+        for index in range(3):
+            project_file = ProjectFile.objects.create(
+                file_name=f'plan_{index}.txt',
+                file_path=f'documents/plan_{index}.txt',
+            )
+            project_file.project.add(*Project.objects.all()[: index + 1])
+        Project.objects.first().soft_delete()
+
+        for serializer_class, queryset in (
+            (UserListSerializer, User.objects.all()),
+            (AllProjectFileSerializer, ProjectFile.objects.all()),
+        ):
+            with self.subTest(serializer=serializer_class.__name__):
+                rows = serializer_class.values_queryset(queryset)
+                with self.assertNumQueries(
+                    1 + len(serializer_class.get_query_plan()['many'])
+                ):
+                    data = serializer_class.represent_values(rows)
+                self.assertEqual(
+                    JSONRenderer().render(data),
+                    JSONRenderer().render(
+                        serializer_class(queryset, many=True).data
+                    ),
+                )
+
+    def test_task_list_query_count_does_not_depend_on_page_size(self):
+        # exists() + COUNT(*) + one joined SELECT for the page
+        for page_size in (2, 5, 10):
+            with self.subTest(page_size=page_size):
+                with self.assertNumQueries(3):
+                    response = self.client.get(
+                        f'{self.url}?page_size={page_size}'
+                    )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(len(response.data['results']), page_size)
+
+    def test_task_detail_uses_query_plan(self):
+        task = Task.objects.first()
+
+        # joined SELECT for task and project + tags prefetch
+        with self.assertNumQueries(2):
+            response = self.client.get(f'{self.url}{task.pk}/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, TaskDetailSerializer(task).data)
+
+
+class TestFastJSONRenderer(SimpleTestCase):
+    data = {
+        'name': 'Задача \u2028 \u2029 ✓',
+        'created_at': datetime.datetime(
+            2024, 5, 1, 12, 30, 15, 120000, tzinfo=datetime.timezone.utc
+        ),
+        'deadline': datetime.date(2024, 5, 2),
+        'budget': Decimal('12.50'),
+        'label': gettext_lazy('Programmer'),
+        'counts': {1: [1, 2.5, None, True]},
+        'pair': ('a', 'b'),
+    }
+
+    def test_same_bytes_as_json_renderer(self):
+        self.assertEqual(
+            FastJSONRenderer().render(self.data),
+            JSONRenderer().render(self.data),
+        )
+
+    def test_falls_back_to_json_renderer(self):
+        huge = {'id': 2**70}
+        self.assertEqual(
+            FastJSONRenderer().render(huge), JSONRenderer().render(huge)
+        )
+        self.assertEqual(
+            FastJSONRenderer().render(self.data, 'application/json; indent=2'),
+            JSONRenderer().render(self.data, 'application/json; indent=2'),
+        )
+        with mock.patch.object(renderers, 'orjson', None):
+            self.assertEqual(
+                FastJSONRenderer().render(self.data),
+                JSONRenderer().render(self.data),
+            )
+        self.assertEqual(FastJSONRenderer().render(None), b'')
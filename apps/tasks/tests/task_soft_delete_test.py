@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+import io
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+from apps.projects.models import Project
+from apps.search.models import SearchTerm
+from apps.search.utils import search_index
+from apps.search.utils.search_index import TermIndex
+from apps.tasks.models import Tag, Task, TaskStat
+from apps.users.models import User
+
+TaskTag = Task.tags.through
+
+
+class TestSoftDelete(APITestCase):
+    def setUp(self) -> None:
+        # The portable index, so the test can look at the postings.
+        patcher = mock.patch.object(
+            search_index, 'get_index', return_value=TermIndex()
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='soft_delete_user',
+            email='soft_delete@example.com',
+            password='soft-delete-password',
+            first_name='Soft',
+            last_name='Delete',
+            position='QA',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.project = Project.objects.create(
+            name='Soft Delete Project',
+            description='Project used to check soft deletes and the purge.',
+        )
+        tag = Tag.objects.create(name='Tombstone')
+        self.tasks = []
+        for index in range(3):
+            task = Task.objects.create(
+                name=f'Soft delete task {index}',
+                description='Task description for the soft delete test.',
+                project=self.project,
+                status='NEW',
+                assignee=self.user,
+            )
+            task.tags.add(tag)
+            self.tasks.append(task)
+
+    def task_names(self) -> list[str]:
+        response = self.client.get('/api/v1/tasks/', {'page_size': 50})
+        if response.status_code == status.HTTP_204_NO_CONTENT:
+            return []
+        return sorted(item['name'] for item in response.data['results'])
+
+    def purge(self, grace_hours: int = 0, batch_size: int = 2) -> str:
+        out = io.StringIO()
+        call_command(
+            'purge_deleted',
+            grace_hours=grace_hours,
+            batch_size=batch_size,
+            stdout=out,
+        )
+        return out.getvalue()
+
+    def test_task_delete_hides_the_task(self):
+        task = self.tasks[0]
+        response = self.client.delete(f'/api/v1/tasks/{task.pk}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(f'/api/v1/tasks/{task.pk}/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn(task.name, self.task_names())
+        self.assertIsNotNone(Task.all_objects.get(pk=task.pk).deleted_at)
+        self.assertEqual(TaskTag.objects.filter(task_id=task.pk).count(), 1)
+
+        stats = self.client.get(f'/api/v1/projects/{self.project.pk}/stats/')
+        self.assertEqual(stats.data['total'], 2)
+        self.assertFalse(
+            SearchTerm.objects.filter(kind='task', object_id=task.pk).exists()
+        )
+
+    def test_project_delete_is_a_single_update(self):
+        url = f'/api/v1/projects/{self.project.pk}/'
+        # project lookup and the UPDATE; the search index drops the project
+        # and its tasks
+        with self.assertNumQueries(4):
+            response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(
+            self.client.get(url).status_code, status.HTTP_404_NOT_FOUND
+        )
+        self.assertEqual(self.task_names(), [])
+        self.assertFalse(Task.objects.exists())
+        self.assertEqual(Task.all_objects.alive().count(), 3)
+
+    def test_deleted_names_stay_taken_until_purged(self):
+        self.project.soft_delete()
+        response = self.client.post(
+            '/api/v1/projects/',
+            {
+                'name': self.project.name,
+                'description': 'Project reusing the name of a deleted one, '
+                'which is not allowed.',
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('name', response.data)
+
+    def test_deleted_users_are_hidden_and_cannot_log_in(self):
+        self.user.soft_delete()
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
+        self.assertTrue(User.all_objects.get(pk=self.user.pk).deleted)
+        self.assertFalse(
+            self.client.login(
+                email='soft_delete@example.com',
+                password='soft-delete-password',
+            )
+        )
+
+    def test_purge_respects_the_grace_period(self):
+        self.tasks[0].soft_delete()
+        self.project.soft_delete()
+        self.assertEqual(
+            self.purge(grace_hours=1).split(' in ')[0],
+            'Purged 0 tasks, 0 projects and 0 users',
+        )
+        self.assertEqual(Task.all_objects.count(), 3)
+
+    def test_purge_removes_tombstones_in_batches(self):
+        self.tasks[0].soft_delete()
+        self.user.soft_delete()
+        past = timezone.now() - timedelta(hours=2)
+        Task.all_objects.filter(pk=self.tasks[0].pk).update(deleted_at=past)
+
+        # The user is still assigned to the live tasks.
+        self.assertTrue(
+            self.purge().startswith('Purged 1 tasks, 0 projects and 0 users')
+        )
+        self.assertFalse(TaskTag.objects.filter(task_id=self.tasks[0].pk))
+        self.assertEqual(Task.all_objects.count(), 2)
+
+        self.project.soft_delete()
+        self.assertTrue(
+            self.purge().startswith('Purged 2 tasks, 1 projects and 1 users')
+        )
+        self.assertFalse(Task.all_objects.exists())
+        self.assertFalse(TaskTag.objects.exists())
+        self.assertFalse(Project.all_objects.exists())
+        self.assertFalse(TaskStat.objects.exists())
+        self.assertFalse(User.all_objects.exists())
+        self.assertFalse(SearchTerm.objects.filter(kind='task').exists())
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+import io
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import QuerySet
+from django.db.models.signals import pre_save
+from django.test import TransactionTestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+from apps.projects.models import Project
+from apps.tasks.models import Task, TaskStat
+from apps.tasks.utils.bulk_tasks import bulk_create_tasks, bulk_update_tasks
+from apps.users.models import User
+
+
+class TestProjectStats(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='stats_user',
+            email='stats@example.com',
+            password='stats-password',
+            first_name='Stats',
+            last_name='User',
+            position='QA',
+        )
+        self.other_user = User.objects.create_user(
+            username='stats_other',
+            email='stats_other@example.com',
+            password='stats-password',
+            first_name='Other',
+            last_name='User',
+            position='Programmer',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.project = Project.objects.create(
+            name='Stats Project',
+            description='Project used to check the precomputed statistics.',
+        )
+        self.url = f'/api/v1/projects/{self.project.pk}/stats/'
+        now = timezone.now()
+        self.tasks = [
+            Task.objects.create(
+                name=f'Stats task {index}',
+                description='Task description for the stats test.',
+                project=self.project,
+                status='NEW',
+                priority=priority,
+                assignee=assignee,
+                deadline=now + timedelta(days=days),
+            )
+            for index, (priority, assignee, days) in enumerate(
+                [
+                    (1, self.user, -3),
+                    (3, self.user, 5),
+                    (5, self.other_user, -1),
+                    (3, None, 10),
+                ]
+            )
+        ]
+
+    def stats(self, **params) -> dict:
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def counters(self) -> set:
+        return set(
+            TaskStat.objects.exclude(count=0).values_list(
+                'project_id', 'dimension', 'key', 'count'
+            )
+        )
+
+    def test_stats_endpoint(self):
+        # project lookup, counters and assignee emails
+        with self.assertNumQueries(3):
+            stats = self.stats(days=7)
+
+        self.assertEqual(stats['total'], 4)
+        self.assertEqual(stats['open'], 4)
+        self.assertEqual(stats['overdue'], 2)
+        self.assertEqual(stats['by_status']['NEW'], 4)
+        self.assertEqual(stats['by_status']['CLOSED'], 0)
+        self.assertEqual(
+            stats['by_priority'], {'1': 1, '2': 0, '3': 2, '4': 0, '5': 1}
+        )
+        self.assertEqual(
+            stats['assignee_load'],
+            [
+                {'assignee': 'stats@example.com', 'open_tasks': 2},
+                {'assignee': 'stats_other@example.com', 'open_tasks': 1},
+                {'assignee': None, 'open_tasks': 1},
+            ],
+        )
+        self.assertEqual(len(stats['created_per_day']), 7)
+        self.assertEqual(
+            stats['created_per_day'][-1],
+            {'date': timezone.localdate().isoformat(), 'count': 4},
+        )
+        self.assertEqual(
+            sum(day['count'] for day in stats['closed_per_day']), 0
+        )
+
+    def test_status_transitions_and_reassignment(self):
+        task = self.tasks[0]
+        task.status = 'CLOSED'
+        task.save()
+        self.tasks[1].assignee = self.other_user
+        self.tasks[1].save(update_fields=['assignee'])
+
+        stats = self.stats()
+        self.assertEqual(stats['open'], 3)
+        self.assertEqual(stats['overdue'], 1)
+        self.assertEqual(stats['by_status']['CLOSED'], 1)
+        self.assertEqual(stats['closed_per_day'][-1]['count'], 1)
+        self.assertEqual(
+            stats['assignee_load'],
+            [
+                {'assignee': 'stats_other@example.com', 'open_tasks': 2},
+                {'assignee': None, 'open_tasks': 1},
+            ],
+        )
+
+        task.status = 'IN_PROGRESS'
+        task.save(update_fields=['status'])
+        task.refresh_from_db()
+        self.assertIsNone(task.closed_at)
+        self.assertEqual(self.stats()['closed_per_day'][-1]['count'], 0)
+
+    def test_untracked_saves_skip_the_counters(self):
+        task = self.tasks[0]
+        with self.assertNumQueries(1):
+            task.save(update_fields=['updated_at'])
+
+    def test_delete_and_move_between_projects(self):
+        other = Project.objects.create(
+            name='Other Stats Project',
+            description='Project the tasks are moved to in the stats test.',
+        )
+        self.tasks[0].delete()
+        self.tasks[1].project = other
+        self.tasks[1].save()
+
+        self.assertEqual(self.stats()['total'], 2)
+        self.assertEqual(
+            self.client.get(f'/api/v1/projects/{other.pk}/stats/').data[
+                'total'
+            ],
+            1,
+        )
+
+    def test_bulk_writes_update_the_counters(self):
+        bulk_create_tasks(
+            [
+                {
+                    'name': f'Bulk stats task {index}',
+                    'description': 'Imported task description that is long '
+                    'enough to pass.',
+                    'priority': 2,
+                    'project': self.project.name,
+                }
+                for index in range(3)
+            ]
+        )
+        bulk_update_tasks(
+            [{'id': task.pk, 'status': 'CLOSED'} for task in self.tasks[:2]]
+        )
+
+        stats = self.stats()
+        self.assertEqual(stats['total'], 7)
+        self.assertEqual(stats['by_priority']['2'], 3)
+        self.assertEqual(stats['by_status']['CLOSED'], 2)
+        self.assertEqual(stats['closed_per_day'][-1]['count'], 2)
+
+    def test_rebuild_matches_incremental_counters(self):
+        self.tasks[0].status = 'CLOSED'
+        self.tasks[0].save()
+        self.tasks[2].delete()
+        self.tasks[3].assignee = self.user
+        self.tasks[3].save()
+        incremental = self.counters()
+
+        TaskStat.objects.all().delete()
+        call_command('rebuild_task_stats', stdout=io.StringIO())
+
+        self.assertEqual(self.counters(), incremental)
+
+    def test_project_delete_removes_counters(self):
+        self.project.delete()
+        self.assertFalse(TaskStat.objects.exists())
+
+    def test_unknown_project_and_bad_days(self):
+        response = self.client.get('/api/v1/projects/0/stats/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(self.url, {'days': 0})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestTaskStatsLocking(TransactionTestCase):
+    def test_previous_row_is_locked_until_the_update(self):
+        project = Project.objects.create(
+            name='Locked Stats Project',
+            description='Project used to check the stats row locking.',
+        )
+        task = Task.objects.create(
+            name='Locked stats task',
+            description='Task description for the locking test.',
+            project=project,
+        )
+        task.status = 'CLOSED'
+        in_transaction = []
+
+        def record(sender, **kwargs):
+            in_transaction.append(connection.in_atomic_block)
+
+        pre_save.connect(record, sender=Task, dispatch_uid='stats_lock_test')
+        self.addCleanup(
+            pre_save.disconnect, sender=Task, dispatch_uid='stats_lock_test'
+        )
+        select_for_update = QuerySet.select_for_update
+        with mock.patch.object(
+            QuerySet,
+            'select_for_update',
+            autospec=True,
+            side_effect=select_for_update,
+        ) as mock_lock:
+            task.save(update_fields=['status'])
+
+        # SELECT ... FOR UPDATE holds the row until the UPDATE commits.
+        mock_lock.assert_called_once()
+        self.assertEqual(in_transaction, [True])
+        self.assertEqual(
+            TaskStat.objects.get(
+                project=project, dimension=TaskStat.STATUS, key='NEW'
+            ).count,
+            0,
+        )
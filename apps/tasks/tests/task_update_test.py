@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from apps.projects.models import Project
+from apps.tasks.models import Tag, Task, TaskStat
+from apps.users.models import User
+from apps.utils.versioning import VersionConflict
+
+
+class TestTaskUpdate(APITestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='update_user',
+            email='update@example.com',
+            password='update-password',
+            first_name='Update',
+            last_name='User',
+            position='QA',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.project = Project.objects.create(
+            name='Update Project',
+            description='Project used to check the task update endpoint.',
+        )
+        self.backend = Tag.objects.create(name='Backend')
+        self.frontend = Tag.objects.create(name='Frontend')
+        self.design = Tag.objects.create(name='Design')
+        self.task = Task.objects.create(
+            name='Updated sprint task',
+            description='Task description for the incremental update test.',
+            project=self.project,
+            assignee=self.user,
+        )
+        self.task.tags.add(self.backend, self.frontend)
+        self.url = f'/api/v1/tasks/{self.task.pk}/'
+
+    def patch(self, data: dict, **headers):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(
+                self.url, data, format='json', headers=headers
+            )
+        table = connection.ops.quote_name(Task._meta.db_table)
+        updates = [
+            query['sql']
+            for query in queries.captured_queries
+            if query['sql'].startswith(f'UPDATE {table} ')
+        ]
+        return response, updates
+
+    def count(self, dimension: str, key: str) -> int:
+        stat = TaskStat.objects.filter(
+            project=self.project, dimension=dimension, key=key
+        ).first()
+        return stat.count if stat else 0
+
+    def test_get_sends_the_version(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response['ETag'], '"1"')
+        self.assertEqual(response.data['version'], 1)
+
+    def test_status_change_is_one_narrow_update(self):
+        response, updates = self.patch({'status': 'CLOSED'}, If_Match='"1"')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['ETag'], '"2"')
+        self.assertEqual(len(updates), 1)
+        columns = updates[0].split(' SET ')[1].split(' WHERE ')[0]
+        for column in ('status', 'closed_at', 'updated_at', 'version'):
+            self.assertIn(column, columns)
+        for column in ('name', 'description', 'deadline', 'project_id'):
+            self.assertNotIn(column, columns)
+
+        task = Task.objects.get(pk=self.task.pk)
+        self.assertEqual((task.status, task.version), ('CLOSED', 2))
+        self.assertIsNotNone(task.closed_at)
+        self.assertEqual(self.count(TaskStat.STATUS, 'NEW'), 0)
+        self.assertEqual(self.count(TaskStat.STATUS, 'CLOSED'), 1)
+        self.assertEqual(self.count(TaskStat.ASSIGNEE, str(self.user.pk)), 0)
+
+    def test_stale_version_is_rejected(self):
+        Task.objects.get(pk=self.task.pk).save(update_fields=['updated_at'])
+
+        response, updates = self.patch({'status': 'BLOCKED'}, If_Match='"1"')
+
+        self.assertEqual(
+            response.status_code, status.HTTP_412_PRECONDITION_FAILED
+        )
+        self.assertEqual(response['ETag'], '"2"')
+        self.assertEqual(updates, [])
+        self.assertEqual(Task.objects.get(pk=self.task.pk).status, 'NEW')
+
+    def test_unchanged_fields_are_not_written(self):
+        response, updates = self.patch(
+            {'name': self.task.name, 'tags': ['Backend', 'Frontend']}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(updates, [])
+        self.assertEqual(response['ETag'], '"1"')
+
+    def test_tags_are_replaced(self):
+        response, _ = self.patch({'tags': ['Frontend', self.design.pk]})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            sorted(response.data['tags']), [self.frontend.pk, self.design.pk]
+        )
+        self.assertEqual(
+            set(self.task.tags.values_list('name', flat=True)),
+            {'Frontend', 'Design'},
+        )
+        # A new tag set is a new version of the task.
+        self.assertEqual(response['ETag'], '"2"')
+
+    def test_put_is_partial(self):
+        response = self.client.put(
+            self.url,
+            {'priority': 5, 'project': 'Update Project'},
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        task = Task.objects.get(pk=self.task.pk)
+        self.assertEqual((task.priority, task.name), (5, self.task.name))
+
+    def test_put_and_patch_answer_the_detail(self):
+        detail = self.client.get(self.url).data
+        for method in (self.client.put, self.client.patch):
+            response = method(self.url, {'priority': 5}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(set(response.data), set(detail))
+            self.assertEqual(response.data['project'], detail['project'])
+
+
+class TestVersionedModel(APITestCase):
+    def setUp(self) -> None:
+        self.project = Project.objects.create(
+            name='Version Project',
+            description='Project used to check the task versions.',
+        )
+        self.task = Task.objects.create(
+            name='Versioned task',
+            description='Task description for the version test.',
+            project=self.project,
+        )
+
+    def test_concurrent_writes_conflict(self):
+        first = Task.objects.get(pk=self.task.pk)
+        second = Task.objects.get(pk=self.task.pk)
+
+        first.priority = 5
+        first.save(update_fields=['priority'], check_version=True)
+        self.assertEqual(first.version, 2)
+
+        second.priority = 1
+        with self.assertRaises(VersionConflict), transaction.atomic():
+            second.save(update_fields=['priority'], check_version=True)
+        self.assertEqual(Task.objects.get(pk=self.task.pk).priority, 5)
+
+    def test_every_update_bumps_the_version(self):
+        self.task.soft_delete()
+        self.task.save()
+        self.assertEqual(self.task.version, 3)
+        self.assertEqual(Task.all_objects.get(pk=self.task.pk).version, 3)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+from importlib import import_module
+
+from django.apps import apps
+from django.test import SimpleTestCase
+from rest_framework.test import APITestCase
+
+from apps.projects.models import Project
+from apps.tasks.choices.statuses import Statuses
+from apps.tasks.models import Task, TaskStat
+from apps.users.serializers import RegisterUserSerializer
+from apps.utils.validation import PRIORITIES, STATUSES, name_errors
+
+status_default = import_module('apps.tasks.migrations.0010_status_default')
+
+
+class TestSharedValidation(SimpleTestCase):
+    def test_choices_are_built_once(self):
+        self.assertIs(Statuses.choices(), Statuses.choices())
+        self.assertIn('NEW', STATUSES)
+        self.assertEqual(PRIORITIES, {1, 2, 3, 4, 5})
+
+    def test_name_errors(self):
+        self.assertEqual(
+            name_errors(
+                {'username': 'ok_name.1', 'first_name': 'A', 'last_name': 'B'}
+            ),
+            {},
+        )
+        self.assertEqual(
+            set(
+                name_errors(
+                    {
+                        'username': 'not ok',
+                        'first_name': 'A1',
+                        'last_name': 'B\n',
+                    }
+                )
+            ),
+            {'username', 'first_name', 'last_name'},
+        )
+
+
+class TestStatusDefault(APITestCase):
+    def setUp(self) -> None:
+        self.project = Project.objects.create(
+            name='Default Status',
+            description='Project used to check the default task status.',
+        )
+
+    def create_task(self, **extra) -> Task:
+        return Task.objects.create(
+            name='Default status task',
+            description='Task description for the default status test.',
+            project=self.project,
+            **extra,
+        )
+
+    def test_new_tasks_are_new(self):
+        task = self.create_task()
+        task.refresh_from_db()
+        self.assertEqual(task.status, 'NEW')
+        self.assertEqual(
+            TaskStat.objects.get(
+                project=self.project, dimension=TaskStat.STATUS, key='NEW'
+            ).count,
+            1,
+        )
+
+    def test_register_keeps_its_error_key(self):
+        serializer = RegisterUserSerializer(
+            data={
+                'username': 'bad name',
+                'first_name': 'Register',
+                'last_name': 'User',
+                'email': 'register@example.com',
+                'position': 'QA',
+                'password': 'Register-password-1',
+                're_password': 'Register-password-1',
+            }
+        )
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('user_name', serializer.errors)
+
+    def test_migration_fixes_stored_defaults(self):
+        task = self.create_task()
+        Task.objects.filter(pk=task.pk).update(status='Statuses.NEW')
+        TaskStat.objects.filter(dimension=TaskStat.STATUS, key='NEW').update(
+            key='Statuses.NEW'
+        )
+        TaskStat.objects.create(
+            project=self.project,
+            dimension=TaskStat.STATUS,
+            key='NEW',
+            count=2,
+        )
+
+        status_default.fix_default_status(apps, None)
+
+        task.refresh_from_db()
+        self.assertEqual(task.status, 'NEW')
+        self.assertEqual(
+            list(
+                TaskStat.objects.filter(dimension=TaskStat.STATUS).values_list(
+                    'key', 'count'
+                )
+            ),
+            [('NEW', 3)],
+        )
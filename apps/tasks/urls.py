@@ -1,10 +1,23 @@
 # -*- coding: utf-8 -*-
+from django.conf import settings
 from django.urls import path
 from apps.tasks.views.tag_views import TagListAPIView, TagDetailApiView
-from apps.tasks.views.task_view import AllTasksListAPIView, TaskDetailAPIView
+from apps.tasks.views.task_view import (
+    AllTasksListAPIView,
+    AllTasksListAsyncView,
+    TaskBulkAPIView,
+    TaskDetailAPIView,
+    TaskExportAPIView,
+)
+
+TaskListView = (
+    AllTasksListAsyncView if settings.ASYNC_VIEWS else AllTasksListAPIView
+)
 
 urlpatterns = [
-    path('', AllTasksListAPIView.as_view()),
+    path('', TaskListView.as_view()),
+    path('bulk/', TaskBulkAPIView.as_view()),
+    path('export/', TaskExportAPIView.as_view()),
     path('<int:pk>/', TaskDetailAPIView.as_view()),
     path('tags/', TagListAPIView.as_view()),
     path('tags/<int:tag_id>', TagDetailApiView.as_view()),
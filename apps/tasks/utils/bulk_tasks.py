@@ -0,0 +1,419 @@
+# -*- coding: utf-8 -*-
+from itertools import islice
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from rest_framework import serializers
+
+from apps.projects.models import Project
+from apps.search.utils.search_index import FIELDS, index_objects
+from apps.tasks.models import Task, Tag
+from apps.tasks.serializers.tasks_serializers import BulkTaskSerializer
+from apps.tasks.utils.task_stats import StatsDelta
+from apps.users.models import User
+from apps.utils.relations import RelationResolver
+from apps.utils.response_cache import invalidate
+
+MAX_BULK_TASKS = 5000
+BATCH_SIZE = 500
+
+TaskTag = Task.tags.through
+
+
+class BulkTaskError(Exception):
+    def __init__(self, errors: list):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def _batches(items: list, size: int = BATCH_SIZE):
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class TaskBatchResolver:
+    """
+    Validates a batch of task payloads and resolves every project name,
+    tag name and assignee email in it with one query.
+    """
+
+    def __init__(self, partial: bool = False):
+        self.serializer = BulkTaskSerializer(partial=partial)
+        # Shared by the batches, so names repeated across them are looked
+        # up once.
+        self.relations = RelationResolver()
+        self.errors = {}
+
+    def add_error(self, index: int, field: str, message) -> None:
+        self.errors.setdefault(index, {})[field] = message
+
+    def validate(self, offset: int, rows: list) -> list:
+        validated = []
+        for index, row in enumerate(rows, start=offset):
+            try:
+                validated.append((index, self.serializer.run_validation(row)))
+            except serializers.ValidationError as exc:
+                for field, message in exc.detail.items():
+                    self.add_error(index, field, message)
+        return validated
+
+    def resolve(self, validated: list) -> list:
+        self.relations.load(
+            {
+                (Project, 'name'): [
+                    data['project']
+                    for _, data in validated
+                    if 'project' in data
+                ],
+                (User, 'email'): [
+                    data['assignee']
+                    for _, data in validated
+                    if data.get('assignee')
+                ],
+                (Tag, 'name'): [
+                    tag
+                    for _, data in validated
+                    for tag in data.get('tags', ())
+                ],
+            }
+        )
+        resolved = []
+        for index, data in validated:
+            valid = True
+            if 'project' in data:
+                data['project_id'] = self.relations.get(
+                    Project, 'name', data.pop('project')
+                )
+                if data['project_id'] is None:
+                    self.add_error(index, 'project', ['Project not found'])
+                    valid = False
+            if 'assignee' in data:
+                email = data.pop('assignee')
+                data['assignee_id'] = (
+                    self.relations.get(User, 'email', email) if email else None
+                )
+                if email and data['assignee_id'] is None:
+                    self.add_error(index, 'assignee', ['Assignee not found'])
+                    valid = False
+            missing = self.relations.missing(Tag, 'name', data.get('tags', ()))
+            if missing:
+                self.add_error(
+                    index,
+                    'tags',
+                    ['Tags not found: {}'.format(', '.join(missing))],
+                )
+                valid = False
+            if valid:
+                if 'tags' in data:
+                    data['tags'] = {
+                        self.relations.get(Tag, 'name', tag)
+                        for tag in data['tags']
+                    }
+                resolved.append((index, data))
+        return resolved
+
+    def check_unique(self, keyed: list, seen: set, exclude=()) -> list:
+        # keyed: (index, data, (project_id, name)) triples. Deleted tasks
+        # keep their names until they are purged.
+        taken = set(
+            Task.all_objects.filter(
+                project_id__in={key[0] for _, _, key in keyed},
+                name__in={key[1] for _, _, key in keyed},
+            )
+            .exclude(pk__in=exclude)
+            .order_by()
+            .values_list('project_id', 'name')
+        )
+        unique = []
+        for index, data, key in keyed:
+            if key in taken or key in seen:
+                self.add_error(
+                    index,
+                    'name',
+                    ['Task with this name already exists in the project'],
+                )
+                continue
+            seen.add(key)
+            unique.append((index, data))
+        return unique
+
+    def raise_errors(self) -> None:
+        if self.errors:
+            raise BulkTaskError(
+                [
+                    {'index': index, 'errors': self.errors[index]}
+                    for index in sorted(self.errors)
+                ]
+            )
+
+
+def _check_size(rows) -> None:
+    if not isinstance(rows, list):
+        raise serializers.ValidationError('Expected a list of tasks')
+    if len(rows) > MAX_BULK_TASKS:
+        raise serializers.ValidationError(
+            f'No more than {MAX_BULK_TASKS} tasks per request'
+        )
+
+
+def _add_tags(task_tags: list) -> None:
+    links = [
+        TaskTag(task_id=task_id, tag_id=tag_id)
+        for task_id, tag_ids in task_tags
+        for tag_id in tag_ids
+    ]
+    TaskTag.objects.bulk_create(
+        links, batch_size=BATCH_SIZE, ignore_conflicts=True
+    )
+
+
+def _fill_ids(tasks: list) -> None:
+    # MySQL can't return primary keys from a multi-row INSERT.
+    if connection.features.can_return_rows_from_bulk_insert:
+        return
+    for batch in _batches(tasks):
+        rows = (
+            Task.all_objects.filter(
+                project_id__in={task.project_id for task in batch},
+                name__in={task.name for task in batch},
+            )
+            .order_by()
+            .values_list('project_id', 'name', 'pk')
+        )
+        # Keyed regardless of case, as MySQL matched the names.
+        ids = {
+            (project_id, name.casefold()): pk for project_id, name, pk in rows
+        }
+        for task in batch:
+            task.pk = ids[(task.project_id, task.name.casefold())]
+
+
+def bulk_create_tasks(rows: list) -> list[int]:
+    _check_size(rows)
+    resolver = TaskBatchResolver()
+    seen = set()
+    tasks, tags = [], []
+
+    for offset in range(0, len(rows), BATCH_SIZE):
+        validated = resolver.validate(
+            offset, rows[offset : offset + BATCH_SIZE]
+        )
+        keyed = [
+            (index, data, (data['project_id'], data['name']))
+            for index, data in resolver.resolve(validated)
+        ]
+        for _, data in resolver.check_unique(keyed, seen):
+            tags.append(data.pop('tags', set()))
+            task = Task(**data)
+            task.set_closed_at()
+            tasks.append(task)
+
+    resolver.raise_errors()
+
+    try:
+        with transaction.atomic():
+            Task.objects.bulk_create(tasks, batch_size=BATCH_SIZE)
+            _fill_ids(tasks)
+            _add_tags(
+                [(task.pk, tag_ids) for task, tag_ids in zip(tasks, tags)]
+            )
+            index_objects('task', tasks, new=True)
+            stats = StatsDelta()
+            for task in tasks:
+                stats.add(task)
+            stats.save()
+    except IntegrityError:
+        raise serializers.ValidationError(
+            'Tasks were changed concurrently, please retry'
+        )
+    # bulk_create sends no post_save signals, hence the explicit index,
+    # stats and cache updates.
+    invalidate(Task._meta.label_lower)
+    return [task.pk for task in tasks]
+
+
+STALE_MESSAGE = 'Task was changed by someone else, reload it and retry'
+
+
+class StaleTasksError(Exception):
+    pass
+
+
+def _read_ids(rows: list, resolver: TaskBatchResolver) -> list:
+    """
+    The ``(id, version)`` of every row; the version is the one the
+    client read the task at, if it sent one.
+    """
+    ids = []
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            row = {}
+        task_id, version = row.get('id'), row.get('version')
+        if not isinstance(task_id, int):
+            resolver.add_error(index, 'id', ['A task id is required'])
+        if version is not None and not isinstance(version, int):
+            resolver.add_error(
+                index, 'version', ['A valid integer is required.']
+            )
+        ids.append((task_id, version))
+    return ids
+
+
+def _find_tasks(
+    resolver: TaskBatchResolver,
+    resolved: list,
+    existing: dict,
+    ids: list,
+    taken: set,
+) -> list:
+    """
+    Adds the task to update to each resolved row, and returns them keyed
+    for the unique check. ``taken`` holds the ids of the tasks earlier
+    rows update.
+    """
+    keyed = []
+    for index, data in resolved:
+        task_id, version = ids[index]
+        if task_id in taken:
+            resolver.add_error(
+                index, 'id', ['Task is already updated by another row']
+            )
+            continue
+        task = existing.get(task_id)
+        if task is None:
+            resolver.add_error(index, 'id', ['Task not found'])
+            continue
+        if version is not None and version != task.version:
+            resolver.add_error(index, 'version', [STALE_MESSAGE])
+            continue
+        taken.add(task_id)
+        data['task'] = task
+        key = (
+            data.get('project_id', task.project_id),
+            data.get('name', task.name),
+        )
+        keyed.append((index, data, key))
+    return keyed
+
+
+def _apply_updates(updates: list) -> tuple:
+    """
+    Sets the validated values on the tasks; returns the tasks, the tag
+    ids of those whose tags are replaced, the changed fields and the
+    stats change.
+    """
+    now = timezone.now()
+    stats = StatsDelta()
+    tasks, task_tags, fields = [], {}, {'updated_at', 'version'}
+    for _, data in updates:
+        task = data.pop('task')
+        stats.add(task, -1)
+        if 'tags' in data:
+            task_tags[task.pk] = data.pop('tags')
+        for attname, value in data.items():
+            setattr(task, attname, value)
+            fields.add(attname.removesuffix('_id'))
+        task.set_closed_at()
+        task.updated_at = now
+        stats.add(task)
+        tasks.append(task)
+    if 'status' in fields:
+        fields.add('closed_at')
+    return tasks, task_tags, fields, stats
+
+
+def _update_rows(tasks: list, fields: set, read_at: dict) -> None:
+    """
+    Writes the tasks a batch at a time. A task only matches while it has
+    the version it was read at, so concurrent edits aren't overwritten.
+    """
+    for batch in _batches(tasks):
+        unchanged = Q()
+        for task in batch:
+            unchanged |= Q(pk=task.pk, version=read_at[task.pk])
+            task.version = F('version') + 1
+        updated = Task.objects.filter(unchanged).bulk_update(batch, fields)
+        if updated != len(batch):
+            raise StaleTasksError()
+
+
+def _replace_tags(task_tags: dict) -> None:
+    # task_tags: task id -> the ids of the tags it should have.
+    for batch in _batches(list(task_tags)):
+        links = TaskTag.objects.filter(task_id__in=batch).values_list(
+            'pk', 'task_id', 'tag_id'
+        )
+        removed = []
+        for pk, task_id, tag_id in links:
+            if tag_id in task_tags[task_id]:
+                task_tags[task_id].discard(tag_id)
+            else:
+                removed.append(pk)
+        if removed:
+            TaskTag.objects.filter(pk__in=removed).delete()
+        # Left: the tags the tasks don't have yet.
+        _add_tags([(task_id, task_tags[task_id]) for task_id in batch])
+
+
+def _stale_errors(updates: list, read_at: dict) -> list:
+    versions = dict(
+        Task.all_objects.filter(pk__in=read_at).values_list('pk', 'version')
+    )
+    return [
+        {'index': index, 'errors': {'version': [STALE_MESSAGE]}}
+        for index, task_id in updates
+        if versions.get(task_id) != read_at[task_id]
+    ]
+
+
+def bulk_update_tasks(rows: list) -> int:
+    """
+    Updates the tasks of ``rows`` by their ``id``. As with a single task,
+    ``tags`` replace a task's tags, and a row fails when its task was
+    changed since it was read, or since the ``version`` the row sends.
+    """
+    _check_size(rows)
+    resolver = TaskBatchResolver(partial=True)
+    ids = _read_ids(rows, resolver)
+    existing_ids = [task_id for task_id, _ in ids if isinstance(task_id, int)]
+    seen, taken = set(), set()
+    updates = []
+    for offset in range(0, len(rows), BATCH_SIZE):
+        existing = Task.objects.in_bulk(
+            [
+                task_id
+                for task_id, _ in ids[offset : offset + BATCH_SIZE]
+                if isinstance(task_id, int)
+            ]
+        )
+        validated = resolver.validate(
+            offset, rows[offset : offset + BATCH_SIZE]
+        )
+        keyed = _find_tasks(
+            resolver, resolver.resolve(validated), existing, ids, taken
+        )
+        updates.extend(
+            resolver.check_unique(keyed, seen, exclude=existing_ids)
+        )
+
+    resolver.raise_errors()
+    indexes = [(index, data['task'].pk) for index, data in updates]
+    read_at = {data['task'].pk: data['task'].version for _, data in updates}
+    tasks, task_tags, fields, stats = _apply_updates(updates)
+    try:
+        with transaction.atomic():
+            _update_rows(tasks, fields, read_at)
+            _replace_tags(task_tags)
+            if fields.intersection(FIELDS):
+                index_objects('task', tasks)
+            stats.save()
+    except StaleTasksError:
+        raise BulkTaskError(_stale_errors(indexes, read_at))
+    except IntegrityError:
+        raise serializers.ValidationError(
+            'Tasks were changed concurrently, please retry'
+        )
+    invalidate(Task._meta.label_lower)
+    return len(tasks)
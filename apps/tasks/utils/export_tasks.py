@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+
+from apps.tasks.serializers.tasks_serializers import AllTasksSerializer
+
+CHUNK_SIZE = 2000
+
+CONTENT_TYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+class Echo:
+    # csv.writer only needs an object with write(); hand the line back.
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_task_rows(tasks: QuerySet):
+    rows = AllTasksSerializer.values_queryset(tasks).order_by(
+        '-deadline', '-id'
+    )
+    return AllTasksSerializer.iter_values(rows.iterator(chunk_size=CHUNK_SIZE))
+
+
+def stream_csv(tasks: QuerySet):
+    writer = csv.writer(Echo())
+    yield writer.writerow(AllTasksSerializer.Meta.fields)
+    for row in iter_task_rows(tasks):
+        yield writer.writerow(row.values())
+
+
+def stream_ndjson(tasks: QuerySet):
+    encoder = DjangoJSONEncoder()
+    for row in iter_task_rows(tasks):
+        yield encoder.encode(row) + '\n'
+
+
+STREAMS = {
+    'csv': stream_csv,
+    'ndjson': stream_ndjson,
+}
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as DecodeError
+from datetime import datetime
+
+from django.core.paginator import InvalidPage, Page
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class TaskPagination(PageNumberPagination):
+    page_size = 5
+    page_size_query_param = 'page_size'
+    max_page_size = 10
+
+    async def apaginate_queryset(
+        self, queryset: QuerySet, request: Request, view=None
+    ) -> list:
+        self.request = request
+        page_size = self.get_page_size(request)
+        paginator = self.django_paginator_class(queryset, page_size)
+        # Paginator counts synchronously; prime it through the async ORM.
+        paginator.count = await queryset.acount()
+        try:
+            number = paginator.validate_number(
+                self.get_page_number(request, paginator)
+            )
+        except InvalidPage as exc:
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=request.query_params.get(
+                        self.page_query_param, 1
+                    ),
+                    message=str(exc),
+                )
+            )
+        bottom = (number - 1) * page_size
+        rows = [row async for row in queryset[bottom : bottom + page_size]]
+        self.page = Page(rows, number, paginator)
+        return rows
+
+
+class TaskCursorPagination(BasePagination):
+    """
+    Keyset pagination over the stable ``(deadline, id)`` key.
+
+    Every page is a single indexed range scan: no COUNT query and no
+    OFFSET, so the cost of a page doesn't depend on how deep it is.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size = TaskPagination.page_size
+    page_size_query_param = TaskPagination.page_size_query_param
+    max_page_size = TaskPagination.max_page_size
+    ordering = ('-deadline', '-id')
+    invalid_cursor_message = 'Invalid cursor'
+
+    @classmethod
+    def is_requested(cls, request: Request) -> bool:
+        return cls.cursor_query_param in request.query_params
+
+    def get_page_size(self, request: Request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def encode_cursor(self, deadline: datetime, pk: int) -> str:
+        raw = '{}|{}'.format(deadline.isoformat(), pk)
+        return urlsafe_b64encode(raw.encode('ascii')).decode('ascii')
+
+    def decode_cursor(self, request: Request) -> tuple[datetime, int] | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            raw = urlsafe_b64decode(encoded.encode('ascii'))
+            deadline, pk = raw.decode('ascii').split('|')
+            return datetime.fromisoformat(deadline), int(pk)
+        except (DecodeError, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_page_queryset(
+        self, queryset: QuerySet, request: Request
+    ) -> QuerySet:
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.next_position = None
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request)
+        if position is not None:
+            deadline, pk = position
+            queryset = queryset.filter(
+                Q(deadline__lt=deadline) | Q(deadline=deadline, id__lt=pk)
+            )
+        # One extra row tells us whether a next page exists.
+        return queryset[: self.page_size + 1]
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view=None
+    ) -> list:
+        page = self.get_page_queryset(queryset, request)
+        return self.trim_page(list(page))
+
+    async def apaginate_queryset(
+        self, queryset: QuerySet, request: Request, view=None
+    ) -> list:
+        page = self.get_page_queryset(queryset, request)
+        return self.trim_page([row async for row in page])
+
+    def trim_page(self, results: list) -> list:
+        if len(results) > self.page_size:
+            results = results[: self.page_size]
+            self.next_position = self.get_position(results[-1])
+        return results
+
+    def get_position(self, row) -> tuple[datetime, int]:
+        if isinstance(row, dict):
+            return row['deadline'], row['id']
+        if isinstance(row, tuple):
+            # A ``values_list(named=True)`` row.
+            return row.deadline, row.id
+        return row.deadline, row.pk
+
+    def get_next_link(self) -> str | None:
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, 'page')
+        return replace_query_param(
+            url,
+            self.cursor_query_param,
+            self.encode_cursor(*self.next_position),
+        )
+
+    def get_paginated_response(self, data) -> Response:
+        return Response({'next': self.get_next_link(), 'results': data})
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
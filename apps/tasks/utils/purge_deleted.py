@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime
+
+from django.db import transaction
+
+from apps.projects.models import Project
+from apps.search.utils.search_index import remove_objects
+from apps.tasks.models import Task
+from apps.users.models import User
+from apps.utils.response_cache import invalidate
+from apps.utils.soft_delete import delete_in_batches
+
+BATCH_SIZE = 500
+
+
+def _retire_project_tasks(project: Project, batch_size: int) -> int:
+    # The tasks of a deleted project become tombstones dated like the
+    # project, so the task purge below takes them right away. Their
+    # counters go with the project.
+    live = Task.all_objects.alive().filter(project_id=project.pk).order_by()
+    retired = 0
+    while ids := list(live.values_list('pk', flat=True)[:batch_size]):
+        with transaction.atomic():
+            Task.all_objects.filter(pk__in=ids).update(
+                deleted_at=project.deleted_at
+            )
+            remove_objects('task', ids)
+        retired += len(ids)
+    return retired
+
+
+def purge_deleted(before: datetime, batch_size: int = BATCH_SIZE) -> dict:
+    """
+    Hard deletes the rows soft deleted before ``before``: tasks with their
+    tag links first, then projects, then users no task refers to. Every
+    batch commits on its own.
+    """
+    projects = Project.all_objects.dead().filter(deleted_at__lt=before)
+    for project in projects.only('pk', 'deleted_at').iterator():
+        _retire_project_tasks(project, batch_size)
+
+    counts = {
+        'tasks': delete_in_batches(
+            Task.all_objects.dead().filter(deleted_at__lt=before), batch_size
+        ),
+        # One project per transaction: each still cascades to its
+        # counters, uploads and file links.
+        'projects': delete_in_batches(projects, 1),
+        'users': delete_in_batches(
+            User.all_objects.dead().filter(
+                deleted_at__lt=before, tasks__isnull=True
+            ),
+            batch_size,
+        ),
+    }
+    invalidate(
+        Task._meta.label_lower,
+        Project._meta.label_lower,
+        User._meta.label_lower,
+    )
+    return counts
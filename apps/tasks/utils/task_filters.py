@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+from django.db.models import Count, QuerySet
+
+from apps.tasks.models import Task
+from apps.tasks.serializers.task_filter_serializers import (
+    TaskFilterSerializer,
+)
+
+TaskTag = Task.tags.through
+
+FILTER_PARAMS = tuple(TaskFilterSerializer().fields)
+
+
+def _tagged_task_ids(names: list[str], match: str) -> QuerySet:
+    # A semi-join on the through table: unlike joining tags, it can't
+    # return a task once per matching tag.
+    links = TaskTag.objects.filter(tag__name__in=names)
+    if match == 'all':
+        links = (
+            links.values('task_id')
+            .annotate(matched=Count('tag__name', distinct=True))
+            .filter(matched=len(set(names)))
+        )
+    return links.values('task_id')
+
+
+def compile_filters(filters: dict, queryset: QuerySet) -> QuerySet:
+    """
+    Applies validated ``TaskFilterSerializer`` data to a task queryset;
+    every filter becomes a condition of the same SELECT.
+    """
+    conditions = {}
+    if 'project' in filters:
+        conditions['project__name'] = filters['project']
+    if 'assignee' in filters:
+        conditions['assignee__email'] = filters['assignee']
+    if filters.get('unassigned'):
+        conditions['assignee__isnull'] = True
+    if 'status' in filters:
+        conditions['status__in'] = filters['status']
+    if 'priority_min' in filters:
+        conditions['priority__gte'] = filters['priority_min']
+    if 'priority_max' in filters:
+        conditions['priority__lte'] = filters['priority_max']
+    if 'deadline_after' in filters:
+        conditions['deadline__gte'] = filters['deadline_after']
+    if 'deadline_before' in filters:
+        conditions['deadline__lt'] = filters['deadline_before']
+    if 'tags' in filters:
+        conditions['pk__in'] = _tagged_task_ids(
+            filters['tags'], filters.get('tags_match', 'any')
+        )
+    return queryset.filter(**conditions)
+
+
+def filter_tasks(params, queryset: QuerySet | None = None) -> QuerySet:
+    """
+    Validates the task list query parameters and compiles them into one
+    queryset. Raises ``ValidationError`` for invalid values and for
+    combinations no index covers.
+    """
+    serializer = TaskFilterSerializer(data=params)
+    serializer.is_valid(raise_exception=True)
+    if queryset is None:
+        queryset = Task.objects.all()
+    return compile_filters(serializer.validated_data, queryset)
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+from collections import Counter
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.tasks.models import Task, TaskStat
+from apps.users.models import User
+from apps.utils.validation import (
+    CLOSED_STATUS,
+    PRIORITY_CHOICES,
+    STATUS_CHOICES,
+)
+
+CLOSED = CLOSED_STATUS
+# Task fields the counters are derived from.
+TRACKED_FIELDS = (
+    'project',
+    'status',
+    'priority',
+    'assignee',
+    'deadline',
+    'created_at',
+    'closed_at',
+    'deleted_at',
+)
+SERIES = (TaskStat.CREATED, TaskStat.CLOSED)
+BATCH_SIZE = 1000
+
+
+def _day(value) -> str:
+    return timezone.localdate(value).isoformat()
+
+
+def tracks(update_fields) -> bool:
+    return any(
+        field.removesuffix('_id') in TRACKED_FIELDS for field in update_fields
+    )
+
+
+def task_keys(task: Task) -> list[tuple[int, str, str]]:
+    """
+    The ``(project_id, dimension, key)`` counters a task adds one to.
+    """
+    if task.deleted_at is not None:
+        return []
+    keys = [
+        (TaskStat.STATUS, task.status),
+        (TaskStat.PRIORITY, str(task.priority)),
+        (TaskStat.CREATED, _day(task.created_at)),
+    ]
+    if task.status == CLOSED:
+        if task.closed_at is not None:
+            keys.append((TaskStat.CLOSED, _day(task.closed_at)))
+    else:
+        keys.append((TaskStat.ASSIGNEE, str(task.assignee_id or '')))
+        keys.append((TaskStat.DUE, _day(task.deadline)))
+    return [(task.project_id, dimension, key) for dimension, key in keys]
+
+
+def _upsert_sql(rows: int) -> str:
+    quote = connection.ops.quote_name
+    table = quote(TaskStat._meta.db_table)
+    key_columns = ', '.join(map(quote, ('project_id', 'dimension', 'key')))
+    count = quote('count')
+    sql = 'INSERT INTO {} ({}, {}) VALUES {} '.format(
+        table, key_columns, count, ', '.join(['(%s, %s, %s, %s)'] * rows)
+    )
+    if connection.vendor == 'mysql':
+        return sql + 'ON DUPLICATE KEY UPDATE {0} = {0} + VALUES({0})'.format(
+            count
+        )
+    return sql + 'ON CONFLICT ({0}) DO UPDATE SET {1} = {2}.{1} + {3}'.format(
+        key_columns, count, table, 'excluded.' + count
+    )
+
+
+class StatsDelta:
+    """
+    Collects counter changes and applies them as increments, so
+    concurrent writers never overwrite each other's counts.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def add(self, task: Task, sign: int = 1) -> None:
+        for key in task_keys(task):
+            self.counts[key] += sign
+
+    def save(self) -> None:
+        increments = [
+            (*key, delta) for key, delta in self.counts.items() if delta > 0
+        ]
+        # Decrements only touch existing rows: a missing row means the
+        # project is being deleted along with its counters.
+        for (project_id, dimension, key), delta in self.counts.items():
+            if delta < 0:
+                TaskStat.objects.filter(
+                    project_id=project_id, dimension=dimension, key=key
+                ).update(count=F('count') + delta)
+        with connection.cursor() as cursor:
+            for offset in range(0, len(increments), BATCH_SIZE):
+                batch = increments[offset : offset + BATCH_SIZE]
+                cursor.execute(
+                    _upsert_sql(len(batch)),
+                    [value for row in batch for value in row],
+                )
+        self.counts.clear()
+
+
+def rebuild_task_stats() -> int:
+    """
+    Recomputes every counter with one GROUP BY query per dimension.
+    """
+    tz = timezone.get_current_timezone()
+    tasks = Task.objects.order_by()
+    open_tasks = tasks.exclude(status=CLOSED)
+    groups = (
+        (TaskStat.STATUS, tasks, F('status')),
+        (TaskStat.PRIORITY, tasks, F('priority')),
+        (TaskStat.CREATED, tasks, TruncDate('created_at', tzinfo=tz)),
+        (
+            TaskStat.CLOSED,
+            tasks.filter(status=CLOSED, closed_at__isnull=False),
+            TruncDate('closed_at', tzinfo=tz),
+        ),
+        (TaskStat.ASSIGNEE, open_tasks, F('assignee_id')),
+        (TaskStat.DUE, open_tasks, TruncDate('deadline', tzinfo=tz)),
+    )
+
+    stats = []
+    for dimension, queryset, bucket in groups:
+        rows = (
+            queryset.annotate(bucket=bucket)
+            .values('project_id', 'bucket')
+            .annotate(total=Count('pk'))
+        )
+        for row in rows:
+            key = row['bucket']
+            if key is None:
+                key = ''
+            elif hasattr(key, 'isoformat'):
+                key = key.isoformat()
+            stats.append(
+                TaskStat(
+                    project_id=row['project_id'],
+                    dimension=dimension,
+                    key=str(key),
+                    count=row['total'],
+                )
+            )
+
+    with transaction.atomic():
+        TaskStat.objects.all().delete()
+        TaskStat.objects.bulk_create(stats, batch_size=BATCH_SIZE)
+    return len(stats)
+
+
+def project_stats(project_id: int, days: int = 30) -> dict:
+    """
+    Reads a project's statistics from its counters; ``days`` is the
+    length of the created/closed per day series, ending today.
+    """
+    today = timezone.localdate()
+    since = (today - timedelta(days=days - 1)).isoformat()
+    rows = (
+        TaskStat.objects.filter(project_id=project_id)
+        .filter(
+            Q(dimension__in=SERIES, key__gte=since)
+            | Q(dimension=TaskStat.DUE, key__lt=today.isoformat())
+            | ~Q(dimension__in=(*SERIES, TaskStat.DUE))
+        )
+        .exclude(count=0)
+        .values_list('dimension', 'key', 'count')
+    )
+
+    by_status = {name: 0 for name, _ in STATUS_CHOICES}
+    by_priority = {str(value): 0 for value, _ in PRIORITY_CHOICES}
+    load, series, overdue = {}, {name: {} for name in SERIES}, 0
+    for dimension, key, count in rows:
+        if dimension == TaskStat.STATUS:
+            by_status[key] = count
+        elif dimension == TaskStat.PRIORITY:
+            by_priority[key] = count
+        elif dimension == TaskStat.ASSIGNEE:
+            load[int(key) if key else None] = count
+        elif dimension == TaskStat.DUE:
+            # Open tasks due before today; per-day counters can't tell
+            # which of today's deadlines have passed.
+            overdue += count
+        else:
+            series[dimension][key] = count
+
+    emails = dict(
+        User.objects.filter(pk__in=[pk for pk in load if pk]).values_list(
+            'pk', 'email'
+        )
+    )
+    dates = [
+        (today - timedelta(days=offset)).isoformat()
+        for offset in range(days - 1, -1, -1)
+    ]
+    total = sum(by_status.values())
+    return {
+        'project': project_id,
+        'total': total,
+        'open': total - by_status.get(CLOSED, 0),
+        'overdue': overdue,
+        'by_status': by_status,
+        'by_priority': by_priority,
+        'assignee_load': [
+            {'assignee': emails.get(pk), 'open_tasks': count}
+            for pk, count in sorted(load.items(), key=lambda item: -item[1])
+        ],
+        'created_per_day': [
+            {'date': day, 'count': series[TaskStat.CREATED].get(day, 0)}
+            for day in dates
+        ],
+        'closed_per_day': [
+            {'date': day, 'count': series[TaskStat.CLOSED].get(day, 0)}
+            for day in dates
+        ],
+    }
@@ -7,6 +7,7 @@ from rest_framework import status
 
 from apps.tasks.models import Tag
 from apps.tasks.serializers.tag_serializers import TagSerializer
+from apps.utils.response_cache import cache_response
 
 
 class TagListAPIView(APIView):
@@ -15,6 +16,7 @@ class TagListAPIView(APIView):
         tags = Tag.objects.all()
         return tags
 
+    @cache_response('tasks.Tag')
     def get(self, request: Request) -> Response:
         tags = self.get_objects()
 
@@ -1,50 +1,56 @@
 # -*- coding: utf-8 -*-
-from rest_framework.decorators import permission_classes
+from django.http import StreamingHttpResponse
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.request import Request
 from rest_framework.views import APIView
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework import status
 
 from rest_framework.generics import get_object_or_404
 
+from apps.jobs.utils.responses import enqueue_for, prefers_async
 from apps.tasks.models import Task
 from apps.tasks.serializers.tasks_serializers import (
     AllTasksSerializer,
     CreateUpdateTaskSerializer,
     TaskDetailSerializer,
 )
+from apps.tasks.utils.bulk_tasks import (
+    BulkTaskError,
+    bulk_create_tasks,
+    bulk_update_tasks,
+)
+from apps.tasks.utils.export_tasks import CONTENT_TYPES, STREAMS
+from apps.tasks.utils.pagination import TaskPagination, TaskCursorPagination
+from apps.tasks.utils.task_filters import FILTER_PARAMS, filter_tasks
+from apps.utils.async_views import AsyncAPIView
+from apps.utils.permissions import MethodPermissionsMixin
+from apps.utils.response_cache import acache_response, cache_response
+from apps.utils.versioning import VersionConflict, if_match, version_etag
 
 
-class TaskPagination(PageNumberPagination):
-    page_size = 5
-    page_size_query_param = 'page_size'
-    max_page_size = 10
-
-
-class AllTasksListAPIView(APIView):
-    def get_permissions(self):
-        if self.request.method == 'GET':
-            self.permission_classes = [IsAuthenticated]
-        elif self.request.method == 'POST':
-            self.permission_classes = [IsAuthenticated | IsAdminUser]
-
-        return [permission() for permission in self.permission_classes]
-
+class TaskFilterMixin:
     def get_objects(self):
-        project_name = self.request.query_params.get('project')
-        assignee_email = self.request.query_params.get('assignee')
+        return filter_tasks(self.request.query_params)
+
 
-        if project_name:
-            return Task.objects.filter(project__name=project_name)
-        elif assignee_email:
-            return Task.objects.filter(assignee__email=assignee_email)
-        else:
-            return Task.objects.all()
+class AllTasksListAPIView(TaskFilterMixin, MethodPermissionsMixin, APIView):
+    method_permission_classes = {
+        'GET': [IsAuthenticated],
+        'POST': [IsAuthenticated | IsAdminUser],
+    }
 
+    @cache_response(
+        'tasks.Task',
+        'projects.Project',
+        'users.User',
+        skip_params=FILTER_PARAMS,
+    )
     def get(self, request, *args, **kwargs):
-        tasks = self.get_objects()
+        tasks = AllTasksSerializer.values_queryset(self.get_objects(), 'id')
+
+        if TaskCursorPagination.is_requested(request):
+            return self.get_cursor_page(request, tasks)
 
         if not tasks.exists():
             return Response(data=[], status=status.HTTP_204_NO_CONTENT)
@@ -55,17 +61,26 @@ class AllTasksListAPIView(APIView):
         )
 
         if paginated_tasks is not None:
-            serializer = AllTasksSerializer(paginated_tasks, many=True)
+            data = AllTasksSerializer.represent_values(paginated_tasks)
+
+            return paginator.get_paginated_response(data)
 
-            return paginator.get_paginated_response(serializer.data)
+        data = AllTasksSerializer.represent_values(tasks)
+        return Response(data, status=status.HTTP_200_OK)
 
-        serializer = AllTasksSerializer(tasks, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+    def get_cursor_page(self, request, tasks):
+        paginator = TaskCursorPagination()
+        paginated_tasks = paginator.paginate_queryset(
+            tasks, request, view=self
+        )
+
+        if not paginated_tasks and not paginator.decode_cursor(request):
+            return Response(data=[], status=status.HTTP_204_NO_CONTENT)
+
+        data = AllTasksSerializer.represent_values(paginated_tasks)
+        return paginator.get_paginated_response(data)
 
     def post(self, request, *args, **kwargs):
-        print(self.request.user.is_anonymous)
-        print(self.request.user.is_authenticated)
-        print(self.request.user)
         serializer = CreateUpdateTaskSerializer(data=request.data)
         if serializer.is_valid():
             serializer.save()
@@ -73,6 +88,45 @@ class AllTasksListAPIView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class AllTasksListAsyncView(TaskFilterMixin, AsyncAPIView):
+    sync_view = AllTasksListAPIView
+    login_required = True
+
+    @acache_response(
+        'tasks.Task',
+        'projects.Project',
+        'users.User',
+        skip_params=FILTER_PARAMS,
+    )
+    async def get(self, request, *args, **kwargs):
+        tasks = AllTasksSerializer.values_queryset(self.get_objects(), 'id')
+
+        if TaskCursorPagination.is_requested(request):
+            return await self.get_cursor_page(request, tasks)
+
+        if not await tasks.aexists():
+            return Response(data=[], status=status.HTTP_204_NO_CONTENT)
+
+        paginator = TaskPagination()
+        paginated_tasks = await paginator.apaginate_queryset(
+            tasks, request, view=self
+        )
+        data = AllTasksSerializer.represent_values(paginated_tasks)
+        return paginator.get_paginated_response(data)
+
+    async def get_cursor_page(self, request, tasks):
+        paginator = TaskCursorPagination()
+        paginated_tasks = await paginator.apaginate_queryset(
+            tasks, request, view=self
+        )
+
+        if not paginated_tasks and not paginator.decode_cursor(request):
+            return Response(data=[], status=status.HTTP_204_NO_CONTENT)
+
+        data = AllTasksSerializer.represent_values(paginated_tasks)
+        return paginator.get_paginated_response(data)
+
+
 # Sample post query
 # {
 #     "name": "Update endpoint to get all users"
@@ -84,21 +138,98 @@ class AllTasksListAPIView(APIView):
 # }
 
 
+class TaskExportAPIView(TaskFilterMixin, APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request: Request, *args, **kwargs):
+        export_format = request.query_params.get('export_format', 'csv')
+        if export_format not in STREAMS:
+            return Response(
+                data={
+                    'export_format': 'Should be one of: {}'.format(
+                        ', '.join(STREAMS)
+                    )
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        response = StreamingHttpResponse(
+            STREAMS[export_format](self.get_objects()),
+            content_type=CONTENT_TYPES[export_format],
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="tasks.{export_format}"'
+        )
+        return response
+
+
+class TaskBulkAPIView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        if prefers_async(request):
+            return enqueue_for(
+                request, 'tasks.bulk_create', {'rows': request.data}
+            )
+        try:
+            task_ids = bulk_create_tasks(request.data)
+        except BulkTaskError as exc:
+            return Response(
+                data=exc.errors, status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(
+            data={'created': len(task_ids), 'ids': task_ids},
+            status=status.HTTP_201_CREATED,
+        )
+
+    def patch(self, request: Request, *args, **kwargs) -> Response:
+        if prefers_async(request):
+            return enqueue_for(
+                request, 'tasks.bulk_update', {'rows': request.data}
+            )
+        try:
+            updated = bulk_update_tasks(request.data)
+        except BulkTaskError as exc:
+            return Response(
+                data=exc.errors, status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(data={'updated': updated}, status=status.HTTP_200_OK)
+
+
 class TaskDetailAPIView(APIView):
-    def get_object(self):
-        return get_object_or_404(Task, pk=self.kwargs['pk'])
+    def get_object(self, queryset=None):
+        if queryset is None:
+            queryset = Task.objects.all()
+        return get_object_or_404(queryset, pk=self.kwargs['pk'])
 
     def get(self, request: Request, *args, **kwargs):
-        task = self.get_object()
+        task = self.get_object(
+            TaskDetailSerializer.optimize_queryset(Task.objects.all())
+        )
         serializer = TaskDetailSerializer(task)
 
-        return Response(data=serializer.data, status=status.HTTP_200_OK)
+        return Response(
+            data=serializer.data,
+            status=status.HTTP_200_OK,
+            headers={'ETag': version_etag(task)},
+        )
 
-    def put(self, request: Request, *args, **kwargs):
-        task = self.get_object()
+    def patch(self, request: Request, *args, **kwargs):
+        task = self.get_object(
+            Task.objects.select_related(
+                'project', 'assignee'
+            ).prefetch_related('tags')
+        )
+        if not if_match(request, task):
+            return self.version_conflict(
+                task, status.HTTP_412_PRECONDITION_FAILED
+            )
 
-        serializer = TaskDetailSerializer(
-            instance=task, data=request.data, partial=True
+        serializer = CreateUpdateTaskSerializer(
+            instance=task,
+            data=request.data,
+            partial=True,
+            context={'request': request},
         )
 
         if not serializer.is_valid():
@@ -106,13 +237,41 @@ class TaskDetailAPIView(APIView):
                 data=serializer.errors, status=status.HTTP_400_BAD_REQUEST
             )
 
-        serializer.save()
-        return Response(data=serializer.data, status=status.HTTP_200_OK)
+        try:
+            serializer.save()
+        except VersionConflict:
+            # Changed between the read and the write.
+            task = self.get_object()
+            if 'If-Match' in request.headers:
+                return self.version_conflict(
+                    task, status.HTTP_412_PRECONDITION_FAILED
+                )
+            return self.version_conflict(task, status.HTTP_409_CONFLICT)
+        # The same representation as GET, whichever method updated it.
+        return Response(
+            data=TaskDetailSerializer(task).data,
+            status=status.HTTP_200_OK,
+            headers={'ETag': version_etag(task)},
+        )
+
+    # Updates were always partial.
+    put = patch
+
+    def version_conflict(self, task: Task, status_code: int) -> Response:
+        return Response(
+            data={
+                'message': 'Task was changed by someone else, '
+                'reload it and retry',
+                'version': task.version,
+            },
+            status=status_code,
+            headers={'ETag': version_etag(task)},
+        )
 
     def delete(self, request: Request, *args, **kwargs):
         task = self.get_object()
 
-        task.delete()
+        task.soft_delete()
 
         delete_message = {"message": "Task was successfully deleted"}
         return Response(data=delete_message, status=status.HTTP_200_OK)
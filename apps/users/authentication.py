@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import copy
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework import exceptions
+from rest_framework.authentication import (
+    BaseAuthentication,
+    get_authorization_header,
+)
+
+from apps.users.models import Token
+from apps.utils.ttl_cache import TTLCache
+
+KEYWORD = 'Token'
+
+# Token digest -> user with its permission set loaded. Signals drop an
+# entry when its user or token changes in this process; other processes
+# see the change once the entry expires.
+principals = TTLCache(
+    'auth.principals',
+    maxsize=getattr(settings, 'AUTH_CACHE_SIZE', 1024),
+    ttl=getattr(settings, 'AUTH_CACHE_TTL', 60),
+)
+
+
+def get_token_key(request) -> str | None:
+    """
+    Returns the key of an ``Authorization: Token <key>`` header.
+    """
+    auth = get_authorization_header(request).split()
+    if not auth or auth[0].lower() != KEYWORD.lower().encode():
+        return None
+    if len(auth) != 2:
+        raise exceptions.AuthenticationFailed(
+            'Invalid token header. Provide exactly one token.'
+        )
+    try:
+        return auth[1].decode()
+    except UnicodeError:
+        raise exceptions.AuthenticationFailed(
+            'Invalid token header. The token has invalid characters.'
+        )
+
+
+def cached_principal(digest: str):
+    user = principals.get(digest)
+    # Views may change request.user; the cached one stays as loaded.
+    return copy.copy(user) if user is not None else None
+
+
+def load_principal(digest: str):
+    """
+    Loads the token's user and their permissions, and caches them.
+    """
+    token = Token.objects.select_related('user').filter(digest=digest).first()
+    if token is None:
+        raise exceptions.AuthenticationFailed('Invalid token.')
+    user = token.user
+    if not user.is_active or user.deleted_at is not None:
+        raise exceptions.AuthenticationFailed('User inactive or deleted.')
+    # Fills the backend's permission caches on the instance, so has_perm()
+    # doesn't query on a cache hit either.
+    user.get_all_permissions()
+    principals.set(digest, user)
+    return copy.copy(user)
+
+
+def forget_user(user_id) -> None:
+    principals.delete_where(lambda user: user.pk == user_id)
+
+
+class CachedTokenAuthentication(BaseAuthentication):
+    """
+    ``Authorization: Token <key>`` authentication whose resolved user is
+    kept in ``principals``: a cache hit costs no query.
+    """
+
+    def authenticate(self, request):
+        key = get_token_key(request)
+        if key is None:
+            return None
+        digest = Token.hash_key(key)
+        user = cached_principal(digest) or load_principal(digest)
+        return user, digest
+
+    async def aauthenticate(self, request):
+        # For async views: a cache hit doesn't leave the event loop.
+        key = get_token_key(request)
+        if key is None:
+            return None
+        digest = Token.hash_key(key)
+        user = cached_principal(digest)
+        if user is None:
+            user = await sync_to_async(load_principal)(digest)
+        return user, digest
+
+    def authenticate_header(self, request) -> str:
+        return KEYWORD
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from enum import Enum
+from functools import cache
 
 
 class Positions(Enum):
@@ -13,5 +14,6 @@ class Positions(Enum):
     QA = "QA"
 
     @classmethod
-    def choices(cls):
-        return [(attr.name, attr.value) for attr in cls]
+    @cache
+    def choices(cls) -> tuple:
+        return tuple((attr.name, attr.value) for attr in cls)
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """
+    Django's PBKDF2 hasher with ``PASSWORD_HASH_ITERATIONS`` iterations
+    when that is set, e.g. a cheaper cost on staging. Hashes carry their
+    iteration count, so they verify anywhere, and a login where the
+    setting differs rehashes the password with the local cost.
+    """
+
+    @property
+    def iterations(self) -> int:
+        return (
+            getattr(settings, 'PASSWORD_HASH_ITERATIONS', None)
+            or super().iterations
+        )
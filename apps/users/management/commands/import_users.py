@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import csv
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework import serializers
+
+from apps.users.utils.bulk_users import BulkUserError, bulk_create_users
+
+# Errors printed before the rest are only counted.
+MAX_REPORTED_ERRORS = 20
+
+
+def read_rows(path: str) -> list:
+    with open(path, newline="", encoding="utf-8") as file:
+        if path.endswith(".csv"):
+            # Empty cells are left out, so optional columns stay optional.
+            return [
+                {column: value for column, value in row.items() if value}
+                for row in csv.DictReader(file)
+            ]
+        if path.endswith((".ndjson", ".jsonl")):
+            return [json.loads(line) for line in file if line.strip()]
+        return json.load(file)
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates the users of a CSV, JSON or NDJSON file with username, "
+        "first_name, last_name, email, position, password and optionally "
+        "phone and project. Nothing is created when a row is invalid."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument(
+            "--processes",
+            type=int,
+            help="Processes hashing passwords, one per CPU by default.",
+        )
+        parser.add_argument(
+            "--hash-iterations",
+            type=int,
+            help="Password hashing cost, e.g. a lower one on staging.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            rows = read_rows(options["path"])
+        except (OSError, ValueError) as exc:
+            raise CommandError(
+                "Can't read {}: {}".format(options["path"], exc)
+            )
+
+        start = time.perf_counter()
+        try:
+            user_ids = bulk_create_users(
+                rows,
+                limit=None,
+                processes=options["processes"],
+                iterations=options["hash_iterations"],
+            )
+        except BulkUserError as exc:
+            for error in exc.errors[:MAX_REPORTED_ERRORS]:
+                self.stderr.write(
+                    "Row {index}: {errors}".format(
+                        index=error["index"],
+                        errors=json.dumps(error["errors"]),
+                    )
+                )
+            raise CommandError(
+                "{} invalid rows, no user was created.".format(len(exc.errors))
+            )
+        except (serializers.ValidationError, ValueError) as exc:
+            raise CommandError(str(exc))
+        self.stdout.write(
+            "Created {} users in {:.1f}s.".format(
+                len(user_ids), time.perf_counter() - start
+            )
+        )
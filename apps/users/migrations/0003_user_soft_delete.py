@@ -0,0 +1,30 @@
+# Generated by Django 5.0 on 2026-10-18 12:41
+
+import apps.users.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('projects', '0007_project_soft_delete'),
+        ('users', '0002_alter_user_position'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', apps.users.models.ActiveUserManager()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(
+                condition=models.Q(('deleted_at__isnull', False)),
+                fields=['deleted_at'],
+                name='user_deleted_at_idx',
+            ),
+        ),
+    ]
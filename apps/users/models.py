@@ -1,13 +1,27 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import secrets
+
 from django.db import models
 from django.contrib.auth.models import PermissionsMixin, UserManager
 from django.contrib.auth.base_user import AbstractBaseUser
 
 from apps.projects.models import Project
-from apps.users.choices.positions import Positions
+from apps.utils.soft_delete import (
+    SoftDeleteManager,
+    SoftDeleteModel,
+    SoftDeleteQuerySet,
+)
+from apps.utils.validation import POSITION_CHOICES
+
 
+class ActiveUserManager(SoftDeleteManager, UserManager):
+    # Authentication looks users up through the default manager, so
+    # deleted users can't log in either.
+    pass
 
-class User(AbstractBaseUser, PermissionsMixin):
+
+class User(AbstractBaseUser, PermissionsMixin, SoftDeleteModel):
     username = models.CharField(max_length=50, unique=True)
     first_name = models.CharField(max_length=40)
     last_name = models.CharField(max_length=40)
@@ -27,9 +41,12 @@ class User(AbstractBaseUser, PermissionsMixin):
         blank=True,
         null=True,
     )
-    position = models.CharField(max_length=20, choices=Positions.choices())
+    position = models.CharField(max_length=20, choices=POSITION_CHOICES)
+
+    objects = ActiveUserManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
 
-    objects = UserManager()
+    deleted_fields = ('deleted_at', 'deleted')
 
     USERNAME_FIELD = "email"
 
@@ -37,3 +54,41 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     def __str__(self):
         return self.username
+
+    def soft_delete(self) -> None:
+        self.deleted = True
+        super().soft_delete()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['deleted_at'],
+                condition=models.Q(deleted_at__isnull=False),
+                name='user_deleted_at_idx',
+            ),
+        ]
+
+
+class Token(models.Model):
+    """
+    API token; only the SHA-256 digest of the key is stored, the key
+    itself is shown once, when the token is created.
+    """
+
+    digest = models.CharField(max_length=64, unique=True, editable=False)
+    user = models.ForeignKey(
+        User, related_name='tokens', on_delete=models.CASCADE
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f'Token of {self.user}'
+
+    @staticmethod
+    def hash_key(key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    @classmethod
+    def issue(cls, user: User) -> tuple['Token', str]:
+        key = secrets.token_urlsafe(32)
+        return cls.objects.create(digest=cls.hash_key(key), user=user), key
@@ -1,14 +1,17 @@
 # -*- coding: utf-8 -*-
-import re
+from django.contrib.auth import authenticate
 from django.core.exceptions import ValidationError
 from django.contrib.auth.password_validation import validate_password
 
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 
 from apps.users.models import User
+from apps.utils.query_plan import QueryPlanMixin
+from apps.utils.validation import name_errors
 
 
-class UserListSerializer(serializers.ModelSerializer):
+class UserListSerializer(QueryPlanMixin, serializers.ModelSerializer):
 
     class Meta:
         model = User
@@ -37,27 +40,28 @@ class RegisterUserSerializer(serializers.ModelSerializer):
             "password",
             "re_password",
         ]
-        extra_kwargs = {"password": {"write_only": True}}
+        # Deleted users keep their username and email until purged.
+        extra_kwargs = {
+            "password": {"write_only": True},
+            "username": {
+                "validators": [
+                    UniqueValidator(queryset=User.all_objects.all())
+                ]
+            },
+            "email": {
+                "validators": [
+                    UniqueValidator(queryset=User.all_objects.all())
+                ]
+            },
+        }
 
     def validate(self, attrs):
-        user_name = attrs.get('username')
-        first_name = attrs.get('first_name')
-        last_name = attrs.get('last_name')
-
-        if not re.match('^[A-Za-z0-9_.]+$', user_name):
-            raise serializers.ValidationError(
-                {
-                    'user_name': 'The username must be alphanumeric characters or have only _ . symbols.'
-                }
-            )
-        if not re.match('^[A-Za-z]+$', first_name):
-            raise serializers.ValidationError(
-                {'first_name': 'The first_name must be alphabet characters.'}
-            )
-        if not re.match('^[A-Za-z]+$', last_name):
-            raise serializers.ValidationError(
-                {'last_name': 'The last_name must be alphabet characters.'}
-            )
+        errors = name_errors(attrs)
+        if errors:
+            # The endpoint has always reported the username as user_name.
+            if 'username' in errors:
+                errors['user_name'] = errors.pop('username')
+            raise serializers.ValidationError(errors)
 
         password = attrs.get('password')
         re_password = attrs.get('re_password')
@@ -81,3 +85,24 @@ class RegisterUserSerializer(serializers.ModelSerializer):
         user.save()
 
         return user
+
+
+class TokenObtainSerializer(serializers.Serializer):
+
+    email = serializers.EmailField()
+    password = serializers.CharField(
+        max_length=128, write_only=True, trim_whitespace=False
+    )
+
+    def validate(self, attrs):
+        user = authenticate(
+            request=self.context.get('request'),
+            email=attrs['email'],
+            password=attrs['password'],
+        )
+        if user is None:
+            raise serializers.ValidationError(
+                'Unable to log in with provided credentials.'
+            )
+        attrs['user'] = user
+        return attrs
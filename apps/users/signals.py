@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+from django.contrib.auth.models import Group, Permission
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from apps.users.authentication import forget_user, principals
+from apps.users.models import Token, User
+from apps.utils.response_cache import invalidate_on_change
+
+invalidate_on_change(User)
+
+
+def forget_user_principal(sender, instance, **kwargs):
+    # Covers deactivation and soft deletion, which save the user.
+    forget_user(instance.pk)
+
+
+def forget_token_principal(sender, instance, **kwargs):
+    principals.delete(instance.digest)
+
+
+def forget_changed_permissions(sender, instance, action, **kwargs):
+    if action.startswith('pre_'):
+        return
+    if isinstance(instance, User):
+        forget_user(instance.pk)
+    else:
+        # A group or permission changed: any cached user may hold it.
+        principals.clear()
+
+
+def forget_all_principals(sender, **kwargs):
+    principals.clear()
+
+
+post_save.connect(forget_user_principal, sender=User)
+post_delete.connect(forget_user_principal, sender=User)
+post_delete.connect(forget_token_principal, sender=Token)
+for through in (
+    User.groups.through,
+    User.user_permissions.through,
+    Group.permissions.through,
+):
+    m2m_changed.connect(forget_changed_permissions, sender=through)
+for model in (Group, Permission):
+    post_save.connect(forget_all_principals, sender=model)
+    post_delete.connect(forget_all_principals, sender=model)
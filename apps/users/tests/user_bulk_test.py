@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+import io
+import os
+import tempfile
+
+from django.contrib.auth.hashers import check_password, make_password
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from apps.projects.models import Project
+from apps.users.models import User
+from apps.users.utils.passwords import hash_passwords
+
+
+def build_user(index: int, **extra) -> dict:
+    user = {
+        'username': f'imported_{index}',
+        'first_name': 'Imported',
+        'last_name': 'User',
+        'email': f'imported_{index}@example.com',
+        'position': 'QA',
+        'password': f'Onboarding-password-{index}',
+    }
+    user.update(extra)
+    return user
+
+
+@override_settings(PASSWORD_HASH_ITERATIONS=1000)
+class TestUserBulkAPIView(APITestCase):
+    url = '/api/v1/users/bulk/'
+
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            username='bulk_admin',
+            email='bulk_admin@example.com',
+            password='bulk-password',
+            first_name='Bulk',
+            last_name='Admin',
+            position='CTO',
+            is_staff=True,
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.project = Project.objects.create(
+            name='Onboarding',
+            description='Project the imported users are added to.',
+        )
+
+    def post(self, rows):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, rows, format='json')
+        return response, len(queries)
+
+    def test_creates_users(self):
+        response, _ = self.post(
+            [build_user(index, project='Onboarding') for index in range(3)]
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['created'], 3)
+
+        user = User.objects.get(pk=response.json()['ids'][0])
+        self.assertEqual(user.email, 'imported_0@example.com')
+        self.assertEqual(user.project, self.project)
+        self.assertTrue(user.check_password('Onboarding-password-0'))
+        self.assertIn('$1000$', user.password)
+
+    def test_queries_do_not_grow_with_rows(self):
+        _, few = self.post([build_user(index) for index in range(2)])
+        _, many = self.post([build_user(index) for index in range(2, 40)])
+        self.assertEqual(User.objects.count(), 41)
+        self.assertEqual(few, many)
+
+    def test_every_invalid_row_is_reported(self):
+        rows = [
+            build_user(0),
+            build_user(1, email='bulk_admin@example.com'),
+            build_user(2, username='imported_0'),
+            build_user(3, first_name='R2D2'),
+            build_user(4, password='password'),
+            build_user(5, project='Missing'),
+        ]
+        response, _ = self.post(rows)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = {error['index']: error['errors'] for error in response.json()}
+        self.assertEqual(sorted(errors), [1, 2, 3, 4, 5])
+        self.assertIn('email', errors[1])
+        self.assertIn('username', errors[2])
+        self.assertIn('first_name', errors[3])
+        self.assertIn('password', errors[4])
+        self.assertIn('project', errors[5])
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_uniqueness_ignores_case(self):
+        rows = [
+            build_user(0),
+            build_user(1, email='Bulk_Admin@Example.com'),
+            build_user(2, username='IMPORTED_0'),
+        ]
+        response, _ = self.post(rows)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = {error['index']: error['errors'] for error in response.json()}
+        self.assertEqual(sorted(errors), [1, 2])
+        self.assertIn('email', errors[1])
+        self.assertIn('username', errors[2])
+
+    def test_deleted_users_keep_their_email(self):
+        User.objects.create_user(
+            username='gone',
+            email='imported_0@example.com',
+            password='gone-password',
+            first_name='Gone',
+            last_name='User',
+            position='QA',
+        ).soft_delete()
+        response, _ = self.post([build_user(0)])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_only_admins_import(self):
+        self.admin.is_staff = False
+        self.admin.save()
+        response, _ = self.post([build_user(0)])
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TestPasswordHashing(SimpleTestCase):
+    @override_settings(PASSWORD_HASH_ITERATIONS=1000)
+    def test_iterations_follow_the_setting(self):
+        encoded = make_password('secret-password')
+        self.assertTrue(encoded.startswith('pbkdf2_sha256$1000$'))
+        self.assertTrue(check_password('secret-password', encoded))
+
+    def test_cheaper_hashes_still_verify(self):
+        encoded = make_password('secret-password')
+        with override_settings(PASSWORD_HASH_ITERATIONS=1000):
+            self.assertTrue(check_password('secret-password', encoded))
+
+    def test_hashes_across_processes(self):
+        passwords = [f'password-{index}' for index in range(8)]
+        hashes = hash_passwords(passwords, processes=2, iterations=1000)
+        self.assertEqual(len(set(hashes)), 8)
+        for password, encoded in zip(passwords, hashes):
+            self.assertTrue(encoded.startswith('pbkdf2_sha256$1000$'))
+            self.assertTrue(check_password(password, encoded))
+
+
+@override_settings(PASSWORD_HASH_ITERATIONS=1000)
+class TestImportUsersCommand(APITestCase):
+    def write(self, name: str, content: str) -> str:
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, 'w') as file:
+            file.write(content)
+        return path
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_imports_a_csv_file(self):
+        path = self.write(
+            'users.csv',
+            'username,first_name,last_name,email,position,password,phone\n'
+            'csv_one,Csv,One,csv_one@example.com,QA,Csv-password-1,\n'
+            'csv_two,Csv,Two,csv_two@example.com,CTO,Csv-password-2,555\n',
+        )
+        call_command('import_users', path, processes=1, stdout=io.StringIO())
+        self.assertEqual(
+            set(User.objects.values_list('username', flat=True)),
+            {'csv_one', 'csv_two'},
+        )
+
+    def test_invalid_file_creates_nobody(self):
+        path = self.write(
+            'users.ndjson',
+            '{"username": "ok", "first_name": "Ok", "last_name": "User", '
+            '"email": "ok@example.com", "position": "QA", '
+            '"password": "Ndjson-password-1"}\n'
+            '{"username": "bad!", "email": "bad"}\n',
+        )
+        with self.assertRaisesMessage(CommandError, '1 invalid rows'):
+            call_command('import_users', path, stderr=io.StringIO())
+        self.assertFalse(User.objects.exists())
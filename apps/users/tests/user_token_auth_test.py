@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+import json
+
+from django.contrib.auth.models import Group, Permission
+from django.db import connection
+from django.test import AsyncRequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from apps.projects.models import Project
+from apps.tasks.models import Task
+from apps.tasks.views.task_view import AllTasksListAsyncView
+from apps.users.authentication import principals
+from apps.users.models import Token, User
+from apps.utils.instrumentation import registry
+from apps.utils.response_cache import get_cache
+from apps.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache(APITestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TTLCache('test.lru', maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.stats()['evictions'], 1)
+        self.assertEqual(cache.stats()['hit_rate'], 2 / 3)
+
+    def test_entries_expire(self):
+        cache = TTLCache('test.ttl', maxsize=2, ttl=0)
+        cache.set('a', 1)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['expired'], 1)
+        self.assertEqual(cache.stats()['entries'], 0)
+
+
+class TestTokenAuthentication(APITestCase):
+    url = '/api/v1/tasks/'
+    token_url = '/api/v1/users/token/'
+
+    def setUp(self) -> None:
+        get_cache().clear()
+        principals.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='token_user',
+            email='token@example.com',
+            password='token-password',
+            first_name='Token',
+            last_name='User',
+            position='QA',
+        )
+        project = Project.objects.create(
+            name='Token Tasks',
+            description='Project used to check token authentication.',
+        )
+        for index in range(3):
+            Task.objects.create(
+                name=f'Token task {index}',
+                description='Task description for the token test.',
+                project=project,
+            )
+        self.key = self.obtain_token()
+
+    def obtain_token(self) -> str:
+        response = self.client.post(
+            self.token_url,
+            {'email': 'token@example.com', 'password': 'token-password'},
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.json()['token']
+
+    def get(self, key=None):
+        get_cache().clear()
+        if key:
+            self.client.credentials(HTTP_AUTHORIZATION='Token ' + key)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.client.credentials()
+        return response, len(queries)
+
+    def test_key_is_stored_hashed(self):
+        token = Token.objects.get(user=self.user)
+        self.assertNotEqual(token.digest, self.key)
+        self.assertEqual(token.digest, Token.hash_key(self.key))
+
+    def test_wrong_password_gets_no_token(self):
+        response = self.client.post(
+            self.token_url,
+            {'email': 'token@example.com', 'password': 'wrong'},
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cache_hit_costs_no_auth_query(self):
+        self.client.force_authenticate(user=self.user)
+        _, baseline = self.get()
+        self.client.force_authenticate(user=None)
+
+        response, miss = self.get(self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(miss, baseline)
+
+        hits = principals.stats()['hits']
+        response, hit = self.get(self.key)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['count'], 3)
+        self.assertEqual(hit, baseline)
+        self.assertEqual(principals.stats()['hits'], hits + 1)
+
+    def test_unknown_token_is_rejected(self):
+        response, _ = self.get('not-a-token')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_deactivated_user_is_forgotten(self):
+        self.get(self.key)
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertEqual(principals.stats()['entries'], 0)
+        response, _ = self.get(self.key)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_user_save_refreshes_the_principal(self):
+        self.get(self.key)
+        self.user.first_name = 'Renamed'
+        self.user.save()
+        self.assertEqual(principals.stats()['entries'], 0)
+
+    def test_permission_changes_are_seen(self):
+        self.get(self.key)
+        group = Group.objects.create(name='Token group')
+        group.user_set.add(self.user)
+        self.assertEqual(principals.stats()['entries'], 0)
+
+        self.get(self.key)
+        group.permissions.add(Permission.objects.get(codename='view_task'))
+        self.assertEqual(principals.stats()['entries'], 0)
+
+    def test_revoked_token_is_rejected(self):
+        self.get(self.key)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.key)
+        response = self.client.delete(self.token_url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertFalse(Token.objects.exists())
+        response, _ = self.get(self.key)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_revoking_only_drops_the_used_token(self):
+        other = self.obtain_token()
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.key)
+        self.client.delete(self.token_url)
+
+        self.assertEqual(Token.objects.count(), 1)
+        response, _ = self.get(other)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_cache_is_reported_in_metrics(self):
+        self.get(self.key)
+        self.get(self.key)
+        metrics = registry.render()
+        self.assertIn(
+            'cache_requests_total{{cache="auth.principals",result="hit"}} {}'.format(
+                principals.stats()['hits']
+            ),
+            metrics,
+        )
+        self.assertIn('cache_hit_ratio{cache="auth.principals"}', metrics)
+
+    async def test_async_view_accepts_tokens(self):
+        factory = AsyncRequestFactory()
+        request = factory.get(
+            self.url, headers={'Authorization': 'Token ' + self.key}
+        )
+        response = await AllTasksListAsyncView.as_view()(request)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content)['count'], 3)
@@ -1,8 +1,15 @@
 from django.urls import path
 
-from apps.users.views import UserListGenericView, RegisterUserGenericView
+from apps.users.views import (
+    RegisterUserGenericView,
+    TokenAPIView,
+    UserBulkAPIView,
+    UserListGenericView,
+)
 
 urlpatterns = [
     path('', UserListGenericView.as_view()),
     path('register/', RegisterUserGenericView.as_view()),
+    path('bulk/', UserBulkAPIView.as_view()),
+    path('token/', TokenAPIView.as_view()),
 ]
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+from itertools import islice
+
+from django.contrib.auth.password_validation import (
+    get_default_password_validators,
+    validate_password,
+)
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from rest_framework import serializers
+
+from apps.projects.models import Project
+from apps.users.models import User
+from apps.users.utils.passwords import hash_passwords
+from apps.utils.response_cache import invalidate
+from apps.utils.validation import name_errors
+
+MAX_BULK_USERS = 5000
+BATCH_SIZE = 500
+
+
+class BulkUserError(Exception):
+    def __init__(self, errors: list):
+        super().__init__(errors)
+        self.errors = errors
+
+
+class BulkUserSerializer(serializers.ModelSerializer):
+
+    project = serializers.CharField(
+        max_length=100, required=False, allow_null=True
+    )
+
+    class Meta:
+        model = User
+        fields = [
+            'username',
+            'first_name',
+            'last_name',
+            'email',
+            'phone',
+            'position',
+            'password',
+            'project',
+        ]
+        # Uniqueness is checked for a whole batch at once.
+        extra_kwargs = {
+            'password': {'write_only': True, 'trim_whitespace': False},
+            'username': {'validators': []},
+            'email': {'validators': []},
+        }
+
+    def validate(self, attrs):
+        errors = name_errors(attrs)
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        user = User(
+            username=attrs['username'],
+            first_name=attrs['first_name'],
+            last_name=attrs['last_name'],
+            email=attrs['email'],
+        )
+        try:
+            validate_password(
+                attrs['password'],
+                user,
+                password_validators=self.context['password_validators'],
+            )
+        except ValidationError as err:
+            raise serializers.ValidationError({'password': err.messages})
+        return attrs
+
+
+def _batches(items: list, size: int = BATCH_SIZE):
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class UserBatchValidator:
+    """
+    Validates a batch of user payloads, resolves their project names and
+    checks usernames and emails are free with one query each per batch.
+    """
+
+    def __init__(self):
+        self.serializer = BulkUserSerializer(
+            context={'password_validators': get_default_password_validators()}
+        )
+        self.errors = {}
+
+    def add_error(self, index: int, field: str, message) -> None:
+        self.errors.setdefault(index, {})[field] = message
+
+    def validate(self, offset: int, rows: list) -> list:
+        validated = []
+        for index, row in enumerate(rows, start=offset):
+            try:
+                validated.append((index, self.serializer.run_validation(row)))
+            except serializers.ValidationError as exc:
+                detail = exc.detail
+                if not isinstance(detail, dict):
+                    detail = {'non_field_errors': detail}
+                for field, message in detail.items():
+                    self.add_error(index, field, message)
+        return validated
+
+    def resolve(self, validated: list) -> list:
+        names = {
+            data['project'] for _, data in validated if data.get('project')
+        }
+        projects = {}
+        if names:
+            projects = dict(
+                Project.objects.filter(name__in=names)
+                .order_by()
+                .values_list('name', 'pk')
+            )
+
+        resolved = []
+        for index, data in validated:
+            name = data.pop('project', None)
+            data['project_id'] = projects.get(name) if name else None
+            if name and data['project_id'] is None:
+                self.add_error(index, 'project', ['Project not found'])
+                continue
+            resolved.append((index, data))
+        return resolved
+
+    def check_unique(self, resolved: list, seen: dict) -> list:
+        # seen: field -> casefolded values taken earlier in the payload.
+        # Usernames and emails are unique regardless of case, as MySQL
+        # compares them. Deleted users keep their username and email until
+        # they are purged.
+        usernames = {data['username'].lower() for _, data in resolved}
+        emails = {data['email'].lower() for _, data in resolved}
+        taken = {'username': set(), 'email': set()}
+        if resolved:
+            rows = (
+                User.all_objects.alias(
+                    username_lower=Lower('username'),
+                    email_lower=Lower('email'),
+                )
+                .filter(
+                    Q(username_lower__in=usernames) | Q(email_lower__in=emails)
+                )
+                .order_by()
+                .values_list('username', 'email')
+            )
+            for username, email in rows:
+                taken['username'].add(username.casefold())
+                taken['email'].add(email.casefold())
+
+        unique = []
+        for index, data in resolved:
+            valid = True
+            for field in ('username', 'email'):
+                value = data[field].casefold()
+                if value in taken[field] or value in seen[field]:
+                    self.add_error(
+                        index,
+                        field,
+                        [f'User with this {field} already exists.'],
+                    )
+                    valid = False
+            if valid:
+                seen['username'].add(data['username'].casefold())
+                seen['email'].add(data['email'].casefold())
+                unique.append((index, data))
+        return unique
+
+    def raise_errors(self) -> None:
+        if self.errors:
+            raise BulkUserError(
+                [
+                    {'index': index, 'errors': self.errors[index]}
+                    for index in sorted(self.errors)
+                ]
+            )
+
+
+def _fill_ids(users: list) -> None:
+    # MySQL can't return primary keys from a multi-row INSERT.
+    if connection.features.can_return_rows_from_bulk_insert:
+        return
+    for batch in _batches(users):
+        rows = (
+            User.all_objects.filter(email__in=[user.email for user in batch])
+            .order_by()
+            .values_list('email', 'pk')
+        )
+        # Keyed regardless of case, as MySQL matched the emails.
+        ids = {email.casefold(): pk for email, pk in rows}
+        for user in batch:
+            user.pk = ids[user.email.casefold()]
+
+
+def bulk_create_users(
+    rows: list,
+    limit: int | None = MAX_BULK_USERS,
+    processes: int | None = None,
+    iterations: int | None = None,
+) -> list[int]:
+    """
+    Validates every row, then hashes the passwords over a process pool
+    and inserts the users in batches. Nothing is created when a row is
+    invalid. ``processes`` and ``iterations`` go to ``hash_passwords``.
+    """
+    if not isinstance(rows, list):
+        raise serializers.ValidationError('Expected a list of users')
+    if limit is not None and len(rows) > limit:
+        raise serializers.ValidationError(
+            f'No more than {limit} users per request'
+        )
+
+    validator = UserBatchValidator()
+    seen = {'username': set(), 'email': set()}
+    valid = []
+    for offset in range(0, len(rows), BATCH_SIZE):
+        validated = validator.validate(
+            offset, rows[offset : offset + BATCH_SIZE]
+        )
+        valid.extend(
+            validator.check_unique(validator.resolve(validated), seen)
+        )
+    validator.raise_errors()
+
+    passwords = hash_passwords(
+        [data.pop('password') for _, data in valid],
+        processes=processes,
+        iterations=iterations,
+    )
+    users = [
+        User(password=password, **data)
+        for (_, data), password in zip(valid, passwords)
+    ]
+    try:
+        with transaction.atomic():
+            User.objects.bulk_create(users, batch_size=BATCH_SIZE)
+            _fill_ids(users)
+    except IntegrityError:
+        raise serializers.ValidationError(
+            'Users were changed concurrently, please retry'
+        )
+    # bulk_create sends no post_save signals.
+    invalidate(User._meta.label_lower)
+    return [user.pk for user in users]
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher
+
+from apps.jobs.utils.process import setup_process
+
+# Below this many passwords per process, starting the process costs more
+# than it saves.
+MIN_PASSWORDS_PER_PROCESS = 4
+
+
+def hash_password(password: str, iterations: int | None = None) -> str:
+    hasher = get_hasher()
+    if iterations is None:
+        return hasher.encode(password, hasher.salt())
+    return hasher.encode(password, hasher.salt(), iterations)
+
+
+def _hash_password(args: tuple) -> str:
+    return hash_password(*args)
+
+
+def get_processes() -> int:
+    return (
+        getattr(settings, 'PASSWORD_HASH_PROCESSES', None)
+        or os.cpu_count()
+        or 1
+    )
+
+
+def hash_passwords(
+    passwords: list[str],
+    processes: int | None = None,
+    iterations: int | None = None,
+) -> list[str]:
+    """
+    Hashes ``passwords`` with the default hasher, spread over up to
+    ``processes`` processes (``PASSWORD_HASH_PROCESSES`` or one per CPU).
+    ``iterations`` overrides the cost of iteration based hashers.
+    """
+    if iterations is not None and not hasattr(get_hasher(), 'iterations'):
+        raise ValueError('The default password hasher has no iterations.')
+    processes = min(
+        processes or get_processes(),
+        len(passwords) // MIN_PASSWORDS_PER_PROCESS,
+    )
+    args = [(password, iterations) for password in passwords]
+    if processes <= 1:
+        return [_hash_password(arg) for arg in args]
+    with ProcessPoolExecutor(
+        processes,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=setup_process,
+    ) as pool:
+        return list(
+            pool.map(
+                _hash_password,
+                args,
+                chunksize=max(1, len(args) // (processes * 4)),
+            )
+        )
@@ -1,11 +1,20 @@
 # -*- coding: utf-8 -*-
 from rest_framework import status
 from rest_framework.generics import ListAPIView, CreateAPIView
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
-from apps.users.models import User
-from apps.users.serializers import UserListSerializer, RegisterUserSerializer
+from apps.users.models import Token, User
+from apps.users.serializers import (
+    RegisterUserSerializer,
+    TokenObtainSerializer,
+    UserListSerializer,
+)
+from apps.users.utils.bulk_users import BulkUserError, bulk_create_users
+from apps.utils.permissions import MethodPermissionsMixin
+from apps.utils.response_cache import cache_response
 
 
 class UserListGenericView(ListAPIView):
@@ -18,11 +27,14 @@ class UserListGenericView(ListAPIView):
             return User.objects.filter(project__name=project_name)
         return User.objects.all()
 
+    @cache_response('users.User', 'projects.Project')
     def list(self, request: Request, *args, **kwargs) -> Response:
         query_set = self.get_queryset()
         if query_set.exists():
-            serializer = self.get_serializer(query_set, many=True)
-            return Response(data=serializer.data, status=status.HTTP_200_OK)
+            data = UserListSerializer.represent_values(
+                UserListSerializer.values_queryset(query_set)
+            )
+            return Response(data=data, status=status.HTTP_200_OK)
         return Response(data=[], status=status.HTTP_204_NO_CONTENT)
 
 
@@ -34,3 +46,55 @@ class RegisterUserGenericView(CreateAPIView):
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(data=serializer.data, status=status.HTTP_200_OK)
+
+
+class UserBulkAPIView(APIView):
+    """
+    Creates up to ``MAX_BULK_USERS`` users at once, or none when any row
+    is invalid. There's no ``Prefer: respond-async`` variant: the queued
+    job would keep the plain text passwords in its payload.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        try:
+            user_ids = bulk_create_users(request.data)
+        except BulkUserError as exc:
+            return Response(
+                data=exc.errors, status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(
+            data={'created': len(user_ids), 'ids': user_ids},
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class TokenAPIView(MethodPermissionsMixin, APIView):
+    """
+    POST issues a token for an email and password; the key is only shown
+    once. DELETE revokes the token the request was made with, or all of
+    the user's tokens when it was authenticated otherwise.
+    """
+
+    method_permission_classes = {
+        'POST': [AllowAny],
+        'DELETE': [IsAuthenticated],
+    }
+
+    def post(self, request: Request) -> Response:
+        serializer = TokenObtainSerializer(
+            data=request.data, context={'request': request}
+        )
+        serializer.is_valid(raise_exception=True)
+        _, key = Token.issue(serializer.validated_data['user'])
+        return Response(data={'token': key}, status=status.HTTP_201_CREATED)
+
+    def delete(self, request: Request) -> Response:
+        tokens = Token.objects.filter(user=request.user)
+        if isinstance(request.auth, str):
+            tokens = tokens.filter(digest=request.auth)
+        # Deleted one by one so post_delete drops their cache entries.
+        for token in tokens:
+            token.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from django.http import Http404, HttpResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.exceptions import (
+    APIException,
+    AuthenticationFailed,
+    NotAuthenticated,
+)
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from apps.utils.renderers import FastJSONRenderer
+
+
+class AsyncAPIView(View):
+    """
+    Async counterpart of a DRF ``APIView`` for read endpoints.
+
+    Handlers run on the event loop and use the async ORM; methods without
+    an async handler are served by ``sync_view`` in a worker thread. The
+    request is wrapped in a DRF ``Request`` for its query-string helpers;
+    the configured authentication classes run in order, the session's
+    through ``request.auser()``, classes with an ``aauthenticate`` method
+    on the event loop and the others in a worker thread.
+    """
+
+    sync_view = None
+    login_required = False
+    renderer = FastJSONRenderer()
+    authentication_classes = api_settings.DEFAULT_AUTHENTICATION_CLASSES
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Like DRF's APIView: authentication classes decide about CSRF.
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        if self.sync_view and not hasattr(self, request.method.lower()):
+            return await sync_to_async(self.sync_view.as_view())(
+                request, *args, **kwargs
+            )
+
+        self.request = Request(request)
+        try:
+            if self.login_required:
+                user = await self.authenticate(request)
+                if not user.is_authenticated:
+                    raise NotAuthenticated()
+                self.request.user = user
+            response = await super().dispatch(self.request, *args, **kwargs)
+        except (NotAuthenticated, AuthenticationFailed) as exc:
+            # Like DRF with session auth: no WWW-Authenticate, so 403.
+            response = Response(
+                data={'detail': exc.detail},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        except Http404 as exc:
+            response = Response(
+                data={'detail': str(exc)}, status=status.HTTP_404_NOT_FOUND
+            )
+        except APIException as exc:
+            # Validation errors keep their field structure, as in DRF.
+            data = exc.detail
+            if not isinstance(data, (list, dict)):
+                data = {'detail': data}
+            response = Response(data=data, status=exc.status_code)
+
+        if isinstance(response, Response):
+            return self.render(response)
+        return response
+
+    async def authenticate(self, request):
+        for authentication_class in self.authentication_classes:
+            authenticator = authentication_class()
+            if isinstance(authenticator, SessionAuthentication):
+                # The handlers only read, so there is no CSRF to enforce.
+                # Requests that skipped the middleware have no session.
+                auser = getattr(request, 'auser', None)
+                user = await auser() if auser else None
+                result = (
+                    (user, None) if user and user.is_authenticated else None
+                )
+            elif hasattr(authenticator, 'aauthenticate'):
+                result = await authenticator.aauthenticate(request)
+            else:
+                result = await sync_to_async(authenticator.authenticate)(
+                    self.request
+                )
+            if result is not None:
+                return result[0]
+        return AnonymousUser()
+
+    def render(self, response: Response) -> HttpResponse:
+        # Rendered here: Django would render a DRF Response in a thread.
+        rendered = HttpResponse(
+            self.renderer.render(response.data),
+            status=response.status_code,
+            content_type=self.renderer.media_type,
+        )
+        for header, value in response.items():
+            if header != 'Content-Type':
+                rendered[header] = value
+        return rendered
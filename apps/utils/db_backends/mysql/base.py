@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+from django.db.backends.mysql import base
+
+from apps.utils.db_pool import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    def is_usable_connection(self, connection) -> bool:
+        try:
+            connection.ping()
+        except base.Database.Error:
+            return False
+        return True
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+import os
+import threading
+import time
+from collections import Counter, deque
+
+from django.db import OperationalError
+
+POOL_EVENTS = ('created', 'reused', 'discarded', 'waits', 'timeouts')
+
+# One pool per database alias, shared by the threads of this process.
+pools = {}
+_pools_lock = threading.Lock()
+
+
+class ConnectionPool:
+    """
+    Keeps up to ``size`` idle DB-API connections for reuse. When all are
+    checked out, up to ``max_overflow`` more are opened and closed again
+    on check-in; beyond that, ``checkout`` waits ``timeout`` seconds for
+    one to be returned. Connections older than ``recycle`` seconds are
+    closed instead of reused.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        max_overflow: int = 10,
+        timeout: float = 30,
+        recycle: float | None = None,
+    ):
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.recycle = recycle
+        self._condition = threading.Condition()
+        self._reset()
+
+    def _reset(self) -> None:
+        # A forked child must not share its parent's sockets, so it starts
+        # with an empty pool.
+        self._pid = os.getpid()
+        self._idle = deque()
+        self._born = {}
+        self.checked_out = 0
+        self.events = Counter()
+
+    def checkout(self, connect, is_usable=None):
+        """
+        Returns an idle connection, or one opened with ``connect()``;
+        ``is_usable(connection)`` vets idle ones before they are reused.
+        """
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            if self._pid != os.getpid():
+                self._reset()
+            while not self._idle and self.is_full():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.events['timeouts'] += 1
+                    raise OperationalError(
+                        'No database connection became free within '
+                        '{}s.'.format(self.timeout)
+                    )
+                self.events['waits'] += 1
+                self._condition.wait(remaining)
+            connection = self._idle.pop() if self._idle else None
+            self.checked_out += 1
+
+        try:
+            if connection is not None:
+                if self._is_expired(connection) or (
+                    is_usable is not None and not is_usable(connection)
+                ):
+                    self._discard(connection)
+                    connection = None
+                else:
+                    with self._condition:
+                        self.events['reused'] += 1
+            if connection is None:
+                connection = connect()
+                with self._condition:
+                    self._born[id(connection)] = time.monotonic()
+                    self.events['created'] += 1
+        except BaseException:
+            self._release()
+            raise
+        return connection
+
+    def checkin(self, connection, reusable: bool = True) -> None:
+        """
+        Takes back a checked out connection; it is closed when it can't
+        be reused, has expired or the pool already has ``size`` idle.
+        """
+        with self._condition:
+            if self._pid != os.getpid():
+                # Inherited from the parent: closing it would end the
+                # parent's session too.
+                return
+            keep = (
+                reusable
+                and len(self._idle) < self.size
+                and not self._is_expired(connection)
+            )
+            if keep:
+                self._idle.append(connection)
+        if not keep:
+            self._discard(connection)
+        self._release()
+
+    def is_full(self) -> bool:
+        return self.checked_out >= self.size + self.max_overflow
+
+    def close_idle(self) -> None:
+        with self._condition:
+            idle, self._idle = list(self._idle), deque()
+        for connection in idle:
+            self._discard(connection)
+
+    def stats(self) -> dict:
+        with self._condition:
+            return {
+                'size': self.size,
+                'max_overflow': self.max_overflow,
+                'checked_out': self.checked_out,
+                'idle': len(self._idle),
+                **{event: self.events[event] for event in POOL_EVENTS},
+            }
+
+    def _is_expired(self, connection) -> bool:
+        if self.recycle is None:
+            return False
+        born = self._born.get(id(connection), 0)
+        return time.monotonic() - born >= self.recycle
+
+    def _discard(self, connection) -> None:
+        with self._condition:
+            self._born.pop(id(connection), None)
+            self.events['discarded'] += 1
+        try:
+            connection.close()
+        except Exception:
+            # It is being dropped because it may be broken already.
+            pass
+
+    def _release(self) -> None:
+        with self._condition:
+            self.checked_out -= 1
+            self._condition.notify()
+
+
+def get_pool(alias: str, options: dict) -> ConnectionPool:
+    with _pools_lock:
+        if alias not in pools:
+            pools[alias] = ConnectionPool(
+                size=options.get('SIZE', 5),
+                max_overflow=options.get('MAX_OVERFLOW', 10),
+                timeout=options.get('TIMEOUT', 30),
+                recycle=options.get('RECYCLE'),
+            )
+        return pools[alias]
+
+
+class PooledDatabaseWrapperMixin:
+    """
+    Mixed into a backend's ``DatabaseWrapper``: connections come from the
+    alias' pool and go back to it when Django closes them, e.g. at the end
+    of a request with ``CONN_MAX_AGE = 0``. The pool is configured by the
+    ``POOL`` key of the database settings.
+    """
+
+    @property
+    def pool(self) -> ConnectionPool:
+        return get_pool(self.alias, self.settings_dict.get('POOL') or {})
+
+    def get_new_connection(self, conn_params):
+        is_usable = None
+        if self.settings_dict['CONN_HEALTH_CHECKS']:
+            is_usable = self.is_usable_connection
+        return self.pool.checkout(
+            lambda: super(PooledDatabaseWrapperMixin, self).get_new_connection(
+                conn_params
+            ),
+            is_usable,
+        )
+
+    def is_usable_connection(self, connection) -> bool:
+        # ``is_usable()`` checks ``self.connection``; backends with a cheap
+        # check for a raw connection override this.
+        return True
+
+    def _close(self):
+        if self.connection is None:
+            return
+        # Connections closed mid-transaction, after errors or with another
+        # autocommit mode are not handed to the next request.
+        reusable = (
+            not self.in_atomic_block
+            and not self.errors_occurred
+            and self.get_autocommit() == self.settings_dict['AUTOCOMMIT']
+        )
+        self.pool.checkin(self.connection, reusable)
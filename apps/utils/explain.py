@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+import re
+
+from django.db import connection
+from django.db.models import QuerySet
+
+# SQLite reports "SCAN <table>" for a full table scan and "SCAN <table>
+# USING [COVERING] INDEX ..." when it walks an index instead.
+SQLITE_TABLE_SCAN = re.compile(r"\bSCAN (\w+)(?! USING)\s*$")
+
+
+def find_sequential_scans(queryset: QuerySet) -> list[str]:
+    if connection.vendor != "sqlite":
+        raise NotImplementedError(
+            "Sequential scan detection is implemented for SQLite only"
+        )
+    plan = queryset.explain()
+    return [
+        line.strip()
+        for line in plan.splitlines()
+        if SQLITE_TABLE_SCAN.search(line)
+    ]
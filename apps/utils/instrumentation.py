@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+import hmac
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack, asynccontextmanager
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse, HttpResponseForbidden
+
+from apps.utils.db_pool import POOL_EVENTS, pools
+from apps.utils.ttl_cache import caches
+
+logger = logging.getLogger(__name__)
+
+# "IN (%s, %s, %s)" and "IN (%s)" are the same query with another batch.
+IN_LIST = re.compile(r'\((?:%s, )*%s\)')
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def fingerprint(sql: str) -> str:
+    return IN_LIST.sub('(%s, ...)', sql)
+
+
+class RequestProfile:
+    """
+    Collects the SQL and timings of one sampled request; installed as a
+    DB ``execute_wrapper`` on every connection while the request runs.
+    """
+
+    def __init__(self, request):
+        self.method = request.method
+        self.path = request.path
+        self.view = None
+        self.start = time.perf_counter()
+        self.query_count = 0
+        self.sql_time = 0.0
+        self.fingerprints = Counter()
+        self.view_time = 0.0
+        self.render_start = None
+        self.render_time = 0.0
+        self.response_size = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_time += time.perf_counter() - start
+            self.query_count += 1
+            self.fingerprints[fingerprint(sql)] += 1
+
+    def wrap_connections(self) -> ExitStack:
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(self))
+        return stack
+
+    @asynccontextmanager
+    async def awrap_connections(self):
+        # Connections are per thread and the async ORM queries in
+        # sync_to_async's thread, so the wrappers are installed there.
+        stack = await sync_to_async(self.wrap_connections)()
+        try:
+            yield
+        finally:
+            await sync_to_async(stack.close)()
+
+    def end_view(self, resolver_match) -> None:
+        if resolver_match is not None:
+            view = getattr(
+                resolver_match.func, 'view_class', resolver_match.func
+            )
+            self.view = '{}.{}'.format(view.__module__, view.__qualname__)
+        end = time.perf_counter()
+        if self.render_start is not None:
+            self.render_time = end - self.render_start
+            end = self.render_start
+        # Views serialize inline, so the time outside SQL and rendering is
+        # dominated by the serializers.
+        self.view_time = end - self.start - self.sql_time
+
+    def duplicates(self) -> list[tuple[str, int]]:
+        threshold = getattr(settings, 'INSTRUMENTATION_DUPLICATE_QUERIES', 5)
+        return [
+            (sql, count)
+            for sql, count in self.fingerprints.most_common()
+            if count >= threshold
+        ]
+
+    def server_timing(self) -> str:
+        return ', '.join(
+            [
+                'db;dur={:.2f};desc="{} queries"'.format(
+                    self.sql_time * 1000, self.query_count
+                ),
+                'view;dur={:.2f}'.format(self.view_time * 1000),
+                'render;dur={:.2f}'.format(self.render_time * 1000),
+                'total;dur={:.2f}'.format(
+                    (time.perf_counter() - self.start) * 1000
+                ),
+            ]
+        )
+
+    def finish(self, status_code: int) -> None:
+        duration = time.perf_counter() - self.start
+        duplicates = self.duplicates()
+        record = {
+            'view': self.view,
+            'method': self.method,
+            'path': self.path,
+            'status': status_code,
+            'duration_ms': round(duration * 1000, 2),
+            'queries': self.query_count,
+            'sql_ms': round(self.sql_time * 1000, 2),
+            'view_ms': round(self.view_time * 1000, 2),
+            'render_ms': round(self.render_time * 1000, 2),
+            'response_bytes': self.response_size,
+            'duplicates': [
+                {'sql': sql[:200], 'count': count} for sql, count in duplicates
+            ],
+        }
+        registry.observe(self, status_code, duration, len(duplicates))
+        # Repeated queries are most likely an N+1, worth a warning.
+        log = logger.warning if duplicates else logger.info
+        log(json.dumps(record))
+
+
+def _header(lines: list, name: str, kind: str, help_text: str) -> None:
+    lines.append('# HELP {} {}'.format(name, help_text))
+    lines.append('# TYPE {} {}'.format(name, kind))
+
+
+def _sample(lines: list, name: str, value, **labels) -> None:
+    lines.append(
+        '{}{{{}}} {}'.format(
+            name,
+            ','.join(
+                '{}="{}"'.format(label, text) for label, text in labels.items()
+            ),
+            value,
+        )
+    )
+
+
+def _render_pool_metrics(lines: list) -> None:
+    pool_stats = {alias: pool.stats() for alias, pool in sorted(pools.items())}
+    if not pool_stats:
+        return
+    name = 'db_pool_connections'
+    _header(lines, name, 'gauge', 'Pooled connections by state.')
+    for alias, stats in pool_stats.items():
+        for state in ('checked_out', 'idle'):
+            _sample(lines, name, stats[state], alias=alias, state=state)
+    name = 'db_pool_limit'
+    _header(lines, name, 'gauge', 'Pool size and allowed overflow.')
+    for alias, stats in pool_stats.items():
+        for limit in ('size', 'max_overflow'):
+            _sample(lines, name, stats[limit], alias=alias, limit=limit)
+    name = 'db_pool_events_total'
+    _header(
+        lines,
+        name,
+        'counter',
+        'Connections created, reused and discarded, checkouts that waited '
+        'and that timed out.',
+    )
+    for alias, stats in pool_stats.items():
+        for event in POOL_EVENTS:
+            _sample(lines, name, stats[event], alias=alias, event=event)
+
+
+def _render_cache_metrics(lines: list) -> None:
+    cache_stats = {
+        cache_name: cache.stats()
+        for cache_name, cache in sorted(caches.items())
+    }
+    if not cache_stats:
+        return
+    name = 'cache_requests_total'
+    _header(lines, name, 'counter', 'In-process cache lookups by result.')
+    for cache_name, stats in cache_stats.items():
+        _sample(lines, name, stats['hits'], cache=cache_name, result='hit')
+        _sample(lines, name, stats['misses'], cache=cache_name, result='miss')
+    name = 'cache_hit_ratio'
+    _header(lines, name, 'gauge', 'Share of lookups that were hits.')
+    for cache_name, stats in cache_stats.items():
+        _sample(lines, name, round(stats['hit_rate'], 6), cache=cache_name)
+    name = 'cache_entries'
+    _header(lines, name, 'gauge', 'Entries held and the most allowed.')
+    for cache_name, stats in cache_stats.items():
+        for state in ('entries', 'maxsize'):
+            _sample(lines, name, stats[state], cache=cache_name, state=state)
+    name = 'cache_removals_total'
+    _header(lines, name, 'counter', 'Entries evicted by LRU or expired.')
+    for cache_name, stats in cache_stats.items():
+        for reason in ('evictions', 'expired'):
+            _sample(
+                lines, name, stats[reason], cache=cache_name, reason=reason
+            )
+
+
+class MetricsRegistry:
+    """
+    In-process aggregates of the sampled requests, per view and method,
+    rendered in the Prometheus text exposition format.
+    """
+
+    TOTALS = (
+        ('db_queries_total', 'queries', 'SQL queries run.'),
+        ('db_query_seconds_total', 'sql', 'Time spent in SQL.'),
+        ('view_seconds_total', 'view', 'Time spent in views outside SQL.'),
+        ('render_seconds_total', 'render', 'Time spent rendering.'),
+        (
+            'db_duplicate_queries_total',
+            'duplicates',
+            'Queries repeated within a request (N+1 candidates).',
+        ),
+        ('http_response_bytes_total', 'bytes', 'Response body sizes.'),
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = Counter()
+            self.buckets = defaultdict(lambda: [0] * len(DURATION_BUCKETS))
+            self.totals = defaultdict(Counter)
+
+    def observe(
+        self,
+        profile: RequestProfile,
+        status_code: int,
+        duration: float,
+        duplicates: int,
+    ) -> None:
+        key = (profile.view or 'unresolved', profile.method)
+        with self._lock:
+            self.requests[(*key, status_code)] += 1
+            buckets = self.buckets[key]
+            for index, bound in enumerate(DURATION_BUCKETS):
+                if duration <= bound:
+                    buckets[index] += 1
+            totals = self.totals[key]
+            totals['count'] += 1
+            totals['duration'] += duration
+            totals['queries'] += profile.query_count
+            totals['sql'] += profile.sql_time
+            totals['view'] += profile.view_time
+            totals['render'] += profile.render_time
+            totals['duplicates'] += duplicates
+            totals['bytes'] += profile.response_size
+
+    def render(self) -> str:
+        lines = [
+            '# HELP instrumentation_sample_rate Share of requests sampled.',
+            '# TYPE instrumentation_sample_rate gauge',
+            'instrumentation_sample_rate {}'.format(get_sample_rate()),
+        ]
+        with self._lock:
+            self._render_request_metrics(lines)
+        _render_pool_metrics(lines)
+        _render_cache_metrics(lines)
+        return '\n'.join(lines) + '\n'
+
+    def _render_request_metrics(self, lines: list) -> None:
+        name = 'http_sampled_requests_total'
+        _header(lines, name, 'counter', 'Sampled requests.')
+        for (view, method, code), count in sorted(self.requests.items()):
+            _sample(lines, name, count, view=view, method=method, status=code)
+
+        name = 'http_request_duration_seconds'
+        _header(lines, name, 'histogram', 'Duration of the sampled requests.')
+        for (view, method), buckets in sorted(self.buckets.items()):
+            totals = self.totals[(view, method)]
+            labels = {'view': view, 'method': method}
+            for bound, count in zip(DURATION_BUCKETS, buckets):
+                _sample(lines, name + '_bucket', count, **labels, le=bound)
+            _sample(
+                lines, name + '_bucket', totals['count'], **labels, le='+Inf'
+            )
+            _sample(lines, name + '_sum', totals['duration'], **labels)
+            _sample(lines, name + '_count', totals['count'], **labels)
+
+        for name, total, help_text in self.TOTALS:
+            _header(lines, name, 'counter', help_text)
+            for (view, method), totals in sorted(self.totals.items()):
+                _sample(lines, name, totals[total], view=view, method=method)
+
+
+registry = MetricsRegistry()
+
+
+def get_sample_rate() -> float:
+    return getattr(settings, 'INSTRUMENTATION_SAMPLE_RATE', 0.0)
+
+
+class InstrumentationMiddleware:
+    """
+    Profiles a random ``INSTRUMENTATION_SAMPLE_RATE`` share of requests:
+    query count, SQL time, repeated queries, view and render time and
+    response size, reported as ``Server-Timing`` headers, a JSON log line
+    and Prometheus metrics. Unsampled requests only pay for one
+    ``random()`` call.
+
+    Works in both sync and async stacks. It has no ``process_view``
+    hook, which Django would run in a worker thread for async views.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if random.random() >= get_sample_rate():
+            return self.get_response(request)
+
+        profile = request._request_profile = RequestProfile(request)
+        with profile.wrap_connections():
+            response = self.get_response(request)
+        return self.process_response(request, profile, response)
+
+    async def __acall__(self, request):
+        if random.random() >= get_sample_rate():
+            return await self.get_response(request)
+
+        profile = request._request_profile = RequestProfile(request)
+        async with profile.awrap_connections():
+            response = await self.get_response(request)
+        return self.process_response(request, profile, response)
+
+    def process_template_response(self, request, response):
+        profile = getattr(request, '_request_profile', None)
+        if profile is not None:
+            profile.render_start = time.perf_counter()
+        return response
+
+    def process_response(self, request, profile: RequestProfile, response):
+        profile.end_view(request.resolver_match)
+
+        if response.streaming:
+            # The body, and any query it runs, is produced after we return.
+            stream = self.profile_stream
+            if response.is_async:
+                stream = self.aprofile_stream
+            response.streaming_content = stream(
+                profile, response.streaming_content, response.status_code
+            )
+            response['Server-Timing'] = profile.server_timing()
+            return response
+
+        profile.response_size = len(response.content)
+        response['Server-Timing'] = profile.server_timing()
+        profile.finish(response.status_code)
+        return response
+
+    def profile_stream(
+        self, profile: RequestProfile, content, status_code: int
+    ):
+        try:
+            with profile.wrap_connections():
+                for chunk in content:
+                    profile.response_size += len(chunk)
+                    yield chunk
+        finally:
+            profile.finish(status_code)
+
+    async def aprofile_stream(
+        self, profile: RequestProfile, content, status_code: int
+    ):
+        try:
+            async with profile.awrap_connections():
+                async for chunk in content:
+                    profile.response_size += len(chunk)
+                    yield chunk
+        finally:
+            profile.finish(status_code)
+
+
+def has_metrics_access(request) -> bool:
+    """
+    Staff users, and scrapers sending the ``METRICS_TOKEN`` bearer token
+    when one is set.
+    """
+    if request.user.is_staff:
+        return True
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    return bool(token) and hmac.compare_digest(
+        request.headers.get('Authorization', ''), 'Bearer {}'.format(token)
+    )
+
+
+def metrics_view(request):
+    if not has_metrics_access(request):
+        return HttpResponseForbidden()
+    return HttpResponse(
+        registry.render(), content_type='text/plain; version=0.0.4'
+    )
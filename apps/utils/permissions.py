@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+
+class MethodPermissionsMixin:
+    """
+    Picks a view's permission classes by request method from
+    ``method_permission_classes``, falling back to ``permission_classes``.
+
+    DRF permissions keep no state, so each view class builds its instances
+    once and shares them between requests.
+    """
+
+    method_permission_classes = {}
+
+    def get_permissions(self):
+        cls = type(self)
+        if '_permissions' not in cls.__dict__:
+            cls._permissions = {}
+        method = self.request.method
+        permissions = cls._permissions.get(method)
+        if permissions is None:
+            classes = self.method_permission_classes.get(
+                method, self.permission_classes
+            )
+            permissions = [permission() for permission in classes]
+            cls._permissions[method] = permissions
+        return permissions
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+from itertools import islice
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.fields import Field
+from rest_framework.settings import api_settings
+
+
+class QueryPlanMixin:
+    """
+    Builds the queryset a read serializer needs from its own declaration.
+
+    Serializers list the relations they read in ``Meta.select_related`` and
+    ``Meta.prefetch_related``; the columns for ``only()`` and ``values()``
+    are derived from the serializer fields.
+
+    Read endpoints can skip model instances altogether: ``values_queryset``
+    selects the plan's columns as tuples and ``represent_values`` turns
+    them into the serializer's output with a row function compiled once
+    per serializer class.
+    """
+
+    _query_plans = {}
+
+    @classmethod
+    def get_query_plan(cls) -> dict:
+        if cls not in QueryPlanMixin._query_plans:
+            QueryPlanMixin._query_plans[cls] = cls._build_query_plan()
+        return QueryPlanMixin._query_plans[cls]
+
+    @classmethod
+    def _build_query_plan(cls) -> dict:
+        model = cls.Meta.model
+        select_related = tuple(getattr(cls.Meta, 'select_related', ()))
+        prefetch_related = tuple(getattr(cls.Meta, 'prefetch_related', ()))
+
+        only = list(select_related)
+        values = {}
+        many = {}
+        for name, field in cls().fields.items():
+            if isinstance(field, serializers.ManyRelatedField):
+                relation = _many_relation(model, field)
+                if relation is not None:
+                    many[name] = relation
+                continue
+            lookups = [
+                (lookup, is_raw)
+                for lookup, is_raw in _field_lookups(field)
+                if _is_concrete_lookup(model, lookup)
+            ]
+            only.extend(lookup for lookup, _ in lookups)
+            # Nested serializers can't be rebuilt from flat ``values()`` rows.
+            if lookups and not isinstance(field, serializers.BaseSerializer):
+                lookup, is_raw = lookups[0]
+                values[name] = (lookup, None if is_raw else field)
+
+        columns = [lookup for lookup, _ in values.values()]
+        if many:
+            # Related rows are matched to their row by primary key.
+            columns.append(model._meta.pk.attname)
+        columns = tuple(dict.fromkeys(columns))
+
+        return {
+            'select_related': select_related,
+            'prefetch_related': prefetch_related,
+            'only': tuple(dict.fromkeys(only)),
+            'values': values,
+            'many': many,
+            'columns': columns,
+            'bind_row': _compile_row(cls, values, many, columns),
+        }
+
+    @classmethod
+    def optimize_queryset(cls, queryset: QuerySet) -> QuerySet:
+        plan = cls.get_query_plan()
+        if plan['select_related']:
+            queryset = queryset.select_related(*plan['select_related'])
+        if plan['prefetch_related']:
+            queryset = queryset.prefetch_related(*plan['prefetch_related'])
+        return queryset.only(*plan['only'])
+
+    @classmethod
+    def values_queryset(cls, queryset: QuerySet, *extra: str) -> QuerySet:
+        """
+        Selects the plan's columns, then ``extra``, as named tuples.
+        """
+        columns = cls.get_query_plan()['columns']
+        return queryset.values_list(
+            *dict.fromkeys([*columns, *extra]), named=True
+        )
+
+    @classmethod
+    def get_row_function(cls):
+        """
+        Returns ``represent_row(row)`` for ``values_queryset`` rows, bound
+        to the current timezone.
+        """
+        return cls.get_query_plan()['bind_row'](_current_timezone())
+
+    @classmethod
+    def iter_values(cls, rows, chunk_size: int = 2000):
+        if not cls.get_query_plan()['many']:
+            yield from map(cls.get_row_function(), rows)
+            return
+        # Many-to-many values are read for a chunk of rows at a time.
+        rows = iter(rows)
+        while chunk := list(islice(rows, chunk_size)):
+            yield from cls._represent_chunk(chunk)
+
+    @classmethod
+    def represent_values(cls, rows) -> list[dict]:
+        return list(cls.iter_values(rows))
+
+    @classmethod
+    def _represent_chunk(cls, rows: list) -> list[dict]:
+        plan = cls.get_query_plan()
+        pk_index = plan['columns'].index(cls.Meta.model._meta.pk.attname)
+        pks = [row[pk_index] for row in rows]
+        # One query per many-to-many field for the whole chunk.
+        related = []
+        for manager, back, lookup in plan['many'].values():
+            found = {}
+            for pk, value in manager.filter(
+                **{f'{back}__in': pks}
+            ).values_list(back, lookup):
+                found.setdefault(pk, []).append(value)
+            related.append(found)
+        represent_row = cls.get_row_function()
+        return [represent_row(row, related) for row in rows]
+
+
+def _field_lookups(field: Field, prefix: str = ''):
+    if field.source == '*' or isinstance(field, serializers.ManyRelatedField):
+        return
+    source = prefix + '__'.join(field.source_attrs)
+
+    if isinstance(field, serializers.SlugRelatedField):
+        yield '{}__{}'.format(source, field.slug_field), True
+    elif isinstance(field, serializers.RelatedField):
+        yield source, True
+    elif isinstance(field, serializers.BaseSerializer):
+        for child in field.fields.values():
+            for lookup, _ in _field_lookups(child, source + '__'):
+                yield lookup, False
+    else:
+        yield source, False
+
+
+def _is_concrete_lookup(model, lookup: str) -> bool:
+    *relations, name = lookup.split('__')
+    try:
+        for relation in relations:
+            model = model._meta.get_field(relation).related_model
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return field.concrete and not field.many_to_many
+
+
+def _many_relation(model, field: serializers.ManyRelatedField):
+    """
+    Returns ``(manager, back, lookup)`` to read a many-to-many slug or pk
+    field in one query, or None when it needs the full serializer.
+    """
+    child = field.child_relation
+    if field.source == '*' or len(field.source_attrs) != 1:
+        return None
+    try:
+        relation = model._meta.get_field(field.source)
+    except FieldDoesNotExist:
+        return None
+    if not relation.many_to_many:
+        return None
+    if isinstance(child, serializers.SlugRelatedField):
+        lookup = child.slug_field
+    elif isinstance(child, serializers.PrimaryKeyRelatedField):
+        if child.pk_field is not None:
+            return None
+        lookup = 'pk'
+    else:
+        return None
+    target = relation.related_model
+    if relation.concrete:
+        back = relation.related_query_name()
+    else:
+        back = relation.field.name
+    # The related manager of an instance uses the default manager, so
+    # its filtering and ordering carry over.
+    return target._default_manager, back, lookup
+
+
+# ``to_representation`` of these only coerces the value; calling the type
+# directly skips a method call per value.
+_COERCIONS = {
+    serializers.CharField.to_representation: str,
+    serializers.IntegerField.to_representation: int,
+}
+
+
+def _converter(field: Field):
+    """
+    Returns ``(convert, zoned)``; a zoned converter also takes the
+    timezone the response is rendered in.
+    """
+    method = type(field).to_representation
+    if method in _COERCIONS:
+        return _COERCIONS[method], False
+    if method is serializers.BigIntegerField.to_representation:
+        coerce_to_string = getattr(
+            field, 'coerce_to_string', api_settings.COERCE_BIGINT_TO_STRING
+        )
+        return (str if coerce_to_string else int), False
+    if method is serializers.ChoiceField.to_representation:
+        # ``ChoiceField`` already returns '' as is; None never gets here.
+        get = field.choice_strings_to_values.get
+        return (lambda value: get(str(value), value)), False
+    if _is_iso_datetime(field):
+        return _iso_datetime(field), True
+    return field.to_representation, False
+
+
+def _is_iso_datetime(field: Field) -> bool:
+    field_type = type(field)
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    return (
+        field_type.to_representation
+        is serializers.DateTimeField.to_representation
+        and field_type.default_timezone
+        is serializers.DateTimeField.default_timezone
+        and isinstance(output_format, str)
+        and output_format.lower() == ISO_8601
+    )
+
+
+def _iso_datetime(field: serializers.DateTimeField):
+    # ``DateTimeField.to_representation`` looks the current timezone up
+    # for every value; here it is looked up once per response. Anything
+    # but an aware datetime takes the field's own path.
+    fixed = hasattr(field, 'timezone')
+
+    def convert(value, current_timezone):
+        field_timezone = field.timezone if fixed else current_timezone
+        if field_timezone is None or getattr(value, 'tzinfo', None) is None:
+            return field.to_representation(value)
+        try:
+            value = value.astimezone(field_timezone).isoformat()
+        except OverflowError:
+            return field.to_representation(value)
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+
+    return convert
+
+
+def _current_timezone():
+    return timezone.get_current_timezone() if settings.USE_TZ else None
+
+
+def _compile_row(cls, values: dict, many: dict, columns: tuple):
+    """
+    Generates ``bind(current_timezone)``, which returns
+    ``represent_row(row, related=())`` for rows laid out as ``columns``:
+    one dict display with every lookup and conversion inlined, in the
+    serializer's field order.
+    """
+    namespace = {}
+    items = []
+    many_index = {name: index for index, name in enumerate(many)}
+    pk_index = columns.index(cls.Meta.model._meta.pk.attname) if many else 0
+    for name in cls().fields:
+        if name in many_index:
+            value = f'related[{many_index[name]}].get(row[{pk_index}], [])'
+        elif name in values:
+            lookup, field = values[name]
+            value = f'row[{columns.index(lookup)}]'
+            if field is not None:
+                converter = f'_convert_{len(namespace)}'
+                namespace[converter], zoned = _converter(field)
+                call = f'{converter}(v, tz)' if zoned else f'{converter}(v)'
+                value = f'(None if (v := {value}) is None else {call})'
+        else:
+            continue
+        items.append(f'{name!r}: {value}')
+    source = (
+        'def bind(tz):\n'
+        '    def represent_row(row, related=()):\n'
+        '        return {{{}}}\n'
+        '    return represent_row\n'
+    ).format(', '.join(items))
+    exec(compile(source, f'<{cls.__name__} row>', 'exec'), namespace)
+    return namespace['bind']
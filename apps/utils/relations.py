@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+from django.db.models import CharField, Value
+from django.db.models.functions import Cast
+
+
+class RelationResolver:
+    """
+    Maps slugs of related rows, e.g. project names or user emails, to
+    their primary keys. ``load`` looks up the slugs it hasn't seen yet in
+    one query, a UNION ALL with a branch per table, and remembers the
+    answers, missing rows included: a resolver shared by a request never
+    asks twice.
+    """
+
+    def __init__(self):
+        # (model, field) -> {slug: pk, or None when there's no such row}
+        self._known = {}
+
+    @classmethod
+    def for_request(cls, request) -> 'RelationResolver':
+        if request is None:
+            return cls()
+        resolver = getattr(request, '_relation_resolver', None)
+        if resolver is None:
+            resolver = request._relation_resolver = cls()
+        return resolver
+
+    def load(self, lookups: dict) -> None:
+        """
+        ``lookups`` maps ``(model, field)`` to the slugs to resolve; the
+        rows come from each model's default manager.
+        """
+        branches, slugs = [], []
+        for key, values in lookups.items():
+            model, field = key
+            known = self._known.setdefault(key, {})
+            missing = {
+                value
+                for value in values
+                if value is not None and value not in known
+            }
+            if not missing:
+                continue
+            for value in missing:
+                known[value] = None
+            if field == 'pk':
+                field = model._meta.pk.name
+            # Slugs come back as text, whatever the column type.
+            slugs.append((key, {str(value): value for value in missing}))
+            branches.append(
+                model._default_manager.filter(**{f'{field}__in': missing})
+                .order_by()
+                .annotate(
+                    relation=Value(len(branches)),
+                    slug=Cast(field, output_field=CharField()),
+                )
+                .values_list('relation', 'slug', 'pk')
+            )
+        if not branches:
+            return
+
+        query = branches[0]
+        if len(branches) > 1:
+            query = query.union(*branches[1:], all=True)
+        for relation, slug, pk in query:
+            key, values = slugs[relation]
+            # Case insensitive collations may match another spelling.
+            if slug in values:
+                self._known[key][values[slug]] = pk
+
+    def get(self, model, field: str, value):
+        return self._known.get((model, field), {}).get(value)
+
+    def missing(self, model, field: str, values) -> list:
+        return [
+            value for value in values if self.get(model, field, value) is None
+        ]
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import threading
+import time
+from collections import Counter
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+KEY_PREFIX = 'response-cache'
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def get_cache():
+    return caches[getattr(settings, 'RESPONSE_CACHE_ALIAS', 'default')]
+
+
+def get_stats() -> dict:
+    with _stats_lock:
+        return {'hits': _stats['hits'], 'misses': _stats['misses']}
+
+
+def reset_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def _version_key(label: str) -> str:
+    return '{}:version:{}'.format(KEY_PREFIX, label.lower())
+
+
+def invalidate(*labels: str) -> None:
+    # A fresh version token orphans every entry built on the old one.
+    get_cache().set_many(
+        {_version_key(label): time.time_ns() for label in labels},
+        timeout=None,
+    )
+
+
+def get_versions(labels) -> list:
+    cache = get_cache()
+    keys = [_version_key(label) for label in labels]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+async def aget_versions(labels) -> list:
+    cache = get_cache()
+    keys = [_version_key(label) for label in labels]
+    versions = await cache.aget_many(keys)
+    for key in keys:
+        if key not in versions:
+            await cache.aadd(key, time.time_ns(), timeout=None)
+            versions[key] = await cache.aget(key)
+    return [versions[key] for key in keys]
+
+
+def _cache_key(request: Request, versions: list) -> str:
+    params = sorted(
+        (name, value)
+        for name, values in request.query_params.lists()
+        for value in values
+    )
+    raw = repr((request.get_host(), request.path, params, versions))
+    digest = hashlib.md5(raw.encode('utf-8')).hexdigest()
+    return '{}:{}'.format(KEY_PREFIX, digest)
+
+
+def build_cache_key(request: Request, labels) -> str:
+    return _cache_key(request, get_versions(labels))
+
+
+def _etag(key: str) -> str:
+    return '"{}"'.format(key.rsplit(':', 1)[-1])
+
+
+def _cached_response(request: Request, entry, etag: str) -> Response:
+    _count('hits')
+    if etag in request.headers.get('If-None-Match', ''):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(data=entry, status=status.HTTP_200_OK)
+    response['ETag'] = etag
+    response['X-Cache'] = 'HIT'
+    return response
+
+
+def cache_response(*labels: str, skip_params=()):
+    """
+    Caches 200 responses of a read-only handler until one of the models
+    in ``labels`` changes.
+
+    Requests carrying any of ``skip_params`` are served uncached.
+    """
+
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(view, request: Request, *args, **kwargs):
+            if any(param in request.query_params for param in skip_params):
+                return handler(view, request, *args, **kwargs)
+
+            cache = get_cache()
+            key = build_cache_key(request, labels)
+            etag = _etag(key)
+            entry = cache.get(key)
+            if entry is not None:
+                return _cached_response(request, entry, etag)
+
+            _count('misses')
+            response = handler(view, request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                cache.set(key, response.data, timeout=_timeout())
+                response['ETag'] = etag
+            response['X-Cache'] = 'MISS'
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def acache_response(*labels: str, skip_params=()):
+    """
+    ``cache_response`` for async handlers; shares its cache entries.
+    """
+
+    def decorator(handler):
+        @wraps(handler)
+        async def wrapper(view, request: Request, *args, **kwargs):
+            if any(param in request.query_params for param in skip_params):
+                return await handler(view, request, *args, **kwargs)
+
+            cache = get_cache()
+            key = _cache_key(request, await aget_versions(labels))
+            etag = _etag(key)
+            entry = await cache.aget(key)
+            if entry is not None:
+                return _cached_response(request, entry, etag)
+
+            _count('misses')
+            response = await handler(view, request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                await cache.aset(key, response.data, timeout=_timeout())
+                response['ETag'] = etag
+            response['X-Cache'] = 'MISS'
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _timeout() -> int:
+    return getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 300)
+
+
+def invalidate_on_change(*models) -> None:
+    for model in models:
+        uid = '{}:{}'.format(KEY_PREFIX, model._meta.label_lower)
+        post_save.connect(_on_model_change, sender=model, dispatch_uid=uid)
+        post_delete.connect(_on_model_change, sender=model, dispatch_uid=uid)
+        for field in model._meta.local_many_to_many:
+            m2m_changed.connect(
+                _on_m2m_change,
+                sender=field.remote_field.through,
+                dispatch_uid='{}:{}'.format(uid, field.name),
+            )
+
+
+def _invalidate_on_commit(using: str, *labels: str) -> None:
+    invalidate(*labels)
+    # A concurrent read may still see the rows as they were before the
+    # commit and cache them under the new token: bump it again once the
+    # writer's transaction is committed.
+    if transaction.get_connection(using).in_atomic_block:
+        transaction.on_commit(lambda: invalidate(*labels), using=using)
+
+
+def _on_model_change(sender, using, **kwargs) -> None:
+    _invalidate_on_commit(using, sender._meta.label_lower)
+
+
+def _on_m2m_change(sender, instance, action, model, using, **kwargs) -> None:
+    if action.startswith('post_'):
+        _invalidate_on_commit(
+            using, instance._meta.label_lower, model._meta.label_lower
+        )
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from django.db import models, transaction
+from django.utils import timezone
+
+
+class SoftDeleteQuerySet(models.QuerySet):
+    def alive(self):
+        return self.filter(deleted_at__isnull=True)
+
+    def dead(self):
+        return self.filter(deleted_at__isnull=False)
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """
+    Default manager that hides soft deleted rows. Models keep a plain
+    ``all_objects`` manager for the tombstones.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().alive()
+
+
+class SoftDeleteModel(models.Model):
+    """
+    Marks rows deleted with one UPDATE; ``purge_deleted`` removes them
+    later in small batches.
+    """
+
+    deleted_fields = ('deleted_at',)
+
+    def soft_delete(self) -> None:
+        self.deleted_at = timezone.now()
+        self.save(update_fields=self.deleted_fields)
+
+    class Meta:
+        abstract = True
+
+
+def delete_in_batches(queryset, batch_size: int) -> int:
+    """
+    Deletes the rows of ``queryset`` ``batch_size`` at a time, each
+    batch in its own short transaction so no lock is held for long.
+    """
+    manager = queryset.model._base_manager
+    deleted = 0
+    while ids := list(
+        queryset.order_by().values_list('pk', flat=True)[:batch_size]
+    ):
+        with transaction.atomic():
+            manager.filter(pk__in=ids).delete()
+        deleted += len(ids)
+    return deleted
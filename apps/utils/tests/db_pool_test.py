@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+import threading
+
+from django.db import OperationalError, connections, transaction
+from django.test import SimpleTestCase
+
+from apps.utils.db_backends.sqlite3.base import DatabaseWrapper
+from apps.utils.db_pool import ConnectionPool, pools
+from apps.utils.instrumentation import registry
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class TestConnectionPool(SimpleTestCase):
+    def test_idle_connections_are_reused(self):
+        pool = ConnectionPool(size=1, max_overflow=1, timeout=1)
+        first = pool.checkout(FakeConnection)
+        pool.checkin(first)
+        self.assertIs(pool.checkout(FakeConnection), first)
+        self.assertEqual(pool.stats()['created'], 1)
+        self.assertEqual(pool.stats()['reused'], 1)
+
+    def test_overflow_is_closed_on_checkin(self):
+        pool = ConnectionPool(size=1, max_overflow=1, timeout=1)
+        first = pool.checkout(FakeConnection)
+        overflow = pool.checkout(FakeConnection)
+        pool.checkin(first)
+        pool.checkin(overflow)
+        self.assertFalse(first.closed)
+        self.assertTrue(overflow.closed)
+        self.assertEqual(pool.stats()['idle'], 1)
+        self.assertEqual(pool.stats()['checked_out'], 0)
+
+    def test_full_pool_waits_then_times_out(self):
+        pool = ConnectionPool(size=1, max_overflow=0, timeout=0.05)
+        held = pool.checkout(FakeConnection)
+        with self.assertRaises(OperationalError):
+            pool.checkout(FakeConnection)
+
+        threading.Timer(0.01, pool.checkin, [held]).start()
+        pool.timeout = 5
+        self.assertIs(pool.checkout(FakeConnection), held)
+        self.assertEqual(pool.stats()['timeouts'], 1)
+        self.assertGreaterEqual(pool.stats()['waits'], 2)
+
+    def test_unusable_and_expired_connections_are_replaced(self):
+        pool = ConnectionPool(size=2, max_overflow=0, timeout=1)
+        broken = pool.checkout(FakeConnection)
+        pool.checkin(broken, reusable=False)
+        self.assertTrue(broken.closed)
+
+        stale = pool.checkout(FakeConnection)
+        pool.checkin(stale)
+        fresh = pool.checkout(FakeConnection, is_usable=lambda conn: False)
+        self.assertIsNot(fresh, stale)
+        self.assertTrue(stale.closed)
+
+        pool.recycle = 0
+        pool.checkin(fresh)
+        self.assertTrue(fresh.closed)
+        self.assertEqual(pool.stats()['discarded'], 3)
+
+
+class TestPooledBackend(SimpleTestCase):
+    alias = 'pooled'
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.wrapper = DatabaseWrapper(
+            {
+                **connections['default'].settings_dict,
+                'NAME': os.path.join(self.tmp_dir.name, 'pooled.sqlite3'),
+                'CONN_MAX_AGE': 0,
+                'POOL': {'SIZE': 1, 'MAX_OVERFLOW': 1, 'TIMEOUT': 1},
+            },
+            self.alias,
+        )
+        connections[self.alias] = self.wrapper
+
+    def tearDown(self) -> None:
+        self.wrapper.close()
+        del connections[self.alias]
+        pools.pop(self.alias).close_idle()
+        self.tmp_dir.cleanup()
+
+    def query(self) -> int:
+        with self.wrapper.cursor() as cursor:
+            cursor.execute('SELECT 1')
+            return cursor.fetchone()[0]
+
+    def test_connections_go_back_to_the_pool(self):
+        self.assertEqual(self.query(), 1)
+        raw = self.wrapper.connection
+        # End of a request with CONN_MAX_AGE = 0.
+        self.wrapper.close_if_unusable_or_obsolete()
+        self.assertIsNone(self.wrapper.connection)
+        self.assertEqual(self.wrapper.pool.stats()['idle'], 1)
+
+        self.assertEqual(self.query(), 1)
+        self.assertIs(self.wrapper.connection, raw)
+
+        metrics = registry.render()
+        self.assertIn(
+            'db_pool_connections{alias="pooled",state="checked_out"} 1',
+            metrics,
+        )
+        self.assertIn(
+            'db_pool_events_total{alias="pooled",event="reused"} 1', metrics
+        )
+
+    def test_connection_closed_in_a_transaction_is_dropped(self):
+        with transaction.atomic(using=self.alias):
+            self.query()
+            raw = self.wrapper.connection
+            self.wrapper.close()
+        self.query()
+        self.assertIsNot(self.wrapper.connection, raw)
+        self.assertEqual(self.wrapper.pool.stats()['discarded'], 1)
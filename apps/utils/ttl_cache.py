@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from collections import Counter, OrderedDict
+
+# Every cache by name, for the metrics endpoint.
+caches = {}
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    In-process LRU cache whose entries also expire ``ttl`` seconds after
+    they were stored. Safe to share between threads; ``stats()`` reports
+    hits, misses, evictions and expirations.
+    """
+
+    def __init__(self, name: str, maxsize: int = 1024, ttl: float = 60):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.events = Counter()
+        caches[name] = self
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self.events['misses'] += 1
+                return default
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self.events['expired'] += 1
+                self.events['misses'] += 1
+                return default
+            self._entries.move_to_end(key)
+            self.events['hits'] += 1
+            return value
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.events['evictions'] += 1
+
+    def delete(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_where(self, predicate) -> int:
+        """
+        Drops the entries whose value matches ``predicate(value)``.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key, (value, _) in self._entries.items()
+                if predicate(value)
+            ]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.events['hits'] + self.events['misses']
+            return {
+                'entries': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.events['hits'],
+                'misses': self.events['misses'],
+                'evictions': self.events['evictions'],
+                'expired': self.events['expired'],
+                'hit_rate': self.events['hits'] / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Patterns and choice lookups shared by models, serializers and the bulk
+validators, compiled and derived from the choice enums once at import.
+"""
+
+import re
+from types import MappingProxyType
+
+from apps.tasks.choices.priorities import Priorities
+from apps.tasks.choices.statuses import Statuses
+from apps.users.choices.positions import Positions
+
+USERNAME_PATTERN = re.compile(r'[A-Za-z0-9_.]+')
+NAME_PATTERN = re.compile(r'[A-Za-z]+')
+
+USERNAME_ERROR = (
+    'The username must be alphanumeric characters or have only _ . symbols.'
+)
+NAME_ERROR = 'The {} must be alphabet characters.'
+
+STATUS_CHOICES = Statuses.choices()
+STATUSES = frozenset(name for name, _ in STATUS_CHOICES)
+STATUS_LABELS = MappingProxyType(dict(STATUS_CHOICES))
+DEFAULT_STATUS = Statuses.NEW.name
+CLOSED_STATUS = Statuses.CLOSED.name
+
+PRIORITY_CHOICES = Priorities.choices()
+PRIORITIES = frozenset(value for value, _ in PRIORITY_CHOICES)
+PRIORITY_LABELS = MappingProxyType(dict(PRIORITY_CHOICES))
+DEFAULT_PRIORITY = Priorities.MEDIUM[0]
+
+POSITION_CHOICES = Positions.choices()
+POSITIONS = frozenset(name for name, _ in POSITION_CHOICES)
+
+
+def name_errors(attrs: dict) -> dict:
+    """
+    Errors of the username, first_name and last_name in ``attrs``, by
+    field; the ones missing from ``attrs`` are skipped.
+    """
+    errors = {}
+    username = attrs.get('username')
+    if username is not None and not USERNAME_PATTERN.fullmatch(username):
+        errors['username'] = USERNAME_ERROR
+    for field in ('first_name', 'last_name'):
+        value = attrs.get(field)
+        if value is not None and not NAME_PATTERN.fullmatch(value):
+            errors[field] = NAME_ERROR.format(field)
+    return errors
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+from django.db import models
+from django.utils.http import parse_etags, quote_etag
+
+
+class VersionConflict(Exception):
+    """
+    The row was changed by someone else since it was read.
+    """
+
+
+class VersionedModel(models.Model):
+    """
+    Counts the updates of a row in ``version``, which also serves as its
+    ETag. ``save(check_version=True)`` only writes while the row still has
+    the version the instance was read with, in the same UPDATE, and raises
+    ``VersionConflict`` otherwise.
+    """
+
+    version = models.PositiveIntegerField(default=1, editable=False)
+
+    def save(self, *args, check_version: bool = False, **kwargs):
+        self._check_version = check_version
+        try:
+            super().save(*args, **kwargs)
+        finally:
+            del self._check_version
+
+    def _do_update(
+        self, base_qs, using, pk_val, values, update_fields, forced_update
+    ):
+        field = self._meta.get_field('version')
+        values = [value for value in values if value[0] is not field]
+        check_version = getattr(self, '_check_version', False)
+        if check_version:
+            base_qs = base_qs.filter(version=self.version)
+            values.append((field, None, self.version + 1))
+        else:
+            values.append((field, None, models.F('version') + 1))
+
+        updated = super()._do_update(
+            base_qs, using, pk_val, values, update_fields, forced_update
+        )
+        if check_version:
+            if not updated:
+                raise VersionConflict
+            self.version += 1
+        elif updated:
+            # Read back on access: another writer may have bumped it too.
+            self.__dict__.pop('version', None)
+        return updated
+
+    class Meta:
+        abstract = True
+
+
+def version_etag(instance: VersionedModel) -> str:
+    return quote_etag(str(instance.version))
+
+
+def if_match(request, instance: VersionedModel) -> bool:
+    """
+    Whether the ``If-Match`` header, if any, names the instance's version.
+    """
+    header = request.headers.get('If-Match')
+    if header is None:
+        return True
+    etags = parse_etags(header)
+    return '*' in etags or version_etag(instance) in etags